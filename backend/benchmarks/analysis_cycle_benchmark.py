@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: end-to-end analysis cycle latency of the live loop
+
+Replays a recorded transcript through the same steps /ingest runs after
+transcription - stage detection, checklist scheduling, analyze_cycle_async
+(checklist + client card + one validation pass) - and reports wall time per
+cycle and LLM requests per cycle. Whisper is not involved.
+
+Point the analyzer at the local stand-in to run offline and without model
+noise; with `--latency fixed:0` on the mock, the cycle time is the
+orchestration overhead alone:
+
+    python benchmarks/mock_openrouter_server.py --port 8081 --latency fixed:0 &
+    OPENROUTER_API_URL=http://127.0.0.1:8081/api/v1/chat/completions \
+        python benchmarks/analysis_cycle_benchmark.py recording.json
+
+The recording uses the same format as relevance_prefilter_benchmark.py
+({"segments": [...]}).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from call_structure_config import detect_stage_by_context_async
+from trial_class_analyzer import TrialClassAnalyzer
+from utils.checklist_scheduler import ChecklistScheduler
+from utils.llm_usage import get_llm_usage_meter
+from utils.relevance_index import ChecklistRelevanceIndex
+
+CHECKLIST_WINDOW_CHARS = 1500
+CLIENT_WINDOW_CHARS = 1000
+STAGE_WINDOW_CHARS = 2000
+
+
+async def replay(segments: List[str], segments_per_cycle: int, seconds_per_cycle: int) -> List[Dict]:
+    """
+    Run every cycle of one recording
+
+    Returns:
+        Per cycle: {seconds, stage_seconds, requests, items}
+    """
+    analyzer = TrialClassAnalyzer()
+    call_structure = analyzer.call_structure
+    scheduler = ChecklistScheduler(relevance_index=ChecklistRelevanceIndex(call_structure))
+    meter = get_llm_usage_meter()
+
+    progress: Dict[str, bool] = {}
+    client_card: Dict[str, str] = {}
+    stage_id = call_structure[0]['id']
+    transcript = ""
+    cycles = []
+
+    try:
+        for cycle, start in enumerate(range(0, len(segments), segments_per_cycle)):
+            chunk = segments[start:start + segments_per_cycle]
+            text = " ".join(s.strip() for s in chunk)
+            transcript = f"{transcript} {text}".strip()
+            scheduler.record_transcript(text, len(chunk))
+            elapsed = (cycle + 1) * seconds_per_cycle
+            requests_before = meter.totals["requests"]
+
+            started = time.perf_counter()
+            stage_id = await detect_stage_by_context_async(
+                conversation_text=transcript[-STAGE_WINDOW_CHARS:],
+                elapsed_seconds=elapsed,
+                analyzer=analyzer,
+                previous_stage_id=stage_id,
+                min_confidence=0.6
+            )
+            stage_seconds = time.perf_counter() - started
+
+            items = scheduler.select_items(call_structure, progress, stage_id, elapsed,
+                                           budget_level=meter.budget_level())
+            results, client_updates = await analyzer.analyze_cycle_async(
+                items, transcript[-CHECKLIST_WINDOW_CHARS:], transcript[-CLIENT_WINDOW_CHARS:], client_card
+            )
+            seconds = time.perf_counter() - started
+
+            scheduler.mark_evaluated(results)
+            for item_id, (completed, *_rest) in results.items():
+                if completed:
+                    progress[item_id] = True
+            for field_id, update in client_updates.items():
+                client_card[field_id] = update.get('value', '')
+
+            cycles.append({
+                "seconds": seconds,
+                "stage_seconds": stage_seconds,
+                "requests": meter.totals["requests"] - requests_before,
+                "items": len(items)
+            })
+    finally:
+        await analyzer.aclose()
+
+    return cycles
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark analysis cycle latency (stage + checklist + client card)")
+    parser.add_argument("transcripts", nargs="+", help="Recorded transcript JSON files ({\"segments\": [...]})")
+    parser.add_argument("--segments-per-cycle", type=int, default=3, help="Whisper segments per analysis cycle")
+    parser.add_argument("--seconds-per-cycle", type=int, default=15, help="Simulated call time per cycle")
+    args = parser.parse_args()
+
+    cycles = []
+    for path in args.transcripts:
+        with open(path, "r", encoding="utf-8") as f:
+            segments = json.load(f)["segments"]
+        cycles.extend(asyncio.run(replay(segments, args.segments_per_cycle, args.seconds_per_cycle)))
+
+    if not cycles:
+        print("❌ No cycles replayed")
+        sys.exit(1)
+
+    seconds = [c["seconds"] for c in cycles]
+    stage_seconds = [c["stage_seconds"] for c in cycles]
+    print(f"📊 Analysis cycles: {len(cycles)} from {len(args.transcripts)} recording(s)")
+    print(f"   target: {os.getenv('OPENROUTER_API_URL', 'https://openrouter.ai/api/v1/chat/completions')}")
+    print(f"   {'':>14} | {'p50':>8} | {'p90':>8} | {'max':>8}")
+    for label, values in (("cycle", seconds), ("stage detect", stage_seconds)):
+        print(f"   {label:>14} | {percentile(values, 0.5) * 1000:>6.0f}ms | "
+              f"{percentile(values, 0.9) * 1000:>6.0f}ms | {max(values) * 1000:>6.0f}ms")
+    print(f"   LLM requests per cycle: {statistics.mean(c['requests'] for c in cycles):.2f} "
+          f"(items per cycle: {statistics.mean(c['items'] for c in cycles):.1f})")
+    print(f"   Usage: {json.dumps(get_llm_usage_meter().stats()['totals'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cross-session batched Whisper inference vs one-at-a-time
+
+Treats every given recording as one live session's ready buffer (what
+/ingest hands to the transcriber every ~10s) and transcribes them:
+- one-at-a-time: RealtimeTranscriber.transcribe_array per buffer
+  (the default, one buffer per Whisper call)
+- batched: RealtimeTranscriber.transcribe_batch over groups of
+  --batch-size buffers (what TranscriptionBatcher does with concurrent
+  sessions)
+
+and reports throughput in audio-seconds per CPU-second and per wall
+second. CPU time is process CPU time, so run it on an otherwise idle node.
+
+Usage (from backend/):
+    python benchmarks/batched_transcription_benchmark.py buffers/*.webm
+    python benchmarks/batched_transcription_benchmark.py --batch-size 2 4 8 --repeat 3 buffers/*.webm
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.realtime_transcriber import SAMPLE_RATE, WHISPER_CHUNK_SECONDS, RealtimeTranscriber
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Total wall and process CPU seconds of `repeat` calls"""
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return {"wall": time.perf_counter() - wall_started, "cpu": time.process_time() - cpu_started}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched vs one-at-a-time Whisper transcription")
+    parser.add_argument("buffers", nargs="+", help="Recorded audio buffers (WebM, WAV or raw PCM Int16 16kHz), one per session")
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[2, 4, 8], help="Batch sizes to compare")
+    parser.add_argument("--repeat", type=int, default=2, help="Passes over all buffers per mode")
+    parser.add_argument("--language", default="id")
+    parser.add_argument("--model-size", default=os.getenv("WHISPER_MODEL_SIZE", "base"))
+    args = parser.parse_args()
+
+    transcriber = RealtimeTranscriber(model_size=args.model_size)
+    transcriber.warm_up(language=args.language)
+
+    audios = []
+    for path in args.buffers:
+        with open(path, "rb") as f:
+            audio = transcriber.decode_to_array(f.read())
+        if len(audio) > WHISPER_CHUNK_SECONDS * SAMPLE_RATE:
+            audio = audio[:WHISPER_CHUNK_SECONDS * SAMPLE_RATE]
+        audios.append(audio)
+    audio_seconds = sum(len(a) for a in audios) / SAMPLE_RATE
+    print(f"🎵 {len(audios)} buffers, {audio_seconds:.1f}s of audio, model {args.model_size}")
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    # Untimed warm-up of the batched pipeline as well
+    transcriber.transcribe_batch(audios[:2], language=args.language)
+
+    results["one-at-a-time"] = measure(
+        lambda: [transcriber.transcribe_array(a, language=args.language) for a in audios], args.repeat
+    )
+    for batch_size in args.batch_size:
+        groups: List[List] = [audios[i:i + batch_size] for i in range(0, len(audios), batch_size)]
+        results[f"batched ×{batch_size}"] = measure(
+            lambda: [transcriber.transcribe_batch(g, language=args.language) for g in groups], args.repeat
+        )
+
+    baseline = audio_seconds * args.repeat / results["one-at-a-time"]["cpu"]
+    print(f"\n📊 Throughput over {args.repeat} pass(es)")
+    print(f"   {'mode':<14} | {'audio s / CPU s':>15} | {'audio s / wall s':>16} | {'vs one-at-a-time':>16}")
+    for label, r in results.items():
+        per_cpu = audio_seconds * args.repeat / r["cpu"]
+        per_wall = audio_seconds * args.repeat / r["wall"]
+        print(f"   {label:<14} | {per_cpu:>15.2f} | {per_wall:>16.2f} | {per_cpu / baseline:>15.2f}×")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for OpenRouter's /api/v1/chat/completions
+
+Serves deterministic, rule-based JSON answers for every prompt type
+TrialClassAnalyzer emits, with configurable latency distributions and
+error rates, so the /ingest pipeline can be load-tested and benchmarked
+offline (no OPENROUTER_API_KEY, no model latency noise).
+
+Prompt types are recognised from the system prompt:
+- checklist / batch_checklist:  completed if a conversation sentence shares
+                                enough content words with the action
+- validation / batch_validation / client_field_validation:
+                                valid if the evidence has enough words
+- client_card:                  a few regex patterns (child name, interests, ...)
+- stage:                        the stage whose recommended window contains
+                                the elapsed time
+
+Both plain and streamed (SSE, "stream": true) requests are supported, and
+every response reports OpenRouter-style `usage` (estimated tokens).
+
+Latency distributions:
+    fixed:MS                 e.g. fixed:0 to measure pure orchestration overhead
+    uniform:MIN_MS:MAX_MS
+    lognormal:MEDIAN_MS:SIGMA
+
+Canned answers (--canned) override the rules per prompt type:
+    {"stage": {"stage_id": "...", "confidence": 0.9, "reasoning": "..."}, ...}
+
+Usage (from backend/):
+    python benchmarks/mock_openrouter_server.py --port 8081 --latency lognormal:600:0.4 --error-rate 0.02
+    OPENROUTER_API_URL=http://localhost:8081/api/v1/chat/completions python main_trial_class.py
+
+GET /stats returns request, error and latency counters per prompt type.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from call_structure_config import get_default_call_structure
+from utils.relevance_index import tokenize
+
+PROMPT_TYPES = [
+    "checklist",
+    "batch_checklist",
+    "validation",
+    "batch_validation",
+    "client_card",
+    "client_field_validation",
+    "stage"
+]
+
+# Client card rules: field_id → pattern whose first group is the value
+CLIENT_CARD_PATTERNS = {
+    "child_name": r"(?:nama anak(?:nya)?|anaknya bernama|nama(?:nya)?)\s+(?:adalah\s+)?([A-Z][a-z]+)",
+    "child_interests": r"suka\s+(?:main\s+)?([\w ]{3,40}?)(?:[.,!?]|$)",
+    "child_experience": r"(?:pernah|sudah)\s+belajar\s+([\w ]{3,40}?)(?:[.,!?]|$)",
+    "parent_goal": r"(?:pengen|ingin|mau)\s+anak(?:nya)?\s+([\w ]{3,60}?)(?:[.,!?]|$)",
+    "budget_constraint": r"((?:terlalu\s+)?mahal[\w ]{0,40}?)(?:[.,!?]|$)",
+    "schedule_constraint": r"(?:jadwal|waktu)(?:nya)?\s+([\w ]{3,40}?)(?:[.,!?]|$)"
+}
+
+
+def parse_latency(spec: str):
+    """
+    Parse a latency distribution spec into a sampler
+
+    Returns:
+        Zero-argument function returning a latency in seconds
+    """
+    kind, *params = spec.split(":")
+    values = [float(p) for p in params]
+    if kind == "fixed" and len(values) == 1:
+        return lambda: values[0] / 1000
+    if kind == "uniform" and len(values) == 2:
+        return lambda: random.uniform(values[0], values[1]) / 1000
+    if kind == "lognormal" and len(values) == 2:
+        median, sigma = values
+        return lambda: random.lognormvariate(math.log(max(median, 1e-3)), sigma) / 1000
+    raise ValueError(f"Invalid latency spec '{spec}' (fixed:MS | uniform:MIN:MAX | lognormal:MEDIAN:SIGMA)")
+
+
+def classify_prompt(system_prompt: str, user_prompt: str) -> str:
+    """Recognise which TrialClassAnalyzer prompt a request carries"""
+    if "to determine the current stage" in system_prompt:
+        return "stage"
+    if "to extract client information" in system_prompt:
+        return "client_card"
+    if "validator for client information extraction" in system_prompt:
+        return "client_field_validation"
+    if "evidence validator for a sales call analysis" in system_prompt:
+        return "batch_validation"
+    if "evidence validator for a sales call checklist" in system_prompt:
+        return "validation"
+    if "Actions to check:" in user_prompt:
+        return "batch_checklist"
+    return "checklist"
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if s.strip()]
+
+
+def section_after(text: str, header: str) -> str:
+    """Text following a prompt header line (e.g. "Recent conversation (Bahasa Indonesia):")"""
+    index = text.find(header)
+    return text[index + len(header):].strip() if index >= 0 else ""
+
+
+class MockOpenRouter:
+    """Rule-based answers plus latency / error injection"""
+
+    def __init__(
+        self,
+        latency: Dict[str, object],
+        error_rate: float = 0.0,
+        error_statuses: Tuple[int, ...] = (503,),
+        timeout_rate: float = 0.0,
+        ttft_fraction: float = 0.3,
+        match_min_overlap: int = 2,
+        valid_min_words: int = 3,
+        canned: Optional[Dict] = None
+    ):
+        """
+        Initialize mock
+
+        Args:
+            latency: Prompt type (or "default") → latency sampler
+            error_rate: Fraction of requests answered with an HTTP error
+            error_statuses: Statuses to pick from for injected errors
+            timeout_rate: Fraction of requests that never answer in time (hang 120s)
+            ttft_fraction: Share of the latency spent before the first streamed token
+            match_min_overlap: Content words an action must share with a sentence to be "completed"
+            valid_min_words: Evidence words needed for a validation to pass
+            canned: Prompt type → fixed JSON answer
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.timeout_rate = timeout_rate
+        self.ttft_fraction = ttft_fraction
+        self.match_min_overlap = match_min_overlap
+        self.valid_min_words = valid_min_words
+        self.canned = canned or {}
+
+        self.stage_ids = {stage['name']: stage['id'] for stage in get_default_call_structure()}
+        self.stats: Dict[str, Dict] = {}
+
+    def _stats_for(self, prompt_type: str) -> Dict:
+        return self.stats.setdefault(prompt_type, {
+            "requests": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "injected_latency_seconds": 0.0
+        })
+
+    def sample_latency(self, prompt_type: str) -> float:
+        sampler = self.latency.get(prompt_type) or self.latency["default"]
+        return sampler()
+
+    # ===== Rule-based answers =====
+
+    def answer(self, prompt_type: str, system_prompt: str, user_prompt: str) -> Dict:
+        """JSON answer for one prompt"""
+        if prompt_type in self.canned:
+            return self.canned[prompt_type]
+        if prompt_type == "checklist":
+            action = re.search(r'TASK: Check if this action was completed:\nAction: "(.*)"', system_prompt)
+            conversation = section_after(user_prompt, "Recent conversation (Bahasa Indonesia):")
+            return self._checklist_verdict(action.group(1) if action else "", conversation)
+        if prompt_type == "batch_checklist":
+            conversation = section_after(user_prompt, "Recent conversation (Bahasa Indonesia):")
+            actions = re.findall(r'- id: (\S+)\n\s+type: \S+\n\s+action: "(.*)"', user_prompt)
+            return {"items": [
+                {"id": item_id, **self._checklist_verdict(action, conversation)}
+                for item_id, action in actions
+            ]}
+        if prompt_type in ("validation", "client_field_validation"):
+            evidence = re.search(r'PROVIDED EVIDENCE:\s*"(.*?)"\s*(?:\n|$)', user_prompt, re.DOTALL)
+            return self._validation_verdict(evidence.group(1) if evidence else "")
+        if prompt_type == "batch_validation":
+            blocks = re.findall(r'- key: (\S+)\n(?:.*\n)*?\s+provided evidence: "(.*)"', user_prompt)
+            return {"results": [
+                {"key": key, **self._validation_verdict(evidence)}
+                for key, evidence in blocks
+            ]}
+        if prompt_type == "client_card":
+            field_ids = re.findall(r"^- (\w+) \(", system_prompt, re.MULTILINE)
+            return self._client_card_fields(field_ids, section_after(user_prompt, "Conversation (Bahasa Indonesia):"))
+        return self._stage_verdict(system_prompt, user_prompt)
+
+    def _checklist_verdict(self, action: str, conversation: str) -> Dict:
+        action_tokens = set(tokenize(action))
+        best_sentence, best_overlap = "", 0
+        for sentence in split_sentences(conversation):
+            overlap = len(action_tokens & set(tokenize(sentence)))
+            if overlap > best_overlap:
+                best_sentence, best_overlap = sentence, overlap
+
+        completed = best_overlap >= self.match_min_overlap
+        return {
+            "completed": completed,
+            "confidence": round(min(0.95, 0.5 + 0.15 * best_overlap), 2) if completed else 0.2,
+            "evidence": best_sentence if completed else "",
+            "reasoning": f"mock: {best_overlap} shared content words"
+        }
+
+    def _validation_verdict(self, evidence: str) -> Dict:
+        words = len(evidence.split())
+        return {
+            "is_valid": words >= self.valid_min_words,
+            "explanation": f"mock: evidence has {words} words"
+        }
+
+    def _client_card_fields(self, field_ids: List[str], conversation: str) -> Dict:
+        fields = {}
+        for field_id in field_ids:
+            pattern = CLIENT_CARD_PATTERNS.get(field_id)
+            match = re.search(pattern, conversation, re.IGNORECASE) if pattern else None
+            if not match:
+                continue
+            sentence = next((s for s in split_sentences(conversation) if match.group(0) in s), match.group(0))
+            fields[field_id] = {
+                "value": match.group(1).strip(),
+                "evidence": sentence,
+                "confidence": 0.9
+            }
+        return fields
+
+    def _stage_verdict(self, system_prompt: str, user_prompt: str) -> Dict:
+        elapsed = re.search(r"(\d+) minutes (\d+) seconds", user_prompt)
+        elapsed_minutes = int(elapsed.group(1)) + int(elapsed.group(2)) / 60 if elapsed else 0.0
+
+        windows = re.findall(r"\*\*(.+?)\*\* \((?:stage_id: [^,]+, )?recommended: (\d+)-(\d+) min\)", system_prompt)
+        chosen = windows[-1][0] if windows else ""
+        for name, start, end in windows:
+            if int(start) <= elapsed_minutes < int(end):
+                chosen = name
+                break
+
+        return {
+            "stage_id": self.stage_ids.get(chosen, ""),
+            "confidence": 0.8,
+            "reasoning": f"mock: {elapsed_minutes:.1f} min falls in '{chosen}'"
+        }
+
+
+def estimate_usage(messages: List[Dict], content: str) -> Dict:
+    """OpenRouter-style usage with ~4 chars per token"""
+    prompt_chars = sum(len(m.get("content", "")) for m in messages)
+    prompt_tokens = max(1, prompt_chars // 4)
+    completion_tokens = max(1, len(content) // 4)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "cost": 0.0,
+        "prompt_tokens_details": {"cached_tokens": 0}
+    }
+
+
+def create_app(mock: MockOpenRouter) -> FastAPI:
+    """FastAPI app serving the mock endpoint"""
+    app = FastAPI()
+
+    @app.post("/api/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        messages = payload.get("messages", [])
+        system_prompt = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        user_prompt = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+
+        prompt_type = classify_prompt(system_prompt, user_prompt)
+        stats = mock._stats_for(prompt_type)
+        stats["requests"] += 1
+
+        latency = mock.sample_latency(prompt_type)
+        stats["injected_latency_seconds"] += latency
+
+        roll = random.random()
+        if roll < mock.timeout_rate:
+            stats["timeouts"] += 1
+            await asyncio.sleep(120)
+        if roll < mock.timeout_rate + mock.error_rate:
+            stats["errors"] += 1
+            await asyncio.sleep(latency)
+            status = random.choice(mock.error_statuses)
+            return JSONResponse({"error": {"code": status, "message": "mock: injected error"}}, status_code=status)
+
+        content = json.dumps(mock.answer(prompt_type, system_prompt, user_prompt), ensure_ascii=False)
+        usage = estimate_usage(messages, content)
+        completion_id = f"mock-{time.time_ns()}"
+
+        if not payload.get("stream"):
+            await asyncio.sleep(latency)
+            return {
+                "id": completion_id,
+                "model": payload.get("model"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage
+            }
+
+        async def events():
+            # Time to first token, then the rest of the latency spread over ~8-char deltas
+            pieces = [content[i:i + 8] for i in range(0, len(content), 8)]
+            await asyncio.sleep(latency * mock.ttft_fraction)
+            yield ": OPENROUTER PROCESSING\n\n"
+            per_piece = latency * (1 - mock.ttft_fraction) / max(1, len(pieces))
+            for piece in pieces:
+                chunk = {"id": completion_id, "choices": [{"index": 0, "delta": {"content": piece}}]}
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+                await asyncio.sleep(per_piece)
+            final = {"id": completion_id, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}], "usage": usage}
+            yield f"data: {json.dumps(final)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stats")
+    async def get_stats():
+        return {
+            prompt_type: {**stats, "injected_latency_seconds": round(stats["injected_latency_seconds"], 3)}
+            for prompt_type, stats in mock.stats.items()
+        }
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenRouter stand-in for TrialClassAnalyzer")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", default="lognormal:600:0.4", help="Default latency distribution")
+    parser.add_argument("--latency-for", action="append", default=[], metavar="TYPE=SPEC",
+                        help=f"Per prompt type latency, TYPE in {', '.join(PROMPT_TYPES)} (repeatable)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an HTTP error")
+    parser.add_argument("--error-status", default="503", help="Comma-separated statuses for injected errors")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of requests that hang past the client timeout")
+    parser.add_argument("--ttft-fraction", type=float, default=0.3, help="Share of latency before the first streamed token")
+    parser.add_argument("--match-min-overlap", type=int, default=2, help="Shared content words for a checklist item to count as done")
+    parser.add_argument("--valid-min-words", type=int, default=3, help="Evidence words for a validation to pass")
+    parser.add_argument("--canned", help="JSON file with fixed answers per prompt type")
+    parser.add_argument("--seed", type=int, help="Random seed (latency and error injection)")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    latency = {"default": parse_latency(args.latency)}
+    for entry in args.latency_for:
+        prompt_type, _, spec = entry.partition("=")
+        if prompt_type not in PROMPT_TYPES:
+            parser.error(f"Unknown prompt type '{prompt_type}'")
+        latency[prompt_type] = parse_latency(spec)
+
+    canned = None
+    if args.canned:
+        with open(args.canned, "r", encoding="utf-8") as f:
+            canned = json.load(f)
+
+    mock = MockOpenRouter(
+        latency=latency,
+        error_rate=args.error_rate,
+        error_statuses=tuple(int(s) for s in args.error_status.split(",")),
+        timeout_rate=args.timeout_rate,
+        ttft_fraction=args.ttft_fraction,
+        match_min_overlap=args.match_min_overlap,
+        valid_min_words=args.valid_min_words,
+        canned=canned
+    )
+
+    print(f"🧪 Mock OpenRouter on http://{args.host}:{args.port}/api/v1/chat/completions")
+    print(f"   latency={args.latency} error_rate={args.error_rate} timeout_rate={args.timeout_rate}")
+
+    import uvicorn
+    uvicorn.run(create_app(mock), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
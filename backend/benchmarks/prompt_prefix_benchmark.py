@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark: prompt layout vs. provider-side prefix caching
+
+Sends the analyzer's checklist and client card prompts to OpenRouter in
+two layouts and reports input tokens, cached input tokens and
+time-to-first-token (streamed) for each:
+
+- interleaved: one user message with the per-call content (transcript,
+  evidence) ahead of the static instructions - the layout the prompts
+  had before they were split
+- prefix:      static system message first, per-call content last (what
+  TrialClassAnalyzer sends now)
+
+Each cycle uses a new transcript window (like the live loop), so the
+response cache does not apply; only the provider's prefix cache can help.
+Makes real API calls: requires OPENROUTER_API_KEY.
+
+Usage (from backend/):
+    python benchmarks/prompt_prefix_benchmark.py recording.json
+    python benchmarks/prompt_prefix_benchmark.py --cycles 10 --items 4 recording.json
+
+The recording uses the same format as relevance_prefilter_benchmark.py
+({"segments": [...]}).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trial_class_analyzer import TrialClassAnalyzer
+
+CHECKLIST_WINDOW_CHARS = 1500
+CLIENT_WINDOW_CHARS = 1000
+
+
+def layout_messages(layout: str, system_prompt: str, prompt: str) -> List[Dict]:
+    """Chat messages for a prompt pair in the given layout"""
+    if layout == "prefix":
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+    return [{"role": "user", "content": f"{prompt}\n{system_prompt}"}]
+
+
+def stream_completion(session: requests.Session, analyzer: TrialClassAnalyzer, messages: List[Dict], max_tokens: int) -> Dict:
+    """
+    Stream one completion and measure it
+
+    Returns:
+        {ttft, total, prompt_tokens, cached_tokens}
+    """
+    payload = {
+        "model": analyzer.model,
+        "messages": messages,
+        "temperature": 0.2,
+        "max_tokens": max_tokens,
+        "stream": True,
+        "usage": {"include": True}
+    }
+
+    started = time.perf_counter()
+    ttft = None
+    usage = {}
+    with session.post(analyzer.api_url, json=payload, stream=True, timeout=60) as response:
+        response.raise_for_status()
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data: "):
+                continue
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                break
+            chunk = json.loads(data)
+            if ttft is None and any(c.get("delta", {}).get("content") for c in chunk.get("choices", [])):
+                ttft = time.perf_counter() - started
+            if chunk.get("usage"):
+                usage = chunk["usage"]
+
+    return {
+        "ttft": ttft if ttft is not None else time.perf_counter() - started,
+        "total": time.perf_counter() - started,
+        "prompt_tokens": usage.get("prompt_tokens", 0),
+        "cached_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+    }
+
+
+def build_requests(analyzer: TrialClassAnalyzer, transcript: str, items: List[Dict]) -> List[tuple]:
+    """(label, system_prompt, prompt, max_tokens) for one analysis cycle"""
+    checklist_text = transcript[-CHECKLIST_WINDOW_CHARS:]
+    prompts = []
+    for item in items:
+        system_prompt, prompt = analyzer._build_checklist_prompt(item, checklist_text)
+        prompts.append(("checklist_item", system_prompt, prompt, 200))
+    system_prompt, prompt = analyzer._build_client_card_prompt(transcript[-CLIENT_WINDOW_CHARS:])
+    prompts.append(("client_card", system_prompt, prompt, 800))
+    return prompts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark prompt layout vs. prefix caching")
+    parser.add_argument("transcript", help="Recorded transcript JSON ({\"segments\": [...]})")
+    parser.add_argument("--cycles", type=int, default=6, help="Analysis cycles to replay per layout")
+    parser.add_argument("--items", type=int, default=3, help="Checklist items checked per cycle")
+    parser.add_argument("--segments-per-cycle", type=int, default=3, help="Whisper segments per analysis cycle")
+    args = parser.parse_args()
+
+    if not os.getenv("OPENROUTER_API_KEY"):
+        print("❌ OPENROUTER_API_KEY is not set")
+        sys.exit(1)
+
+    with open(args.transcript, "r", encoding="utf-8") as f:
+        segments = json.load(f)["segments"]
+
+    analyzer = TrialClassAnalyzer()
+    items = [item for stage in analyzer.call_structure for item in stage['items']][:args.items]
+
+    session = requests.Session()
+    session.headers.update(analyzer._llm_headers())
+
+    print(f"📊 Prompt layout benchmark: {args.cycles} cycles × ({len(items)} checklist items + client card), model {analyzer.model}")
+
+    for layout in ("interleaved", "prefix"):
+        measurements: Dict[str, List[Dict]] = {}
+        transcript = ""
+        for cycle in range(args.cycles):
+            chunk = segments[cycle * args.segments_per_cycle:(cycle + 1) * args.segments_per_cycle]
+            if not chunk:
+                break
+            transcript = f"{transcript} {' '.join(s.strip() for s in chunk)}".strip()
+
+            for label, system_prompt, prompt, max_tokens in build_requests(analyzer, transcript, items):
+                try:
+                    result = stream_completion(session, analyzer, layout_messages(layout, system_prompt, prompt), max_tokens)
+                except requests.exceptions.RequestException as e:
+                    print(f"   ⚠️ {layout}/{label} request failed: {e}")
+                    continue
+                measurements.setdefault(label, []).append(result)
+
+        print(f"\n   Layout: {layout}")
+        print(f"   {'prompt':>15} | {'calls':>5} | {'input tok':>9} | {'cached tok':>10} | {'ttft p50':>8} | {'ttft mean':>9}")
+        for label, results in measurements.items():
+            ttfts = [r["ttft"] for r in results]
+            print(f"   {label:>15} | {len(results):>5} | "
+                  f"{statistics.mean(r['prompt_tokens'] for r in results):>9.0f} | "
+                  f"{statistics.mean(r['cached_tokens'] for r in results):>10.0f} | "
+                  f"{statistics.median(ttfts) * 1000:>6.0f}ms | {statistics.mean(ttfts) * 1000:>7.0f}ms")
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark: lexical relevance pre-filter for checklist checks
+
+Replays recorded transcripts through the checklist scheduler with and
+without the BM25 relevance index and reports, per threshold:
+- how many item checks / LLM calls the pre-filter avoids per call
+- how much recall drops (labeled items that never reach the LLM while
+  their evidence is in the checklist window)
+
+The LLM is simulated as a perfect judge: an item is completed the first
+time it is sent while its labeled evidence is inside the window the live
+loop would send (last 1500 chars). No API calls are made.
+
+Transcript file format (JSON):
+    {
+        "segments": ["Whisper segment text", ...],
+        "completed_items": {"<item_id>": "<evidence quote or null>", ...}
+    }
+A null evidence quote means "completed somewhere in the call": the item
+counts as found the first time it is sent at all.
+
+Usage (from backend/):
+    python benchmarks/relevance_prefilter_benchmark.py recordings/*.json
+    python benchmarks/relevance_prefilter_benchmark.py --thresholds 1,2,3 call.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from call_structure_config import get_default_call_structure
+from utils.checklist_scheduler import ChecklistScheduler
+from utils.relevance_index import ChecklistRelevanceIndex
+
+CHECKLIST_WINDOW_CHARS = 1500  # Same window the /ingest loop sends
+
+
+def replay(
+    segments: List[str],
+    labels: Dict[str, str],
+    call_structure: List[Dict],
+    segments_per_cycle: int,
+    relevance_index: ChecklistRelevanceIndex = None
+) -> Dict:
+    """
+    Replay one transcript through the scheduler with a simulated perfect LLM
+
+    Returns:
+        Counters: item_checks, llm_calls (batched), found (labeled items completed), scoring_seconds
+    """
+    scheduler = ChecklistScheduler(relevance_index=relevance_index)
+    progress: Dict[str, bool] = {}
+    transcript = ""
+    item_checks = 0
+    llm_calls = 0
+    scoring_seconds = 0.0
+
+    for start in range(0, len(segments), segments_per_cycle):
+        chunk = segments[start:start + segments_per_cycle]
+        text = " ".join(s.strip() for s in chunk)
+        transcript = f"{transcript} {text}".strip()
+        scheduler.record_transcript(text, len(chunk))
+
+        started = time.perf_counter()
+        pending = scheduler.select_items(call_structure, progress)
+        scoring_seconds += time.perf_counter() - started
+        if not pending:
+            continue
+
+        item_checks += len(pending)
+        llm_calls += 1
+        window = transcript[-CHECKLIST_WINDOW_CHARS:].lower()
+
+        results = {}
+        for item in pending:
+            completed = False
+            if item['id'] in labels:
+                quote = labels[item['id']]
+                completed = quote is None or quote.lower() in window
+            if completed:
+                progress[item['id']] = True
+            results[item['id']] = (completed, 1.0 if completed else 0.0, "", {"stage": "simulated"})
+        scheduler.mark_evaluated(results)
+
+    return {
+        "item_checks": item_checks,
+        "llm_calls": llm_calls,
+        "found": sum(1 for item_id in labels if progress.get(item_id)),
+        "scoring_seconds": scoring_seconds
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the checklist relevance pre-filter")
+    parser.add_argument("transcripts", nargs="+", help="Recorded transcript JSON files")
+    parser.add_argument("--thresholds", default="0.5,1,2,3,4", help="Comma-separated BM25 min scores")
+    parser.add_argument("--segments-per-cycle", type=int, default=3, help="Whisper segments per analysis cycle")
+    args = parser.parse_args()
+
+    call_structure = get_default_call_structure()
+    thresholds = [float(t) for t in args.thresholds.split(",")]
+
+    recordings = []
+    for path in args.transcripts:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        recordings.append((os.path.basename(path), data["segments"], data.get("completed_items", {})))
+
+    print(f"📊 Relevance pre-filter benchmark: {len(recordings)} transcripts, "
+          f"{args.segments_per_cycle} segments/cycle")
+
+    baselines = [
+        replay(segments, labels, call_structure, args.segments_per_cycle)
+        for _, segments, labels in recordings
+    ]
+    base_checks = sum(b["item_checks"] for b in baselines)
+    base_calls = sum(b["llm_calls"] for b in baselines)
+    base_found = sum(b["found"] for b in baselines)
+    print(f"\n   Baseline (no pre-filter): {base_checks / len(recordings):.1f} item checks/call, "
+          f"{base_calls / len(recordings):.1f} batched LLM calls/call, {base_found} labeled items found")
+
+    print(f"\n   {'min_score':>9} | {'checks/call':>11} | {'avoided':>8} | {'calls/call':>10} | {'recall':>7} | {'scoring':>9}")
+    print(f"   {'-' * 9}-+-{'-' * 11}-+-{'-' * 8}-+-{'-' * 10}-+-{'-' * 7}-+-{'-' * 9}")
+    for threshold in thresholds:
+        index = ChecklistRelevanceIndex(call_structure, min_score=threshold)
+        runs = [
+            replay(segments, labels, call_structure, args.segments_per_cycle, index)
+            for _, segments, labels in recordings
+        ]
+        checks = sum(r["item_checks"] for r in runs)
+        calls = sum(r["llm_calls"] for r in runs)
+        found = sum(r["found"] for r in runs)
+        scoring_us = 1e6 * sum(r["scoring_seconds"] for r in runs) / max(1, sum(r["llm_calls"] for r in baselines))
+        avoided = 1 - checks / base_checks if base_checks else 0.0
+        recall = found / base_found if base_found else 1.0
+        print(f"   {threshold:>9.2f} | {checks / len(recordings):>11.1f} | {avoided:>7.1%} | "
+              f"{calls / len(recordings):>10.1f} | {recall:>6.1%} | {scoring_us:>6.0f} µs")
+
+    print("\n   avoided = item checks not sent to the LLM; recall = labeled items still found vs baseline")
+    print("   scoring = pre-filter time per analysis cycle")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sliding-window streaming transcription vs fixed 10s batches
+
+Replays recorded call audio in simulated real time through both
+transcription modes of /ingest and reports:
+- word latency: time from the end of a spoken word until its text is
+  emitted to the analysis stage (audio arrival + Whisper compute time;
+  Whisper processes one request at a time, as in the live loop)
+- WER against a reference transcript, if one is given
+
+Batch mode transcribes each 10s buffer on its own (current default);
+streaming mode re-transcribes the window every hop and commits words via
+the local-agreement stitcher.
+
+Usage (from backend/):
+    python benchmarks/streaming_transcription_benchmark.py call.webm --reference call.txt
+    python benchmarks/streaming_transcription_benchmark.py call.wav --hop 1.0 --window 12
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.realtime_transcriber import RealtimeTranscriber
+from utils.streaming_transcriber import SAMPLE_RATE, StreamingTranscriber, normalize_word
+
+BATCH_SECONDS = 10.0
+
+
+def word_error_rate(reference: List[str], hypothesis: List[str]) -> float:
+    """Word-level Levenshtein distance / reference length"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            ))
+        previous = current
+    return previous[-1] / max(1, len(reference))
+
+
+def replay_batch(transcriber: RealtimeTranscriber, audio, language: str) -> Dict:
+    """Fixed buffers, each transcribed alone once it is complete"""
+    duration = len(audio) / SAMPLE_RATE
+    clock = 0.0
+    latencies, words = [], []
+    start = 0.0
+    while start < duration:
+        end = min(duration, start + BATCH_SECONDS)
+        chunk = audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+
+        began = max(clock, end)
+        started = time.perf_counter()
+        chunk_words = transcriber.transcribe_words(chunk, language=language)
+        clock = began + time.perf_counter() - started
+
+        for word in chunk_words:
+            latencies.append(clock - (start + word["end"]))
+            words.append(word["word"])
+        start = end
+    return {"latencies": latencies, "words": words}
+
+
+def replay_streaming(transcriber: RealtimeTranscriber, audio, language: str, hop: float, window: float) -> Dict:
+    """Sliding window stepped every hop (or as soon as Whisper is free again)"""
+    duration = len(audio) / SAMPLE_RATE
+    streamer = StreamingTranscriber(transcriber, language=language, hop_seconds=hop, window_seconds=window)
+    clock = 0.0
+    fed = 0
+    latencies = []
+    t = 0.0
+    steps = 0
+
+    def record(committed_before: int):
+        for word in streamer.stitcher.committed[committed_before:]:
+            latencies.append(clock - word["end"])
+
+    while t < duration:
+        t = min(duration, max(t + hop, clock))
+        streamer.append(audio[fed:int(t * SAMPLE_RATE)])
+        fed = int(t * SAMPLE_RATE)
+
+        committed_before = len(streamer.stitcher.committed)
+        started = time.perf_counter()
+        streamer.step()
+        clock = t + time.perf_counter() - started
+        steps += 1
+        record(committed_before)
+
+    committed_before = len(streamer.stitcher.committed)
+    started = time.perf_counter()
+    streamer.finish()
+    clock += time.perf_counter() - started
+    record(committed_before)
+
+    return {
+        "latencies": latencies,
+        "words": [w["word"] for w in streamer.stitcher.committed],
+        "steps": steps
+    }
+
+
+def report(label: str, result: Dict, reference: Optional[List[str]]):
+    latencies = sorted(result["latencies"]) or [0.0]
+    line = (f"   {label:<10} | words {len(result['words']):>5} | latency p50 "
+            f"{latencies[len(latencies) // 2]:>5.2f}s p90 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.9))]:>5.2f}s "
+            f"mean {statistics.mean(latencies):>5.2f}s")
+    if reference is not None:
+        hypothesis = [w for w in (normalize_word(word) for word in result["words"]) if w]
+        line += f" | WER {word_error_rate(reference, hypothesis):.1%}"
+    if "steps" in result:
+        line += f" | {result['steps']} window steps"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs batch transcription (word latency, WER)")
+    parser.add_argument("audio", help="Recorded call audio (WebM, WAV or raw PCM Int16 16kHz)")
+    parser.add_argument("--reference", help="Reference transcript (plain text) for WER")
+    parser.add_argument("--language", default="id")
+    parser.add_argument("--hop", type=float, default=1.5, help="Streaming hop seconds")
+    parser.add_argument("--window", type=float, default=15.0, help="Streaming window seconds")
+    parser.add_argument("--model-size", default=os.getenv("WHISPER_MODEL_SIZE", "base"))
+    args = parser.parse_args()
+
+    transcriber = RealtimeTranscriber(model_size=args.model_size)
+    transcriber.warm_up(language=args.language)
+
+    with open(args.audio, "rb") as f:
+        audio = transcriber.decode_to_array(f.read())
+
+    reference = None
+    if args.reference:
+        with open(args.reference, "r", encoding="utf-8") as f:
+            reference = [w for w in (normalize_word(word) for word in f.read().split()) if w]
+
+    print(f"🎵 {os.path.basename(args.audio)}: {len(audio) / SAMPLE_RATE:.1f}s, model {args.model_size}")
+    batch = replay_batch(transcriber, audio, args.language)
+    streaming = replay_streaming(transcriber, audio, args.language, args.hop, args.window)
+
+    print(f"\n📊 Word latency (end of word → text emitted) and accuracy")
+    report("batch", batch, reference)
+    report("streaming", streaming, reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-memory PyAV decoding vs the ffmpeg/temp file path
+
+For every recorded audio buffer (the bytes /ingest hands to
+transcribe_buffer - WebM/Opus, WAV or raw PCM Int16), measures:
+- file path: write temp file → ffmpeg → WAV temp file → Whisper's loader
+- in-memory path: RealtimeTranscriber.decode_to_array (PyAV → float32 array)
+
+and, with --transcribe, the full transcribe_buffer_via_ffmpeg vs
+transcribe_buffer call including Whisper inference.
+
+Usage (from backend/):
+    python benchmarks/transcription_decode_benchmark.py buffers/*.webm
+    python benchmarks/transcription_decode_benchmark.py --repeat 20 --transcribe chunk.webm
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import wave
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from faster_whisper.audio import decode_audio
+
+from utils.realtime_transcriber import WEBM_MAGIC, RealtimeTranscriber
+
+
+def decode_via_files(transcriber: RealtimeTranscriber, buffer_data: bytes):
+    """The temp file steps of transcribe_buffer_via_ffmpeg, ending with Whisper's own WAV loader"""
+    wav_path = tempfile.mktemp(suffix='.wav')
+    try:
+        if buffer_data[:4] == b'RIFF':
+            with open(wav_path, 'wb') as f:
+                f.write(buffer_data)
+        elif buffer_data[:4] == WEBM_MAGIC:
+            webm_path = tempfile.mktemp(suffix='.webm')
+            try:
+                with open(webm_path, 'wb') as f:
+                    f.write(buffer_data)
+                wav_path = transcriber.convert_webm_to_wav(webm_path, tolerant=True)
+            finally:
+                os.remove(webm_path)
+        else:
+            with wave.open(wav_path, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(16000)
+                wav_file.writeframes(buffer_data)
+        return decode_audio(wav_path, sampling_rate=16000)
+    finally:
+        if os.path.exists(wav_path):
+            os.remove(wav_path)
+
+
+def time_runs(fn: Callable[[], object], repeat: int) -> List[float]:
+    """Wall time of `repeat` calls (after one untimed warm-up call)"""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p90_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))] * 1000,
+        "mean_ms": statistics.mean(ordered) * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark in-memory vs ffmpeg/temp file audio decoding")
+    parser.add_argument("buffers", nargs="+", help="Recorded audio buffers (WebM, WAV or raw PCM Int16 16kHz)")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per buffer and path")
+    parser.add_argument("--transcribe", action="store_true", help="Also time full transcription (loads Whisper)")
+    parser.add_argument("--model-size", default=os.getenv("WHISPER_MODEL_SIZE", "base"), help="Whisper model for --transcribe")
+    args = parser.parse_args()
+
+    transcriber = RealtimeTranscriber(model_size=args.model_size)
+    if args.transcribe:
+        transcriber.warm_up()
+
+    paths = {"decode: ffmpeg + temp files": [], "decode: in-memory PyAV": []}
+    if args.transcribe:
+        paths.update({"transcribe: ffmpeg + temp files": [], "transcribe: in-memory PyAV": []})
+
+    for path in args.buffers:
+        with open(path, "rb") as f:
+            buffer_data = f.read()
+
+        in_memory = transcriber.decode_to_array(buffer_data)
+        from_files = decode_via_files(transcriber, buffer_data)
+        print(f"🎵 {os.path.basename(path)}: {len(buffer_data)} bytes → "
+              f"{len(in_memory) / 16000:.2f}s in memory, {len(from_files) / 16000:.2f}s via ffmpeg")
+
+        paths["decode: ffmpeg + temp files"] += time_runs(lambda: decode_via_files(transcriber, buffer_data), args.repeat)
+        paths["decode: in-memory PyAV"] += time_runs(lambda: transcriber.decode_to_array(buffer_data), args.repeat)
+        if args.transcribe:
+            paths["transcribe: ffmpeg + temp files"] += time_runs(
+                lambda: transcriber.transcribe_buffer_via_ffmpeg(buffer_data), args.repeat
+            )
+            paths["transcribe: in-memory PyAV"] += time_runs(
+                lambda: transcriber.transcribe_buffer(buffer_data), args.repeat
+            )
+
+    print(f"\n📊 {len(args.buffers)} buffer(s) × {args.repeat} runs")
+    print(f"   {'path':<32} | {'p50':>9} | {'p90':>9} | {'mean':>9}")
+    for label, samples in paths.items():
+        s = summarize(samples)
+        print(f"   {label:<32} | {s['p50_ms']:>7.1f}ms | {s['p90_ms']:>7.1f}ms | {s['mean_ms']:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -327,6 +327,11 @@ def detect_stage_by_context(
         # At start, use first stage
         return structure[0]['id']
     
+    # Guard: LLM unavailable (circuit breaker open) - use timing right away
+    if not analyzer.is_llm_available():
+        print(f"   ⚡ LLM unavailable, using time-based stage")
+        return get_stage_by_time(elapsed_seconds)
+    
     try:
         # Use AI to detect stage
         detected_stage_id, confidence = analyzer.detect_current_stage(
@@ -334,25 +339,80 @@ def detect_stage_by_context(
             stages=structure,
             call_elapsed_seconds=elapsed_seconds
         )
+        return _resolve_detected_stage(
+            detected_stage_id, confidence, elapsed_seconds, previous_stage_id, min_confidence
+        )
         
-        # If confident, use AI detection
-        if confidence >= min_confidence:
-            return detected_stage_id
-        
-        # Low confidence - check if should keep previous stage
-        if previous_stage_id and confidence < min_confidence:
-            # Don't change stage on low confidence
-            return previous_stage_id
-        
-        # Fallback to time-based
-        print(f"   ⚠️ Low confidence ({confidence:.0%}), using time-based fallback")
+    except Exception as e:
+        print(f"   ⚠️ Stage detection error: {e}, using time-based fallback")
+        return get_stage_by_time(elapsed_seconds)
+
+
+async def detect_stage_by_context_async(
+    conversation_text: str,
+    elapsed_seconds: int,
+    analyzer,  # TrialClassAnalyzer instance
+    previous_stage_id: str = None,
+    min_confidence: float = 0.6
+) -> str:
+    """
+    Awaitable variant of detect_stage_by_context (uses detect_current_stage_async)
+    
+    Returns:
+        Stage ID that matches the current conversation context
+    """
+    structure = get_default_call_structure()
+    if not structure:
+        return ""
+    
+    # Guard: Skip if conversation too short
+    if len(conversation_text.strip()) < 100:
+        # At start, use first stage
+        return structure[0]['id']
+    
+    # Guard: LLM unavailable (circuit breaker open) - use timing right away
+    if not analyzer.is_llm_available():
+        print(f"   ⚡ LLM unavailable, using time-based stage")
         return get_stage_by_time(elapsed_seconds)
+    
+    try:
+        # Use AI to detect stage
+        detected_stage_id, confidence = await analyzer.detect_current_stage_async(
+            conversation_text=conversation_text,
+            stages=structure,
+            call_elapsed_seconds=elapsed_seconds
+        )
+        return _resolve_detected_stage(
+            detected_stage_id, confidence, elapsed_seconds, previous_stage_id, min_confidence
+        )
         
     except Exception as e:
         print(f"   ⚠️ Stage detection error: {e}, using time-based fallback")
         return get_stage_by_time(elapsed_seconds)
 
 
+def _resolve_detected_stage(
+    detected_stage_id: str,
+    confidence: float,
+    elapsed_seconds: int,
+    previous_stage_id: str = None,
+    min_confidence: float = 0.6
+) -> str:
+    """Apply confidence / anti-jitter rules to an AI stage verdict"""
+    # If confident, use AI detection
+    if confidence >= min_confidence:
+        return detected_stage_id
+    
+    # Low confidence - check if should keep previous stage
+    if previous_stage_id and confidence < min_confidence:
+        # Don't change stage on low confidence
+        return previous_stage_id
+    
+    # Fallback to time-based
+    print(f"   ⚠️ Low confidence ({confidence:.0%}), using time-based fallback")
+    return get_stage_by_time(elapsed_seconds)
+
+
 def get_stage_timing_status(stage_id: str, elapsed_seconds: int) -> Dict[str, Any]:
     """
     Check if a stage is on time, late, or not started
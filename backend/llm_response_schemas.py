@@ -0,0 +1,137 @@
+"""
+LLM Response Schemas
+
+JSON schemas for every TrialClassAnalyzer prompt. They are sent as the
+OpenRouter `response_format` so providers that support structured outputs
+decode only JSON of the expected shape - no prose, no markdown fences, no
+missing keys, and ids restricted to the ones that were asked about.
+
+LLM_RESPONSE_FORMAT selects what is sent:
+    json_schema - schema-constrained output (default)
+    json_object - any valid JSON object (older providers)
+    off         - no response_format, rely on the prompt alone
+
+Models whose provider rejects `json_schema` are downgraded to `json_object`
+at runtime by the analyzer.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+
+RESPONSE_FORMAT_JSON_SCHEMA = "json_schema"
+RESPONSE_FORMAT_JSON_OBJECT = "json_object"
+RESPONSE_FORMAT_OFF = "off"
+RESPONSE_FORMAT_MODES = [RESPONSE_FORMAT_JSON_SCHEMA, RESPONSE_FORMAT_JSON_OBJECT, RESPONSE_FORMAT_OFF]
+
+
+def get_response_format_mode() -> str:
+    """
+    Get the configured response format mode (LLM_RESPONSE_FORMAT)
+
+    Raises:
+        ValueError: On an unknown mode
+    """
+    mode = os.getenv("LLM_RESPONSE_FORMAT", RESPONSE_FORMAT_JSON_SCHEMA).strip().lower()
+    if mode not in RESPONSE_FORMAT_MODES:
+        raise ValueError(f"Invalid LLM_RESPONSE_FORMAT '{mode}' (valid: {', '.join(RESPONSE_FORMAT_MODES)})")
+    return mode
+
+
+def _object(properties: Dict, required: Optional[List[str]] = None) -> Dict:
+    """Closed object schema (every property required unless `required` says otherwise)"""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties) if required is None else required,
+        "additionalProperties": False
+    }
+
+
+def _named(name: str, schema: Dict, strict: bool = True) -> Dict:
+    """The `json_schema` member of a response_format"""
+    return {"name": name, "strict": strict, "schema": schema}
+
+
+def _verdict_properties() -> Dict:
+    return {
+        "completed": {"type": "boolean"},
+        "confidence": {"type": "number"},
+        "evidence": {"type": "string"},
+        "reasoning": {"type": "string"}
+    }
+
+
+def _validation_properties() -> Dict:
+    return {
+        "is_valid": {"type": "boolean"},
+        "explanation": {"type": "string"}
+    }
+
+
+def checklist_item_schema() -> Dict:
+    """Single checklist item verdict"""
+    return _named("checklist_verdict", _object(_verdict_properties()))
+
+
+def batch_checklist_schema(item_ids: List[str]) -> Dict:
+    """Batched checklist verdicts, ids limited to the requested items"""
+    entry = _object({"id": {"type": "string", "enum": list(item_ids)}, **_verdict_properties()})
+    return _named("batch_checklist_verdicts", _object({"items": {"type": "array", "items": entry}}))
+
+
+def validation_schema() -> Dict:
+    """Single evidence / client field validation verdict"""
+    return _named("validation_verdict", _object(_validation_properties()))
+
+
+def batch_validation_schema(keys: List[str]) -> Dict:
+    """Batched validation verdicts, keys limited to the requested candidates"""
+    entry = _object({"key": {"type": "string", "enum": list(keys)}, **_validation_properties()})
+    return _named("batch_validation_verdicts", _object({"results": {"type": "array", "items": entry}}))
+
+
+def client_card_schema(field_ids: List[str]) -> Dict:
+    """
+    Client card extraction: only fields with new information are present
+
+    Not strict - strict mode requires every property, but omitting fields
+    is how the prompt says "nothing found".
+    """
+    field = _object({
+        "value": {"type": "string"},
+        "evidence": {"type": "string"},
+        "confidence": {"type": "number"}
+    })
+    return _named(
+        "client_card_fields",
+        _object({field_id: field for field_id in field_ids}, required=[]),
+        strict=False
+    )
+
+
+def stage_schema(stage_ids: List[str]) -> Dict:
+    """Stage detection verdict, stage_id limited to the call structure"""
+    return _named("stage_verdict", _object({
+        "stage_id": {"type": "string", "enum": list(stage_ids)},
+        "confidence": {"type": "number"},
+        "reasoning": {"type": "string"}
+    }))
+
+
+def build_response_format(schema: Optional[Dict], mode: str) -> Optional[Dict]:
+    """
+    OpenRouter `response_format` for a prompt
+
+    Args:
+        schema: One of the *_schema() results (None for free-form prompts)
+        mode: RESPONSE_FORMAT_* mode in effect for the model
+
+    Returns:
+        The response_format object, or None to send none
+    """
+    if schema is None or mode == RESPONSE_FORMAT_OFF:
+        return None
+    if mode == RESPONSE_FORMAT_JSON_OBJECT:
+        return {"type": "json_object"}
+    return {"type": "json_schema", "json_schema": schema}
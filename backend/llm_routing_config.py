@@ -0,0 +1,85 @@
+"""
+LLM Routing Configuration
+
+Maps every analyzer call type to the model that serves it and defines the
+checklist cascade:
+1. A cheap/fast screening model ("checklist_screen") judges all due items
+2. Only items it marks completed with confidence ≥ threshold are confirmed,
+   either by the evidence validation pass or by a re-check with the
+   "checklist" model followed by validation
+3. Everything else is decided by the screening verdict alone
+
+The cascade is enabled by routing "checklist_screen" to a model, e.g.
+    LLM_MODEL_ROUTES="checklist_screen=google/gemini-2.5-flash-lite,validation=google/gemini-2.5-flash"
+"""
+
+import os
+from typing import Dict, TypedDict
+
+
+DEFAULT_MODEL = "google/gemini-2.5-flash-preview-09-2025"
+
+# Call types the analyzer emits (also the usage meter buckets)
+CALL_TYPES = ["stage", "checklist", "checklist_screen", "validation", "client_card"]
+
+# How cascade positives are confirmed
+CASCADE_CONFIRM_VALIDATION = "validation"  # straight to the evidence validation pass
+CASCADE_CONFIRM_RECHECK = "recheck"        # re-check with the "checklist" model, then validation
+
+
+class CascadeConfig(TypedDict):
+    """Checklist cascade settings"""
+    enabled: bool
+    screen_model: str
+    min_confidence: float  # Screening verdicts below this are final "not completed"
+    confirm: str  # CASCADE_CONFIRM_VALIDATION | CASCADE_CONFIRM_RECHECK
+    audit_rate: float  # Fraction of cycles whose screen negatives are re-checked in the background
+
+
+def parse_model_routes(spec: str) -> Dict[str, str]:
+    """
+    Parse a "call_type=model,call_type=model" routing spec
+
+    Raises:
+        ValueError: On malformed entries or unknown call types
+    """
+    routes = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        call_type, separator, model = entry.partition("=")
+        call_type, model = call_type.strip(), model.strip()
+        if not separator or not model:
+            raise ValueError(f"Invalid model route '{entry}' (expected call_type=model)")
+        if call_type not in CALL_TYPES:
+            raise ValueError(f"Unknown call type '{call_type}' in model routes (valid: {', '.join(CALL_TYPES)})")
+        routes[call_type] = model
+    return routes
+
+
+def get_model_routes() -> Dict[str, str]:
+    """
+    Get the routing table: call type → model
+
+    Every call type defaults to DEFAULT_MODEL except "checklist_screen",
+    which is only present when the cascade is configured.
+    """
+    routes = {call_type: DEFAULT_MODEL for call_type in CALL_TYPES if call_type != "checklist_screen"}
+    routes.update(parse_model_routes(os.getenv("LLM_MODEL_ROUTES", "")))
+    return routes
+
+
+def get_cascade_config(routes: Dict[str, str]) -> CascadeConfig:
+    """Cascade settings for a routing table (enabled iff "checklist_screen" is routed)"""
+    confirm = os.getenv("LLM_CASCADE_CONFIRM", CASCADE_CONFIRM_VALIDATION)
+    if confirm not in (CASCADE_CONFIRM_VALIDATION, CASCADE_CONFIRM_RECHECK):
+        raise ValueError(f"Invalid LLM_CASCADE_CONFIRM '{confirm}' (expected validation or recheck)")
+
+    return {
+        "enabled": "checklist_screen" in routes,
+        "screen_model": routes.get("checklist_screen", ""),
+        "min_confidence": float(os.getenv("LLM_CASCADE_MIN_CONFIDENCE", "0.6")),
+        "confirm": confirm,
+        "audit_rate": float(os.getenv("LLM_CASCADE_AUDIT_RATE", "0"))
+    }
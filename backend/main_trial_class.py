@@ -49,7 +49,7 @@ import os
 from call_structure_config import (
     get_default_call_structure,
     get_stage_by_time,
-    detect_stage_by_context,
+    detect_stage_by_context_async,
     get_stage_timing_status,
     validate_call_structure
 )
@@ -61,12 +61,48 @@ from trial_class_analyzer import get_trial_class_analyzer, reset_analyzer
 
 # Existing utilities
 from utils.audio_buffer import AudioBuffer
-from utils.realtime_transcriber import transcribe_audio_buffer
+from utils.realtime_transcriber import (
+    TRANSCRIBE_IN_MEMORY,
+    WEBM_MAGIC,
+    get_transcriber,
+    transcribe_audio_array,
+    transcribe_audio_buffer
+)
+from utils.streaming_decoder import HAS_PYAV, StreamingWebMDecoder, webm_init_segment
+from utils.streaming_transcriber import StreamingTranscriber
+from utils.transcription_pool import get_transcription_pool
+from utils.transcription_batcher import get_transcription_batcher
+from utils.checklist_scheduler import ChecklistScheduler
+from utils.relevance_index import ChecklistRelevanceIndex
+from utils.llm_usage import get_llm_usage_meter, reset_llm_usage_meter
+from utils.voice_activity import create_voice_activity_gate, speech_ratio, voice_activity_totals
 
 load_dotenv()
 
 app = FastAPI()
 
+# Each live analysis cycle publishes by this deadline (audio arrives every 10s)
+ANALYSIS_CYCLE_DEADLINE_SECONDS = float(os.getenv("ANALYSIS_CYCLE_DEADLINE_SECONDS", "8"))
+
+# Decode the /ingest WebM stream with one long-lived decoder per session
+# (false = decode every 10s buffer on its own)
+INGEST_STREAMING_DECODER = os.getenv("INGEST_STREAMING_DECODER", "true").lower() == "true"
+# A failed session decoder is restarted from the stored WebM header at most this often
+MAX_DECODER_RESTARTS = 3
+
+# Live transcription mode:
+#   "batch"     - transcribe each ~10s buffer on its own (default)
+#   "streaming" - re-transcribe a sliding window every short hop and commit
+#                 stable words as they settle (needs the streaming decoder)
+TRANSCRIPTION_MODE = os.getenv("TRANSCRIPTION_MODE", "batch")
+# Streaming mode: minimum spacing between analysis cycle starts
+STREAMING_ANALYSIS_INTERVAL_SECONDS = float(os.getenv("STREAMING_ANALYSIS_INTERVAL_SECONDS", "5"))
+
+# Load Whisper and run one inference at startup; /health is not ready until done
+WHISPER_WARMUP_ON_STARTUP = os.getenv("WHISPER_WARMUP_ON_STARTUP", "true").lower() == "true"
+# Failed warm-ups are retried (after 10s, 20s, ...) before /health settles on "degraded"
+WHISPER_WARMUP_ATTEMPTS = int(os.getenv("WHISPER_WARMUP_ATTEMPTS", "3"))
+
 # CORS - Allow all origins for development and production
 app.add_middleware(
     CORSMiddleware,
@@ -91,7 +127,8 @@ client_card_fields = get_default_client_card_fields()
 # Progress tracking
 checklist_progress: Dict[str, bool] = {}  # item_id → completed
 checklist_evidence: Dict[str, str] = {}  # item_id → evidence text
-checklist_last_check: Dict[str, float] = {}  # item_id → timestamp
+relevance_index = ChecklistRelevanceIndex(call_structure)  # Lexical pre-filter, rebuilt when structure changes
+checklist_scheduler = ChecklistScheduler(relevance_index=relevance_index)  # Per-item transcript watermarks
 
 # Client card data
 client_card_data: Dict[str, Dict[str, str]] = {}  # field_id → {value, evidence, extractedAt}
@@ -110,7 +147,7 @@ debug_log: List[Dict] = []  # Stores all AI decisions for debugging
 def reset_state():
     """Resets all global state variables for a new session."""
     global accumulated_transcript, is_live_recording, call_start_time
-    global checklist_progress, checklist_evidence, checklist_last_check
+    global checklist_progress, checklist_evidence, checklist_scheduler
     global client_card_data, current_stage_id, stage_start_time, debug_log
 
     print("🔄 Resetting application state for new session...")
@@ -121,11 +158,12 @@ def reset_state():
     current_stage_id = call_structure[0]['id'] if call_structure else ""
     checklist_progress = {}
     checklist_evidence = {}
-    checklist_last_check = {}
+    checklist_scheduler = ChecklistScheduler(relevance_index=relevance_index)
     client_card_data = {}
     accumulated_transcript = ""
     debug_log = [] # This was the missing part
     reset_analyzer()
+    reset_llm_usage_meter()
 
     print("✅ State reset complete.")
 
@@ -147,9 +185,225 @@ def log_decision(decision_type: str, data: Dict):
         debug_log = debug_log[-500:]
 
 
+def apply_checklist_results(items: List[Dict], results: Dict[str, tuple]) -> List[str]:
+    """
+    Record checklist verdicts for one analysis cycle
+    
+    Runs after every verdict of the cycle is available and walks the items
+    in call structure order, so duplicate-evidence rejection and the debug
+    log are deterministic regardless of which LLM call finished first.
+    
+    Args:
+        items: Items evaluated this cycle (call structure order)
+        results: item_id → (completed, confidence, evidence, debug_info)
+        
+    Returns:
+        Contents of newly completed items
+    """
+    newly_completed = []
+    
+    for item in items:
+        item_id = item['id']
+        completed, confidence, evidence, debug_info = results[item_id]
+        
+        # Log decision
+        log_decision("checklist_item", {
+            "item_id": item_id,
+            "item_content": item['content'],
+            "completed": completed,
+            "confidence": confidence,
+            "evidence": evidence,
+            **debug_info
+        })
+        
+        if completed:
+            # Guard: Check for duplicate evidence (same evidence used for multiple items)
+            duplicate_evidence = False
+            if evidence:
+                for existing_id, existing_evidence in checklist_evidence.items():
+                    if existing_evidence == evidence:
+                        duplicate_evidence = True
+                        print(f"   ⚠️ DUPLICATE EVIDENCE detected!")
+                        print(f"      Same evidence already used for: {existing_id}")
+                        print(f"      Evidence: {evidence[:100]}")
+                        log_decision("duplicate_evidence", {
+                            "item_id": item_id,
+                            "duplicate_of": existing_id,
+                            "evidence": evidence
+                        })
+                        break
+            
+            if not duplicate_evidence:
+                checklist_progress[item_id] = True
+                checklist_evidence[item_id] = evidence
+                newly_completed.append(item['content'])
+                print(f"   ✅ {item['content']}")
+            else:
+                print(f"   ❌ {item['content']} - REJECTED (duplicate evidence)")
+        else:
+            print(f"   ❌ {item['content']} (confidence: {confidence:.0%})")
+    
+    return newly_completed
+
+
+def build_update_message(elapsed: float, transcript_preview: str) -> Dict:
+    """
+    Build the full state update sent to /coach clients
+    
+    Args:
+        elapsed: Seconds since call start
+        transcript_preview: Transcript text whose last 300 chars are shown
+    """
+    stages_with_progress = []
+    for stage in call_structure:
+        stage_items = []
+        for item in stage['items']:
+            stage_items.append({
+                "id": item['id'],
+                "type": item['type'],
+                "content": item['content'],
+                "completed": checklist_progress.get(item['id'], False),
+                "evidence": checklist_evidence.get(item['id'], "")
+            })
+        
+        timing_status = get_stage_timing_status(stage['id'], int(elapsed))
+        
+        stages_with_progress.append({
+            "id": stage['id'],
+            "name": stage['name'],
+            "startOffsetSeconds": stage['startOffsetSeconds'],
+            "durationSeconds": stage['durationSeconds'],
+            "items": stage_items,
+            "isCurrent": stage['id'] == current_stage_id,
+            "timingStatus": timing_status['status'],
+            "timingMessage": timing_status['message']
+        })
+    
+    # Calculate stage elapsed time
+    stage_elapsed = 0
+    if stage_start_time is not None:
+        stage_elapsed = int(time.time() - stage_start_time)
+    
+    return {
+        "type": "update",
+        "callElapsedSeconds": int(elapsed),
+        "stageElapsedSeconds": stage_elapsed,
+        "currentStageId": current_stage_id,
+        "stages": stages_with_progress,
+        "clientCard": client_card_data,
+        "transcriptPreview": transcript_preview[-300:],
+        "llmUsage": get_llm_usage_meter().stats(),
+        "debugLog": debug_log[-50:]  # Last 50 entries for debugging
+    }
+
+
+async def broadcast_to_coaches(message_data: Dict):
+    """Send a message to every /coach client, dropping dead connections"""
+    message_json = json.dumps(message_data)
+    
+    disconnected = set()
+    for ws in coach_connections:
+        try:
+            await ws.send_text(message_json)
+        except Exception as e:
+            print(f"❌ Send error: {e}")
+            disconnected.add(ws)
+    
+    coach_connections.difference_update(disconnected)
+
+
 # Analyzer
 analyzer = get_trial_class_analyzer()
 
+# Transcription worker processes (TRANSCRIPTION_WORKERS > 0), else in-process
+transcription_pool = get_transcription_pool()
+# Cross-session Whisper batches for in-process transcription (TRANSCRIPTION_BATCH_SIZE > 1)
+transcription_batcher = get_transcription_batcher(get_transcriber()) if transcription_pool is None else None
+
+# Startup Whisper warm-up (see start_whisper_warmup)
+whisper_warmup_task: Optional[asyncio.Task] = None
+
+
+async def warm_up_whisper():
+    """Load and warm the Whisper model(s) off the event loop, retrying failed attempts"""
+    for attempt in range(1, WHISPER_WARMUP_ATTEMPTS + 1):
+        try:
+            if transcription_pool is not None:
+                await transcription_pool.start()
+            else:
+                await asyncio.get_event_loop().run_in_executor(None, get_transcriber().warm_up)
+            return
+        except Exception:
+            # Logged by warm_up / the pool; /health reports the error
+            if attempt < WHISPER_WARMUP_ATTEMPTS:
+                print(f"🔁 Retrying Whisper warm-up in {10 * attempt}s ({attempt}/{WHISPER_WARMUP_ATTEMPTS} failed)")
+                await asyncio.sleep(10 * attempt)
+
+
+@app.on_event("startup")
+async def start_whisper_warmup():
+    """Warm Whisper in the background so the server can answer /health meanwhile"""
+    global whisper_warmup_task
+    # Worker models always load at startup (the pool has no lazy path)
+    if WHISPER_WARMUP_ON_STARTUP or transcription_pool is not None:
+        whisper_warmup_task = asyncio.create_task(warm_up_whisper())
+
+
+@app.on_event("shutdown")
+async def close_analyzer_connections():
+    """Release pooled LLM connections"""
+    await analyzer.aclose()
+
+
+@app.on_event("shutdown")
+async def stop_transcription_workers():
+    """Stop transcription worker processes"""
+    if transcription_pool is not None:
+        transcription_pool.shutdown()
+
+
+# ===== TRANSCRIPTION =====
+
+async def decode_buffer_to_array(buffer_data: bytes):
+    """Decode a buffer to float32 PCM in memory; None if PyAV is unavailable/disabled or decoding fails"""
+    if not (HAS_PYAV and TRANSCRIBE_IN_MEMORY):
+        return None
+    try:
+        return await asyncio.get_event_loop().run_in_executor(None, get_transcriber().decode_to_array, buffer_data)
+    except Exception as e:
+        print(f"   ⚠️ In-memory decode failed ({e}), transcribing the buffer as is")
+        return None
+
+
+async def transcribe_buffer_for_session(session_id: str, buffer_data: bytes, language: str) -> List[Dict]:
+    """Transcribe an audio buffer in the worker pool, a cross-session batch, or in-process"""
+    if transcription_pool is not None:
+        return await transcription_pool.transcribe_buffer(session_id, buffer_data, language)
+    if transcription_batcher is not None:
+        audio = await decode_buffer_to_array(buffer_data)
+        if audio is not None:
+            return await transcription_batcher.transcribe(session_id, audio, language)
+    return await asyncio.get_event_loop().run_in_executor(None, transcribe_audio_buffer, buffer_data, language)
+
+
+async def transcribe_array_for_session(session_id: str, audio, language: str) -> List[Dict]:
+    """Transcribe decoded PCM in the worker pool, a cross-session batch, or in-process"""
+    if transcription_pool is not None:
+        return await transcription_pool.transcribe_array(session_id, audio, language)
+    if transcription_batcher is not None:
+        return await transcription_batcher.transcribe(session_id, audio, language)
+    return await asyncio.get_event_loop().run_in_executor(None, transcribe_audio_array, audio, language)
+
+
+async def transcribe_words_for_session(session_id: str, audio, language: str, initial_prompt: str) -> List[Dict]:
+    """Timed words for a streaming window, in the worker pool or in-process"""
+    if transcription_pool is not None:
+        return await transcription_pool.transcribe_words(session_id, audio, language, initial_prompt)
+    return await asyncio.get_event_loop().run_in_executor(
+        None, lambda: get_transcriber().transcribe_words(audio, language=language, initial_prompt=initial_prompt)
+    )
+
+
 # ===== CONFIGURATION ENDPOINTS =====
 
 @app.get("/api/config/call-structure")
@@ -163,7 +417,7 @@ async def get_call_structure_config():
 @app.post("/api/config/call-structure")
 async def update_call_structure_config(data: Dict = None):
     """Update call structure configuration"""
-    global call_structure
+    global call_structure, relevance_index
     
     if not data or 'structure' not in data:
         return JSONResponse({"error": "Missing structure field"}, status_code=400)
@@ -172,6 +426,8 @@ async def update_call_structure_config(data: Dict = None):
         new_structure = data['structure']
         validate_call_structure(new_structure)
         call_structure = new_structure
+        relevance_index = ChecklistRelevanceIndex(call_structure)
+        checklist_scheduler.relevance_index = relevance_index
         
         return {
             "success": True,
@@ -210,6 +466,185 @@ async def update_client_card_config(data: Dict = None):
         return JSONResponse({"error": str(e)}, status_code=400)
 
 
+# ===== LIVE ANALYSIS CYCLE =====
+
+def append_live_transcript(transcript: str, segment_count: int):
+    """Add newly transcribed text to the session transcript and the checklist scheduler"""
+    global accumulated_transcript
+    
+    accumulated_transcript += " " + transcript
+    checklist_scheduler.record_transcript(transcript, segment_count)
+    # Keep last 1000 words for context
+    words = accumulated_transcript.split()
+    if len(words) > 1000:
+        accumulated_transcript = " ".join(words[-1000:])
+
+
+async def finish_streaming_transcript(
+    session_id: str,
+    streamer: StreamingTranscriber,
+    decoder: StreamingWebMDecoder,
+    streaming_task: Optional[asyncio.Task]
+):
+    """
+    End of a streaming session: StreamingTranscriber.finish() on the decoder's last PCM
+    
+    Lets the in-flight window step complete, drains the decoder, transcribes
+    the final window (in the worker pool if enabled) and flushes the pending
+    hypothesis into the session transcript.
+    """
+    try:
+        if streaming_task is not None:
+            await streaming_task
+        # End of stream: let the decoder thread decode what is still buffered
+        await asyncio.get_event_loop().run_in_executor(None, decoder.close, 2.0)
+        streamer.append(decoder.read_pcm())
+        segments = []
+        if len(streamer.audio):
+            audio, prompt = streamer.window()
+            segments = streamer.commit(
+                await transcribe_words_for_session(session_id, audio, streamer.language, prompt)
+            )
+        segments += streamer.flush()
+    except Exception as e:
+        print(f"❌ Final streaming transcription failed: {e}")
+        return
+    
+    transcript = " ".join(s['text'] for s in segments if s['text'])
+    if transcript:
+        print(f"📝 Final committed text: {transcript[:200]}")
+        append_live_transcript(transcript, len(segments))
+
+
+async def run_analysis_cycle(cycle_id: int, deadline: float):
+    """
+    Run one live analysis cycle and publish its results to /coach
+    
+    Stage detection, checklist and client card share one deadline
+    (time.monotonic() timestamp): LLM calls still outstanding when it
+    expires are cancelled and whatever finished is published. Items cut
+    off by the deadline keep their watermark and are checked next cycle.
+    
+    Args:
+        cycle_id: Sequence number for logs
+        deadline: time.monotonic() timestamp by which results are published
+    """
+    global current_stage_id, stage_start_time
+    
+    # Snapshot: transcription keeps appending while this cycle runs
+    transcript = accumulated_transcript
+    elapsed = time.time() - call_start_time
+    
+    try:
+        # Detect stage from conversation context (AI-based)
+        try:
+            detected_stage = await asyncio.wait_for(
+                detect_stage_by_context_async(
+                    conversation_text=transcript[-2000:],  # Last 2000 chars
+                    elapsed_seconds=int(elapsed),
+                    analyzer=analyzer,
+                    previous_stage_id=current_stage_id if current_stage_id else None,
+                    min_confidence=0.6
+                ),
+                timeout=max(0.0, deadline - time.monotonic())
+            )
+        except asyncio.TimeoutError:
+            print(f"   ⏰ Cycle {cycle_id}: stage detection hit the deadline, keeping {current_stage_id}")
+            detected_stage = current_stage_id
+        
+        # Update current stage
+        if detected_stage != current_stage_id:
+            print(f"🔄 Stage transition: {current_stage_id or '(start)'} → {detected_stage}")
+            # Reset stage timer on transition
+            stage_start_time = time.time()
+            print(f"   ⏱️ Stage timer reset")
+            
+            # Log stage transition
+            log_decision("stage_transition", {
+                "from_stage": current_stage_id or "(start)",
+                "to_stage": detected_stage,
+                "elapsed_seconds": int(elapsed)
+            })
+            current_stage_id = detected_stage
+            
+            # Push the new stage now instead of after the checklist/client card cycle
+            await broadcast_to_coaches(build_update_message(elapsed, transcript))
+            print(f"   📤 Early stage update sent to {len(coach_connections)} clients")
+        
+        print(f"\n📋 Checking checklist items...")
+        
+        # Only items near the current stage with enough new, on-topic speech since their last check
+        pending_items = checklist_scheduler.select_items(
+            call_structure, checklist_progress, current_stage_id, int(elapsed),
+            budget_level=get_llm_usage_meter().budget_level()
+        )
+        print(f"   {len(pending_items)} items due (stage window, new on-topic speech)")
+        
+        # Get current values (just the value strings for comparison)
+        current_values = {k: v.get('value', '') if isinstance(v, dict) else v for k, v in client_card_data.items()}
+        
+        # Checklist + client card in one cycle; evidence of both is validated together
+        print(f"👤 Extracting client info...")
+        results, new_client_info = await analyzer.analyze_cycle_async(
+            pending_items,
+            transcript[-1500:],  # Last 1500 chars for checklist
+            transcript[-1000:],  # Last 1000 chars for client card
+            current_values,
+            deadline=deadline
+        )
+        
+        cut_off = sum(1 for result in results.values() if result[3].get("stage") == "deadline_exceeded")
+        if cut_off:
+            print(f"   ⏰ Cycle {cycle_id} hit its deadline: {cut_off} items carried over, publishing partial results")
+        
+        # Bookkeeping runs after all results are in, in call structure order
+        newly_completed = apply_checklist_results(pending_items, results)
+        checklist_scheduler.mark_evaluated(results)
+        
+        if newly_completed:
+            print(f"\n🎯 Newly completed: {len(newly_completed)} items")
+        
+        if new_client_info:
+            print(f"   ✅ Extracted {len(new_client_info)} fields:")
+            for field_id, field_data in new_client_info.items():
+                if isinstance(field_data, dict) and 'value' in field_data:
+                    value_text = field_data.get('value', '')
+                    field_data['extractedAt'] = datetime.utcnow().isoformat() + 'Z'
+                    client_card_data[field_id] = field_data
+                    print(f"      - {field_id}: {value_text[:50]}...")
+
+                    # Log decision
+                    log_decision("client_card", {
+                        "field_id": field_id,
+                        "field_label": field_data.get('label', field_id),
+                        "value": value_text,
+                        "evidence": field_data.get('evidence', ''),
+                        "confidence": field_data.get('confidence', 1.0)
+                    })
+                else:
+                    print(f"   ⚠️ Skipping malformed client_card field: {field_id}")
+        else:
+            print(f"   ⏭️ No new client info extracted")
+        
+        # ===== BUILD AND SEND RESPONSE =====
+        elapsed = time.time() - call_start_time
+        # current_stage_id already set above by detect_stage_by_context_async()
+        message_data = build_update_message(elapsed, transcript)
+        
+        print(f"📤 Sending update with {len(debug_log)} total log entries, last 50: {min(50, len(debug_log))} entries")
+        await broadcast_to_coaches(message_data)
+        
+        print(f"✅ Update sent to {len(coach_connections)} clients\n")
+    
+    except asyncio.CancelledError:
+        print(f"   ⏭️ Cycle {cycle_id} superseded - outstanding LLM calls cancelled")
+        raise
+    except Exception as e:
+        print(f"❌ Analysis error: {e}")
+        import traceback
+        traceback.print_exc()
+
+
 # ===== WEBSOCKET: /ingest (Audio Input) =====
 
 @app.websocket("/ingest")
@@ -218,7 +653,7 @@ async def websocket_ingest(websocket: WebSocket):
     Accept audio stream and transcribe in real-time
     """
     global transcription_language, is_live_recording, call_start_time
-    global checklist_progress, checklist_evidence, checklist_last_check
+    global checklist_progress, checklist_evidence
     global client_card_data, accumulated_transcript
     global current_stage_id, stage_start_time
     
@@ -233,6 +668,69 @@ async def websocket_ingest(websocket: WebSocket):
     # Audio buffer (transcribe every 10 seconds)
     audio_buffer = AudioBuffer(interval_seconds=10.0)
     
+    # Fairness key in the transcription worker queue
+    session_id = f"ingest-{id(websocket)}"
+    
+    # Local speech check so silence / hold music never reaches Whisper (None = disabled)
+    vad_gate = create_voice_activity_gate()
+    
+    # Continuous PCM for a WebM stream (set up on the first audio chunk)
+    decoder: Optional[StreamingWebMDecoder] = None
+    decoder_restarts = 0
+    first_audio_chunk = True
+    # EBML header + Tracks of the first chunk: later chunks are not decodable without it
+    webm_header: Optional[bytes] = None
+    
+    # Streaming transcription mode: sliding window over the decoder's PCM
+    streamer: Optional[StreamingTranscriber] = None
+    streaming_task: Optional[asyncio.Task] = None
+    
+    # Analysis runs beside the receive loop; at most one cycle in flight
+    analysis_task: Optional[asyncio.Task] = None
+    analysis_started_at = 0.0
+    cycle_id = 0
+    
+    async def streaming_step():
+        """Transcribe the window once more and publish the words that settled"""
+        nonlocal analysis_task, analysis_started_at, cycle_id
+        
+        # Appends happen only here, so the window is never modified while it is transcribed
+        streamer.append(decoder.read_pcm())
+        try:
+            audio, prompt = streamer.window()
+            if vad_gate is not None and not streamer.stitcher.pending() and speech_ratio(audio) < vad_gate.threshold:
+                # Nothing waiting to be confirmed and no speech in the window: skip Whisper, still trim
+                vad_gate.record_skip()
+                streamer.commit([])
+                return
+            started = time.perf_counter()
+            words = await transcribe_words_for_session(session_id, audio, streamer.language, prompt)
+            if vad_gate is not None:
+                vad_gate.record_whisper(time.perf_counter() - started)
+            segments = streamer.commit(words)
+        except Exception as e:
+            print(f"❌ Streaming transcription error: {e}")
+            return
+        
+        transcript = " ".join(s['text'] for s in segments if s['text'])
+        if not transcript:
+            return
+        print(f"📝 Committed ({streamer.stats()['committed_words']} words so far): {transcript[:200]}")
+        append_live_transcript(transcript, len(segments))
+        
+        # Text keeps arriving every hop: start a cycle when the last one is done, not per hop
+        if call_start_time is None:
+            return
+        if analysis_task is not None and not analysis_task.done():
+            return
+        if time.monotonic() - analysis_started_at < STREAMING_ANALYSIS_INTERVAL_SECONDS:
+            return
+        cycle_id += 1
+        analysis_started_at = time.monotonic()
+        analysis_task = asyncio.create_task(
+            run_analysis_cycle(cycle_id, analysis_started_at + ANALYSIS_CYCLE_DEADLINE_SECONDS)
+        )
+    
     try:
         while True:
             message = await websocket.receive()
@@ -243,6 +741,8 @@ async def websocket_ingest(websocket: WebSocket):
                     data = json.loads(message['text'])
                     if data.get('type') == 'set_language':
                         transcription_language = data.get('language', 'id')
+                        if streamer is not None:
+                            streamer.language = transcription_language
                         print(f"🌍 Language set to: {transcription_language}")
                 except Exception as e:
                     print(f"⚠️ Failed to process setting: {e}")
@@ -251,34 +751,80 @@ async def websocket_ingest(websocket: WebSocket):
             # Handle audio data
             elif 'bytes' in message:
                 data = message['bytes']
+                if first_audio_chunk:
+                    first_audio_chunk = False
+                    # Only the first MediaRecorder chunk carries the EBML header
+                    if data[:4] == WEBM_MAGIC:
+                        webm_header = webm_init_segment(data)
+                    if INGEST_STREAMING_DECODER and HAS_PYAV and webm_header is not None:
+                        decoder = StreamingWebMDecoder()
+                        print("📻 Streaming WebM decoder started for this session")
+                        if TRANSCRIPTION_MODE == "streaming":
+                            streamer = StreamingTranscriber(get_transcriber(), language=transcription_language)
+                            print(f"🌊 Streaming transcription: {streamer.hop_seconds}s hops, "
+                                  f"{streamer.window_seconds}s window")
+                if decoder is not None and not decoder.healthy and decoder_restarts < MAX_DECODER_RESTARTS:
+                    # Resume from the stored header; the demuxer resyncs at the next cluster
+                    decoder_restarts += 1
+                    decoder.close(timeout=0)
+                    decoder = StreamingWebMDecoder()
+                    decoder.feed(webm_header)
+                    print(f"📻 Streaming decoder restarted ({decoder_restarts}/{MAX_DECODER_RESTARTS})")
+                if decoder is not None:
+                    decoder.feed(data)
                 ready = audio_buffer.add_chunk(data)
                 
+                if streamer is not None and decoder.healthy:
+                    if ready:
+                        audio_buffer.clear()  # Only needed if the decoder fails
+                    # One window transcription at a time; hops stretch when Whisper is slower
+                    if ((streaming_task is None or streaming_task.done())
+                            and decoder.available_seconds() >= streamer.hop_seconds):
+                        streaming_task = asyncio.create_task(streaming_step())
+                    continue
+                
                 if ready:
                     print(f"\n🎯 Transcription triggered (10s buffer ready)")
                     
                     try:
-                        # Get audio
-                        buffer_data = audio_buffer.get_audio_data()
+                        buffer_data = None
+                        if decoder is not None and decoder.healthy:
+                            # Everything the session decoder produced since the last cycle
+                            pcm = decoder.read_pcm()
+                            print(f"   📻 {len(pcm) / decoder.sample_rate:.1f}s of streamed PCM ({decoder.stats()})")
+                        else:
+                            # Get audio
+                            buffer_data = audio_buffer.get_audio_data()
+                            if webm_header is not None and buffer_data[:4] != WEBM_MAGIC:
+                                # Chunks after the first lack the header - not WebM (or PCM) on their own
+                                buffer_data = webm_header + buffer_data
+                            pcm = await decode_buffer_to_array(buffer_data) if vad_gate is not None else None
+                        
+                        if vad_gate is not None and pcm is not None:
+                            pcm = vad_gate.check(pcm)
+                            if pcm is None:
+                                # No speech to transcribe - no Whisper call and no analysis cycle
+                                audio_buffer.clear()
+                                continue
                         
                         # Transcribe
-                        loop = asyncio.get_event_loop()
-                        transcript = await loop.run_in_executor(
-                            None,
-                            transcribe_audio_buffer,
-                            buffer_data,
-                            transcription_language
-                        )
+                        started = time.perf_counter()
+                        if pcm is not None:
+                            segments = await transcribe_array_for_session(session_id, pcm, transcription_language)
+                        else:
+                            segments = await transcribe_buffer_for_session(
+                                session_id, buffer_data, transcription_language
+                            )
+                        if vad_gate is not None and pcm is not None:
+                            vad_gate.record_whisper(time.perf_counter() - started)
+                        transcript = " ".join(s['text'] for s in segments if s['text']) if segments else ""
                         
                         if transcript:
                             print(f"📝 Transcript ({len(transcript)} chars):")
                             print(f"   {transcript[:200]}...")
                             
                             # Accumulate
-                            accumulated_transcript += " " + transcript
-                            # Keep last 1000 words for context
-                            words = accumulated_transcript.split()
-                            if len(words) > 1000:
-                                accumulated_transcript = " ".join(words[-1000:])
+                            append_live_transcript(transcript, len(segments))
                             
                             # ===== ANALYZE: Check checklist items =====
                             # Guard against None (happens when WebSocket reconnects)
@@ -287,189 +833,13 @@ async def websocket_ingest(websocket: WebSocket):
                                 audio_buffer.clear()
                                 continue
                             
-                            elapsed = time.time() - call_start_time
-                            
-                            # Detect stage from conversation context (AI-based)
-                            detected_stage = detect_stage_by_context(
-                                conversation_text=accumulated_transcript[-2000:],  # Last 2000 chars
-                                elapsed_seconds=int(elapsed),
-                                analyzer=analyzer,
-                                previous_stage_id=current_stage_id if current_stage_id else None,
-                                min_confidence=0.6
-                            )
-                            
-                            # Update current stage
-                            if detected_stage != current_stage_id:
-                                print(f"🔄 Stage transition: {current_stage_id or '(start)'} → {detected_stage}")
-                                # Reset stage timer on transition
-                                stage_start_time = time.time()
-                                print(f"   ⏱️ Stage timer reset")
-                                
-                                # Log stage transition
-                                log_decision("stage_transition", {
-                                    "from_stage": current_stage_id or "(start)",
-                                    "to_stage": detected_stage,
-                                    "elapsed_seconds": int(elapsed)
-                                })
-                            current_stage_id = detected_stage
-                            
-                            print(f"\n📋 Checking checklist items...")
-                            newly_completed = []
-                            
-                            for stage in call_structure:
-                                for item in stage['items']:
-                                    item_id = item['id']
-                                    
-                                    # Skip if already completed
-                                    if checklist_progress.get(item_id, False):
-                                        continue
-                                    
-                                    # Skip if checked recently (30s cooldown)
-                                    if item_id in checklist_last_check:
-                                        if time.time() - checklist_last_check[item_id] < 30:
-                                            continue
-                                    
-                                    # Update last check time
-                                    checklist_last_check[item_id] = time.time()
-                                    
-                                    # Check with LLM
-                                    completed, confidence, evidence, debug_info = analyzer.check_checklist_item(
-                                        item,
-                                        accumulated_transcript[-1500:]  # Last 1500 chars
-                                    )
-                                    
-                                    # Log decision
-                                    log_decision("checklist_item", {
-                                        "item_id": item_id,
-                                        "item_content": item['content'],
-                                        "completed": completed,
-                                        "confidence": confidence,
-                                        "evidence": evidence,
-                                        **debug_info
-                                    })
-                                    
-                                    if completed:
-                                        # Guard: Check for duplicate evidence (same evidence used for multiple items)
-                                        duplicate_evidence = False
-                                        if evidence:
-                                            for existing_id, existing_evidence in checklist_evidence.items():
-                                                if existing_evidence == evidence:
-                                                    duplicate_evidence = True
-                                                    print(f"   ⚠️ DUPLICATE EVIDENCE detected!")
-                                                    print(f"      Same evidence already used for: {existing_id}")
-                                                    print(f"      Evidence: {evidence[:100]}")
-                                                    log_decision("duplicate_evidence", {
-                                                        "item_id": item_id,
-                                                        "duplicate_of": existing_id,
-                                                        "evidence": evidence
-                                                    })
-                                                    break
-                                        
-                                        if not duplicate_evidence:
-                                            checklist_progress[item_id] = True
-                                            checklist_evidence[item_id] = evidence
-                                            newly_completed.append(item['content'])
-                                            print(f"   ✅ {item['content']}")
-                                        else:
-                                            print(f"   ❌ {item['content']} - REJECTED (duplicate evidence)")
-                                    else:
-                                        print(f"   ❌ {item['content']} (confidence: {confidence:.0%})")
-                            
-                            if newly_completed:
-                                print(f"\n🎯 Newly completed: {len(newly_completed)} items")
-                            
-                            # ===== ANALYZE: Extract client card info =====
-                            print(f"\n👤 Extracting client info...")
-                            # Get current values (just the value strings for comparison)
-                            current_values = {k: v.get('value', '') if isinstance(v, dict) else v for k, v in client_card_data.items()}
-                            new_client_info = analyzer.extract_client_card_fields(
-                                accumulated_transcript[-1000:],  # Last 1000 chars
-                                current_values
+                            # A newer cycle supersedes one still in flight instead of queueing behind it
+                            if analysis_task is not None and not analysis_task.done():
+                                analysis_task.cancel()
+                            cycle_id += 1
+                            analysis_task = asyncio.create_task(
+                                run_analysis_cycle(cycle_id, time.monotonic() + ANALYSIS_CYCLE_DEADLINE_SECONDS)
                             )
-                            
-                            if new_client_info:
-                                print(f"   ✅ Extracted {len(new_client_info)} fields:")
-                                for field_id, field_data in new_client_info.items():
-                                    if isinstance(field_data, dict) and 'value' in field_data:
-                                        value_text = field_data.get('value', '')
-                                        field_data['extractedAt'] = datetime.utcnow().isoformat() + 'Z'
-                                        client_card_data[field_id] = field_data
-                                        print(f"      - {field_id}: {value_text[:50]}...")
-
-                                        # Log decision
-                                        log_decision("client_card", {
-                                            "field_id": field_id,
-                                            "field_label": field_data.get('label', field_id),
-                                            "value": value_text,
-                                            "evidence": field_data.get('evidence', ''),
-                                            "confidence": field_data.get('confidence', 1.0)
-                                        })
-                                    else:
-                                        print(f"   ⚠️ Skipping malformed client_card field: {field_id}")
-                            else:
-                                print(f"   ⏭️ No new client info extracted")
-                            
-                            # ===== BUILD AND SEND RESPONSE =====
-                            elapsed = time.time() - call_start_time
-                            # current_stage_id already set above by detect_stage_by_context()
-                            
-                            # Build stages with progress and timing
-                            stages_with_progress = []
-                            for stage in call_structure:
-                                stage_items = []
-                                for item in stage['items']:
-                                    stage_items.append({
-                                        "id": item['id'],
-                                        "type": item['type'],
-                                        "content": item['content'],
-                                        "completed": checklist_progress.get(item['id'], False),
-                                        "evidence": checklist_evidence.get(item['id'], "")
-                                    })
-                                
-                                timing_status = get_stage_timing_status(stage['id'], int(elapsed))
-                                
-                                stages_with_progress.append({
-                                    "id": stage['id'],
-                                    "name": stage['name'],
-                                    "startOffsetSeconds": stage['startOffsetSeconds'],
-                                    "durationSeconds": stage['durationSeconds'],
-                                    "items": stage_items,
-                                    "isCurrent": stage['id'] == current_stage_id,
-                                    "timingStatus": timing_status['status'],
-                                    "timingMessage": timing_status['message']
-                                })
-                            
-                            # Send to all clients
-                            # Calculate stage elapsed time
-                            stage_elapsed = 0
-                            if stage_start_time is not None:
-                                stage_elapsed = int(time.time() - stage_start_time)
-                            
-                            message_data = {
-                                "type": "update",
-                                "callElapsedSeconds": int(elapsed),
-                                "stageElapsedSeconds": stage_elapsed,
-                                "currentStageId": current_stage_id,
-                                "stages": stages_with_progress,
-                                "clientCard": client_card_data,
-                                "transcriptPreview": accumulated_transcript[-300:],
-                                "debugLog": debug_log[-50:]  # Last 50 entries for debugging
-                            }
-                            
-                            print(f"📤 Sending update with {len(debug_log)} total log entries, last 50: {min(50, len(debug_log))} entries")
-                            message_json = json.dumps(message_data)
-                            
-                            disconnected = set()
-                            for ws in coach_connections:
-                                try:
-                                    await ws.send_text(message_json)
-                                except Exception as e:
-                                    print(f"❌ Send error: {e}")
-                                    disconnected.add(ws)
-                            
-                            coach_connections.difference_update(disconnected)
-                            
-                            print(f"✅ Update sent to {len(coach_connections)} clients\n")
                         
                         # Clear buffer
                         audio_buffer.clear()
@@ -490,6 +860,19 @@ async def websocket_ingest(websocket: WebSocket):
         # DO NOT set call_start_time to None here
         import traceback
         traceback.print_exc()
+    finally:
+        # Don't let a cycle of this session publish into the next one
+        if analysis_task is not None and not analysis_task.done():
+            analysis_task.cancel()
+        if streamer is not None and decoder.healthy:
+            # Transcribe the last hop and commit the unconfirmed hypothesis instead of dropping them
+            await finish_streaming_transcript(session_id, streamer, decoder, streaming_task)
+        elif streaming_task is not None and not streaming_task.done():
+            streaming_task.cancel()
+        if decoder is not None:
+            decoder.close(timeout=0)  # Thread exits on its own at end of stream
+        if vad_gate is not None:
+            print(f"🔇 VAD gate for this session: {vad_gate.stats()}")
 
 
 # ===== WEBSOCKET: /coach (Data Output) =====
@@ -604,14 +987,41 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {
-        "status": "ok",
+    warming_up = whisper_warmup_task is not None and not whisper_warmup_task.done()
+    if transcription_pool is not None:
+        whisper = transcription_pool.status()
+        whisper_ready = whisper["ready"]
+    else:
+        whisper = get_transcriber().status()
+        # A model loaded lazily after a failed warm-up serves requests as well
+        whisper_ready = whisper["ready"] or not WHISPER_WARMUP_ON_STARTUP or (whisper["loaded"] and not warming_up)
+        if transcription_batcher is not None:
+            whisper["batching"] = transcription_batcher.status()
+    body = {
+        "status": "ok" if whisper_ready else ("warming_up" if warming_up else "degraded"),
+        "ready": whisper_ready,
+        "whisper": whisper,
         "coach_connections": len(coach_connections),
         "is_live_recording": is_live_recording,
         "call_elapsed": int(time.time() - call_start_time) if call_start_time else 0,
         "items_completed": sum(1 for v in checklist_progress.values() if v),
-        "total_items": sum(len(stage['items']) for stage in call_structure)
+        "total_items": sum(len(stage['items']) for stage in call_structure),
+        "checklist_scheduler": checklist_scheduler.stats(),
+        "llm_cache": analyzer.cache.stats(),
+        "llm_usage": get_llm_usage_meter().stats(),
+        "vad_gate": voice_activity_totals(),
+        "llm_circuit_breaker": analyzer.circuit_breaker.stats(),
+        "llm_hedging": analyzer.hedging.stats(),
+        "llm_single_flight": analyzer.single_flight.stats(),
+        "llm_routing": {
+            "routes": analyzer.model_routes,
+            "cascade": analyzer.cascade,
+            "cascade_stats": analyzer.cascade_stats.stats()
+        }
     }
+    # Still warming → 503 so load balancers hold traffic back; a failed warm-up is
+    # reported as degraded (200) - the model still loads lazily on the first buffer
+    return JSONResponse(status_code=503, content=body) if warming_up and not whisper_ready else body
 
 
 @app.get("/api/debug-log")
@@ -640,7 +1050,7 @@ async def process_transcript(transcript: str = Form(...), language: str = Form("
     
     # Quick analysis
     elapsed = time.time() - call_start_time
-    detected_stage = detect_stage_by_context(
+    detected_stage = await detect_stage_by_context_async(
         conversation_text=transcript[-2000:],
         elapsed_seconds=int(elapsed),
         analyzer=analyzer,
@@ -649,33 +1059,36 @@ async def process_transcript(transcript: str = Form(...), language: str = Form("
     )
     current_stage_id = detected_stage
     
-    # Check items
-    for stage in call_structure:
-        for item in stage['items']:
-            if not checklist_progress.get(item['id'], False):
-                completed, conf, evidence, debug_info = analyzer.check_checklist_item(
-                    item,
-                    transcript
-                )
-                
-                # Log decision
-                log_decision("checklist_item", {
-                    "item_id": item['id'],
-                    "item_content": item['content'],
-                    "completed": completed,
-                    "confidence": conf,
-                    "evidence": evidence,
-                    **debug_info
-                })
-                
-                if completed:
-                    checklist_progress[item['id']] = True
-                    checklist_evidence[item['id']] = evidence
+    # Check items (batched or concurrent, see CHECKLIST_EVAL_MODE)
+    pending_items = [
+        item
+        for stage in call_structure
+        for item in stage['items']
+        if not checklist_progress.get(item['id'], False)
+    ]
+    results = await analyzer.evaluate_checklist_items_async(pending_items, transcript)
+    
+    for item in pending_items:
+        completed, conf, evidence, debug_info = results[item['id']]
+        
+        # Log decision
+        log_decision("checklist_item", {
+            "item_id": item['id'],
+            "item_content": item['content'],
+            "completed": completed,
+            "confidence": conf,
+            "evidence": evidence,
+            **debug_info
+        })
+        
+        if completed:
+            checklist_progress[item['id']] = True
+            checklist_evidence[item['id']] = evidence
     
     # Extract client info
     # Get current values (just the value strings for comparison)
     current_values = {k: v.get('value', '') if isinstance(v, dict) else v for k, v in client_card_data.items()}
-    new_info = analyzer.extract_client_card_fields(transcript, current_values)
+    new_info = await analyzer.extract_client_card_fields_async(transcript, current_values)
     for field_id, field_data in new_info.items():
         field_data['extractedAt'] = datetime.utcnow().isoformat() + 'Z'
         client_card_data[field_id] = field_data
@@ -707,7 +1120,6 @@ async def process_youtube(url: str = Form(...), language: str = Form("id"), real
     try:
         from utils.youtube_streamer import get_streamer
         from utils.audio_buffer import AudioBuffer
-        from utils.realtime_transcriber import transcribe_audio_buffer
         
         print(f"🎬 Processing YouTube (STREAMING MODE): {url}")
         print(f"   Language: {language}")
@@ -742,13 +1154,7 @@ async def process_youtube(url: str = Form(...), language: str = Form("id"), real
                     buffer_data = audio_buffer.get_audio_data()
                     
                     # Transcribe (same as live ingest)
-                    loop = asyncio.get_event_loop()
-                    segments = await loop.run_in_executor(
-                        None,
-                        transcribe_audio_buffer,
-                        buffer_data,
-                        transcription_language
-                    )
+                    segments = await transcribe_buffer_for_session("youtube", buffer_data, transcription_language)
                     
                     if segments:
                         full_transcript_segments.extend(segments)
@@ -757,16 +1163,13 @@ async def process_youtube(url: str = Form(...), language: str = Form("id"), real
                         print(f"   {transcript[:200]}...")
                         
                         # Accumulate transcript
-                        accumulated_transcript += " " + transcript
-                        words = accumulated_transcript.split()
-                        if len(words) > 1000:
-                            accumulated_transcript = " ".join(words[-1000:])
+                        append_live_transcript(transcript, len(segments))
                         
                         # ===== ANALYZE: Check checklist items =====
                         elapsed = time.time() - call_start_time
                         
                         # Detect stage from conversation context
-                        detected_stage = detect_stage_by_context(
+                        detected_stage = await detect_stage_by_context_async(
                             conversation_text=accumulated_transcript[-2000:],
                             elapsed_seconds=int(elapsed),
                             analyzer=analyzer,
@@ -789,40 +1192,43 @@ async def process_youtube(url: str = Form(...), language: str = Form("id"), real
                         
                         print(f"\n📋 Checking checklist items (stage: {current_stage_id})...")
                         
-                        for stage in call_structure:
-                            for item in stage['items']:
-                                item_id = item['id']
-                                
-                                # Skip if already completed
-                                if checklist_progress.get(item_id, False):
-                                    continue
-                                
-                                # Check with LLM
-                                completed, confidence, evidence, debug_info = analyzer.check_checklist_item(
-                                    item,
-                                    accumulated_transcript[-500:]  # Last 500 chars
-                                )
-                                
-                                # Log decision
-                                log_decision("checklist_item", {
-                                    "item_id": item_id,
-                                    "item_content": item['content'],
-                                    "completed": completed,
-                                    "confidence": confidence,
-                                    "evidence": evidence,
-                                    **debug_info
-                                })
-                                
-                                if completed and confidence > 0.7:
-                                    checklist_progress[item_id] = True
-                                    checklist_evidence[item_id] = evidence
-                                    print(f"   ✅ {item['content']} (confidence: {confidence:.2f})")
+                        # Only items near the current stage with enough new speech since their last check
+                        pending_items = checklist_scheduler.select_items(
+                            call_structure, checklist_progress, current_stage_id, int(elapsed),
+                            budget_level=get_llm_usage_meter().budget_level()
+                        )
+                        
+                        # Check with LLM (batched or concurrent, see CHECKLIST_EVAL_MODE)
+                        results = await analyzer.evaluate_checklist_items_async(
+                            pending_items,
+                            accumulated_transcript[-500:]  # Last 500 chars
+                        )
+                        checklist_scheduler.mark_evaluated(results)
+                        
+                        for item in pending_items:
+                            item_id = item['id']
+                            completed, confidence, evidence, debug_info = results[item_id]
+                            
+                            # Log decision
+                            log_decision("checklist_item", {
+                                "item_id": item_id,
+                                "item_content": item['content'],
+                                "completed": completed,
+                                "confidence": confidence,
+                                "evidence": evidence,
+                                **debug_info
+                            })
+                            
+                            if completed and confidence > 0.7:
+                                checklist_progress[item_id] = True
+                                checklist_evidence[item_id] = evidence
+                                print(f"   ✅ {item['content']} (confidence: {confidence:.2f})")
                         
                         # ===== ANALYZE: Extract client info =====
                         print(f"\n👤 Extracting client information...")
                         # Get current values (just the value strings for comparison)
                         current_values = {k: v.get('value', '') if isinstance(v, dict) else v for k, v in client_card_data.items()}
-                        new_info = analyzer.extract_client_card_fields(
+                        new_info = await analyzer.extract_client_card_fields_async(
                             accumulated_transcript,
                             current_values
                         )
@@ -864,7 +1270,7 @@ async def process_youtube(url: str = Form(...), language: str = Form("id"), real
         
         # Analyze
         elapsed = time.time() - call_start_time
-        detected_stage = detect_stage_by_context(
+        detected_stage = await detect_stage_by_context_async(
             conversation_text=accumulated_transcript[-2000:],
             elapsed_seconds=int(elapsed),
             analyzer=analyzer,
@@ -875,41 +1281,37 @@ async def process_youtube(url: str = Form(...), language: str = Form("id"), real
         
         print(f"\n📋 Checking all checklist items...")
         
-        # Check all items
-        for stage in call_structure:
-            for item in stage['items']:
-                item_id = item['id']
-                
-                completed, conf, evidence, debug_info = analyzer.check_checklist_item(
-                    item_id,
-                    item['content'],
-                    item['type'],
-                    transcript
-                )
-                
-                # Log decision
-                log_decision("checklist_item", {
-                    "item_id": item_id,
-                    "item_content": item['content'],
-                    "completed": completed,
-                    "confidence": conf,
-                    "evidence": evidence,
-                    **debug_info
-                })
-                
-                if completed:
-                    checklist_progress[item_id] = True
-                    checklist_evidence[item_id] = evidence
-                    print(f"   ✅ {item['content']}")
-                else:
-                    print(f"   ❌ {item['content']}")
+        # Check all items (batched or concurrent, see CHECKLIST_EVAL_MODE)
+        all_items = [item for stage in call_structure for item in stage['items']]
+        results = await analyzer.evaluate_checklist_items_async(all_items, transcript)
+        
+        for item in all_items:
+            item_id = item['id']
+            completed, conf, evidence, debug_info = results[item_id]
+            
+            # Log decision
+            log_decision("checklist_item", {
+                "item_id": item_id,
+                "item_content": item['content'],
+                "completed": completed,
+                "confidence": conf,
+                "evidence": evidence,
+                **debug_info
+            })
+            
+            if completed:
+                checklist_progress[item_id] = True
+                checklist_evidence[item_id] = evidence
+                print(f"   ✅ {item['content']}")
+            else:
+                print(f"   ❌ {item['content']}")
         
         print(f"\n👤 Extracting client information...")
         
         # Extract client info
         # Get current values (just the value strings for comparison)
         current_values = {k: v.get('value', '') if isinstance(v, dict) else v for k, v in client_card_data.items()}
-        new_info = analyzer.extract_client_card_fields(transcript, current_values)
+        new_info = await analyzer.extract_client_card_fields_async(transcript, current_values)
         
         if new_info:
             print(f"   ✅ Extracted {len(new_info)} fields:")
@@ -927,61 +1329,11 @@ async def process_youtube(url: str = Form(...), language: str = Form("id"), real
                     "confidence": field_data.get('confidence', 1.0)
                 })
         
-        # Build response
-        stages_with_progress = []
-        for stage in call_structure:
-            stage_items = []
-            for item in stage['items']:
-                stage_items.append({
-                    "id": item['id'],
-                    "type": item['type'],
-                    "content": item['content'],
-                    "completed": checklist_progress.get(item['id'], False),
-                    "evidence": checklist_evidence.get(item['id'], "")
-                })
-            
-            timing_status = get_stage_timing_status(stage['id'], int(elapsed))
-            
-            stages_with_progress.append({
-                "id": stage['id'],
-                "name": stage['name'],
-                "startOffsetSeconds": stage['startOffsetSeconds'],
-                "durationSeconds": stage['durationSeconds'],
-                "items": stage_items,
-                "isCurrent": stage['id'] == current_stage_id,
-                "timingStatus": timing_status['status'],
-                "timingMessage": timing_status['message']
-            })
-        
         # Broadcast to connected clients
-        # Calculate stage elapsed time
-        stage_elapsed = 0
-        if stage_start_time is not None:
-            stage_elapsed = int(time.time() - stage_start_time)
-        
-        message_data = {
-            "type": "update",
-            "callElapsedSeconds": int(elapsed),
-            "stageElapsedSeconds": stage_elapsed,
-            "currentStageId": current_stage_id,
-            "stages": stages_with_progress,
-            "clientCard": client_card_data,
-            "transcriptPreview": transcript[-300:],
-            "debugLog": debug_log[-50:]  # Last 50 entries for debugging
-        }
+        message_data = build_update_message(elapsed, transcript)
         
         print(f"📤 Sending YouTube update with {len(debug_log)} total log entries, last 50: {min(50, len(debug_log))} entries")
-        message_json = json.dumps(message_data)
-        
-        disconnected = set()
-        for ws in coach_connections:
-            try:
-                await ws.send_text(message_json)
-            except Exception as e:
-                print(f"❌ Send error: {e}")
-                disconnected.add(ws)
-        
-        coach_connections.difference_update(disconnected)
+        await broadcast_to_coaches(message_data)
         
         print(f"✅ YouTube analysis complete and sent to {len(coach_connections)} clients")
         
@@ -10,17 +10,95 @@ Handles:
 Optimized for low latency and cost.
 """
 
+import asyncio
 import json
 import os
+import random
+import time
 from typing import Dict, List, Tuple, Optional
+import httpx
 import requests
 from dotenv import load_dotenv
 
 from call_structure_config import get_default_call_structure
 from client_card_config import get_default_client_card_fields, get_extraction_hint
+from llm_response_schemas import (
+    RESPONSE_FORMAT_JSON_OBJECT,
+    RESPONSE_FORMAT_JSON_SCHEMA,
+    batch_checklist_schema,
+    batch_validation_schema,
+    build_response_format,
+    checklist_item_schema,
+    client_card_schema,
+    get_response_format_mode,
+    stage_schema,
+    validation_schema,
+)
+from llm_routing_config import CASCADE_CONFIRM_RECHECK, get_cascade_config, get_model_routes
+from utils.cascade_stats import get_cascade_stats
+from utils.circuit_breaker import CircuitOpenError, get_llm_circuit_breaker
+from utils.llm_cache import get_llm_cache, prompt_fingerprint
+from utils.llm_usage import BUDGET_EXHAUSTED, BUDGET_NORMAL, get_llm_usage_meter
+from utils.request_hedging import get_hedging_policy
+from utils.single_flight import SingleFlight
+from utils.streaming_json import IncrementalJSONParser
 
 load_dotenv()
 
+# HTTP transport settings (shared by blocking and async clients)
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+LLM_CONNECT_TIMEOUT_SECONDS = float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "5"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_KEEPALIVE_SECONDS = float(os.getenv("LLM_KEEPALIVE_SECONDS", "60"))
+
+# Checklist evaluation mode for the live loop:
+#   "batch"      - one LLM call for all pending items (default)
+#   "concurrent" - one call per item, dispatched in parallel
+CHECKLIST_EVAL_MODE = os.getenv("CHECKLIST_EVAL_MODE", "batch")
+CHECKLIST_MAX_CONCURRENCY = int(os.getenv("CHECKLIST_MAX_CONCURRENCY", "8"))
+CHECKLIST_CYCLE_DEADLINE_SECONDS = float(os.getenv("CHECKLIST_CYCLE_DEADLINE_SECONDS", "8"))
+
+# Share of a cycle's remaining time kept for the evidence validation pass
+CYCLE_VALIDATION_RESERVE_RATIO = float(os.getenv("CYCLE_VALIDATION_RESERVE_RATIO", "0.3"))
+
+# Stream stage detection and batched checklist responses (SSE) and act on
+# `stage_id` / item verdicts as soon as they are emitted
+LLM_STREAM_RESPONSES = os.getenv("LLM_STREAM_RESPONSES", "false").lower() == "true"
+
+# When the session budget is exhausted, evidence validation calls are skipped and
+# only first-pass verdicts at or above this confidence are accepted
+BUDGET_SKIP_VALIDATION_MIN_CONFIDENCE = float(os.getenv("LLM_BUDGET_SKIP_VALIDATION_MIN_CONFIDENCE", "0.9"))
+
+# Static instruction blocks shared by the checklist prompts. Prompts are laid
+# out as a stable system message (these blocks + per-item/per-field text) and
+# a user message holding only per-call content, so provider-side prefix
+# caching can reuse the static part across calls.
+CHECKLIST_VALIDATION_RULES = """CRITICAL VALIDATION RULES:
+1. Evidence must be a DIRECT QUOTE from conversation
+2. Evidence must CLEARLY AND OBVIOUSLY show the action was done
+3. Generic phrases like "oke", "baik", "ya" are NEVER valid evidence
+4. Greetings ("selamat pagi", "halo") are NEVER valid evidence
+5. Promises to do something ("nanti", "akan") are NOT completion
+6. If you're even 20% unsure → mark completed=false
+
+CONFIDENCE GUIDELINES:
+- 90-100%: Action CLEARLY done, evidence is perfect
+- 70-89%: Likely done, evidence is good but not perfect
+- 50-69%: Possibly done, evidence is weak
+- <50%: Probably not done or no evidence
+
+BE EXTREMELY CONSERVATIVE. When in doubt, mark as NOT completed."""
+
+EVIDENCE_CRITICAL_CHECKS = """1. Does evidence contain actual content (not just "oke", "ya", "baik")?
+2. Does evidence SEMANTICALLY match the action topic?
+3. Is evidence specific enough to prove completion?
+4. Does evidence match the action type (discuss vs explain)?"""
+
+CLIENT_FIELD_CRITICAL_CHECKS = """1. Is evidence about the CLIENT (child/parent), not about the lesson?
+2. Does evidence explicitly state or strongly imply the extracted value?
+3. Is evidence specific, not just generic conversation?
+4. Is the extracted value actually present (or clearly implied) in the evidence?"""
+
 # VERSION MARKER - If you see this, the latest code is loaded!
 print("=" * 60)
 print("🚀 TRIAL CLASS ANALYZER MODULE LOADED")
@@ -36,18 +114,55 @@ class TrialClassAnalyzer:
         Initialize analyzer
         
         Args:
-            model: IGNORED - model is hardcoded to Gemini 2.5 Flash
+            model: IGNORED - models are routed per call type (llm_routing_config)
         """
         self.api_key = os.getenv("OPENROUTER_API_KEY")
-        self.api_url = "https://openrouter.ai/api/v1/chat/completions"
+        # Overridable to target a local stand-in (benchmarks/mock_openrouter_server.py)
+        self.api_url = os.getenv("OPENROUTER_API_URL", "https://openrouter.ai/api/v1/chat/completions")
         
-        # HARDCODED: Always use Gemini 2.5 Flash (ignores model parameter and env vars)
-        self.model = "google/gemini-2.5-flash-preview-09-2025"
+        # Model per call type (LLM_MODEL_ROUTES); self.model serves unrouted call types
+        self.model_routes = get_model_routes()
+        self.model = self.model_routes["checklist"]
         print(f"🤖 Trial Class Analyzer initialized with model: {self.model}")
         
+        # Checklist cascade: cheap screening model, confirmation only for positives
+        self.cascade = get_cascade_config(self.model_routes)
+        self.cascade_stats = get_cascade_stats()
+        if self.cascade["enabled"]:
+            print(f"   🪜 Checklist cascade: {self.cascade['screen_model']} screens, "
+                  f"positives ≥ {self.cascade['min_confidence']:.0%} confirmed by {self.cascade['confirm']}")
+        
         # Load configs
         self.call_structure = get_default_call_structure()
         self.client_card_fields = get_default_client_card_fields()
+        
+        # Shared response cache (identical prompts cost zero API calls)
+        self.cache = get_llm_cache()
+        
+        # Fails fast while OpenRouter is down instead of waiting out timeouts
+        self.circuit_breaker = get_llm_circuit_breaker()
+        
+        # Duplicate slow requests of latency-critical call types (LLM_HEDGE_CALL_TYPES)
+        self.hedging = get_hedging_policy()
+        
+        # Identical prompts already in flight are awaited, not re-sent (per
+        # instance: in-flight tasks belong to the event loop that started them)
+        self.single_flight = SingleFlight()
+        
+        # Schema-constrained JSON output (LLM_RESPONSE_FORMAT); models whose
+        # provider rejected a json_schema request fall back to json_object
+        self.response_format_mode = get_response_format_mode()
+        self._json_schema_rejected_models: set = set()
+        
+        # Compiled system prompts: (prompt kind, ...static inputs) → text
+        self._system_prompts: Dict[tuple, str] = {}
+        
+        # Pooled keep-alive HTTP clients (created lazily)
+        self._http_session: Optional[requests.Session] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        
+        # Requests still running after the caller moved on (stream drains, cascade audits)
+        self._background_tasks: set = set()
     
     def check_checklist_item(
         self,
@@ -67,27 +182,121 @@ class TrialClassAnalyzer:
             (completed: bool, confidence: float, evidence: str, debug_info: dict)
         """
         # Guard: Skip if conversation too short
+        guard_result = self._guard_short_context(conversation_text)
+        if guard_result is not None:
+            return guard_result
+        
+        system_prompt, prompt = self._build_checklist_prompt(item, conversation_text)
+        
+        try:
+            response = self._call_llm(
+                prompt, temperature=0.2, max_tokens=200, system_prompt=system_prompt, call_type="checklist",
+                response_schema=checklist_item_schema()
+            )
+            result = self._parse_llm_json(response, "checklist item", "checklist")
+
+            return self._apply_checklist_guards(item, result, conversation_text)
+            
+        except Exception as e:
+            return self._checklist_error_result(item, e)
+    
+    async def check_checklist_item_async(
+        self,
+        item: Dict,
+        conversation_text: str
+    ) -> Tuple[bool, float, str, Dict]:
+        """
+        Awaitable variant of check_checklist_item (does not block the event loop)
+        
+        Returns:
+            (completed: bool, confidence: float, evidence: str, debug_info: dict)
+        """
+        decided, debug_info = await self._screen_checklist_item_async(item, conversation_text)
+        if decided is not None:
+            return decided
+        
+        validation_passed = await self._validate_evidence_relevance_async(
+            item_content=item['content'],
+            evidence=debug_info["first_evidence"],
+            reasoning=debug_info["first_reasoning"],
+            item_type=item['type']
+        )
+        return self._finalize_checklist_verdict(item, debug_info, validation_passed)
+    
+    def _guard_short_context(self, conversation_text: str) -> Optional[Tuple[bool, float, str, Dict]]:
+        """Return the 'not completed' result if conversation is too short to judge"""
         if len(conversation_text.strip()) < 30:
             debug_info = {
                 "stage": "guard_context_too_short",
                 "context_length": len(conversation_text.strip())
             }
             return False, 0.0, "Insufficient conversation context", debug_info
+        return None
+    
+    def _guard_short_context_per_item(self, items: List[Dict], conversation_text: str) -> Optional[Dict[str, Tuple]]:
+        """
+        Batch version of _guard_short_context
+        
+        Returns:
+            item_id → guard result, each with its own debug_info copy (callers
+            annotate it per item), or None if the conversation is long enough
+        """
+        guard_result = self._guard_short_context(conversation_text)
+        if guard_result is None:
+            return None
+        completed, confidence, evidence, debug_info = guard_result
+        return {item['id']: (completed, confidence, evidence, dict(debug_info)) for item in items}
+    
+    def _build_checklist_prompt(self, item: Dict, conversation_text: str) -> Tuple[str, str]:
+        """
+        Build the single-item checklist prompt
         
-        item_id = item['id']
+        Returns:
+            (system prompt compiled once per item, user message with the conversation)
+        """
         item_content = item['content']
         item_type = item['type']
         extended_description = item.get('extended_description', '')
+        
+        def build() -> str:
+            type_specific = self._get_checklist_type_instructions(item_type)
+            return f"""You are a STRICT quality checker analyzing a sales call in Bahasa Indonesia.
 
-        # Build prompt based on item type
-        if item_type == "discuss":
-            action_description = "asked about or discussed"
-        else:  # "say"
-            action_description = "explained or mentioned"
+{CHECKLIST_VALIDATION_RULES}
+
+Return ONLY valid JSON:
+{{
+  "completed": true/false,
+  "confidence": 0.0-1.0,
+  "evidence": "exact quote showing action (empty if not completed)",
+  "reasoning": "WHY this evidence proves (or doesn't prove) the action"
+}}
+{type_specific}
+TASK: Check if this action was completed:
+Action: "{item_content}"
+
+ADDITIONAL CONTEXT: {extended_description}
+"""
+        
+        system_prompt = self._compiled_system_prompt(
+            ("checklist_item", item['id'], item_type, item_content, extended_description), build
+        )
+        return system_prompt, f"""Recent conversation (Bahasa Indonesia):
+{conversation_text}
+"""
+    
+    def _get_checklist_type_instructions(self, item_type: str) -> str:
+        """
+        Get the type-specific instruction block for a checklist prompt
         
-        # Build specific instructions based on type
+        Args:
+            item_type: "discuss" or "say"
+            
+        Returns:
+            Instruction text with GOOD/BAD evidence examples
+        """
         if item_type == "discuss":
-            type_specific = """
+            return """
 TYPE: DISCUSS/ASK
 This means you must find:
 ✅ A QUESTION being asked, OR
@@ -103,8 +312,8 @@ BAD examples:
 - Evidence: "Oke, baik" ✗ (just acknowledgment)
 - Evidence: "Nanti kita diskusi umur" ✗ (promise to discuss, not actual discussion)
 """
-        else:  # "say"
-            type_specific = """
+        # "say"
+        return """
 TYPE: SAY/EXPLAIN
 This means you must find:
 ✅ The manager STATING or EXPLAINING something
@@ -119,113 +328,161 @@ BAD examples:
 - Evidence: "Nanti saya jelaskan" ✗ (promise to explain, not explanation)
 - Evidence: "Platform bagus" ✗ (opinion, not explanation)
 """
-
-        prompt = f"""You are a STRICT quality checker analyzing a sales call in Bahasa Indonesia.
-
-TASK: Check if this action was completed:
-Action: "{item_content}"
-
-ADDITIONAL CONTEXT: {extended_description}
-
-Recent conversation (Bahasa Indonesia):
-{conversation_text}
-
-{type_specific}
-
-CRITICAL VALIDATION RULES:
-1. Evidence must be a DIRECT QUOTE from conversation
-2. Evidence must CLEARLY AND OBVIOUSLY show the action was done
-3. Generic phrases like "oke", "baik", "ya" are NEVER valid evidence
-4. Greetings ("selamat pagi", "halo") are NEVER valid evidence
-5. Promises to do something ("nanti", "akan") are NOT completion
-6. If you're even 20% unsure → mark completed=false
-
-CONFIDENCE GUIDELINES:
-- 90-100%: Action CLEARLY done, evidence is perfect
-- 70-89%: Likely done, evidence is good but not perfect
-- 50-69%: Possibly done, evidence is weak
-- <50%: Probably not done or no evidence
-
-BE EXTREMELY CONSERVATIVE. When in doubt, mark as NOT completed.
-
-Return ONLY valid JSON:
-{{
-  "completed": true/false,
-  "confidence": 0.0-1.0,
-  "evidence": "exact quote showing action (empty if not completed)",
-  "reasoning": "WHY this evidence proves (or doesn't prove) the action"
-}}
-"""
+    
+    def _apply_checklist_guards(
+        self,
+        item: Dict,
+        result: Dict,
+        conversation_text: str
+    ) -> Tuple[bool, float, str, Dict]:
+        """
+        Apply acceptance guards to a raw LLM verdict for one checklist item
         
-        try:
-            response = self._call_llm(prompt, temperature=0.2, max_tokens=200)
-            try:
-                result = json.loads(response)
-            except json.JSONDecodeError:
-                print(f"   ⚠️ LLM returned invalid JSON for checklist item: {response}")
-                raise ValueError(f"LLM returned invalid JSON: {response}")
-
-            # Check if the response was an error from _call_llm
-            if "error" in result:
-                raise requests.exceptions.RequestException(result.get("details", "Unknown API error"))
-
-            completed = result.get("completed", False)
-            confidence = result.get("confidence", 0.0)
-            evidence = result.get("evidence", "")
-            reasoning = result.get("reasoning", "")
-            
-            debug_info = {
-                "stage": "initial_check",
-                "context_preview": conversation_text[-200:],  # Last 200 chars
-                "first_completed": completed,
-                "first_confidence": confidence,
-                "first_evidence": evidence,
-                "first_reasoning": reasoning,
-                "guards_passed": []
-            }
+        Shared by single-item and batched checks so both modes accept
+        exactly the same completions.
+        
+        Args:
+            item: Checklist item dict
+            result: Parsed LLM verdict {completed, confidence, evidence, reasoning}
+            conversation_text: Conversation the verdict was based on
             
-            # Guard 1: Only accept high confidence completions
-            if completed and confidence < 0.7: # Lowered from 0.8 to 0.7
-                debug_info["stage"] = "guard_1_low_confidence"
-                debug_info["guards_passed"].append("confidence < 0.7")
-                return False, confidence, "Confidence too low", debug_info
-            
-            # Guard 2: Evidence must exist and be substantial
-            if completed and len(evidence.strip()) < 10:
-                debug_info["stage"] = "guard_2_evidence_too_short"
-                debug_info["guards_passed"].append("evidence length < 10")
-                return False, confidence, "Evidence too short", debug_info
-            
-            # Guard 3: Validate evidence relevance with second LLM call
-            # With stricter validation, we can check items with lower confidence
-            validation_result = None
-            if completed and confidence >= 0.7:
-                validation_passed = self._validate_evidence_relevance(
-                    item_content=item_content,
-                    evidence=evidence,
-                    reasoning=reasoning,
-                    item_type=item_type
-                )
-                validation_result = validation_passed
-                debug_info["validation_passed"] = validation_passed
-                
-                if not validation_passed:
-                    print(f"   ⚠️ Evidence validation FAILED for '{item_content[:50]}...'")
-                    debug_info["stage"] = "guard_3_validation_failed"
-                    debug_info["guards_passed"].append("validation failed")
-                    return False, confidence, f"Evidence not relevant: {evidence[:100]}", debug_info
+        Returns:
+            (completed: bool, confidence: float, evidence: str, debug_info: dict)
+        """
+        decided, debug_info = self._screen_checklist_verdict(item, result, conversation_text)
+        if decided is not None:
+            return decided
+        
+        # Guard 3: Validate evidence relevance with second LLM call
+        validation_passed = self._validate_evidence_relevance(
+            item_content=item['content'],
+            evidence=debug_info["first_evidence"],
+            reasoning=debug_info["first_reasoning"],
+            item_type=item['type']
+        )
+        return self._finalize_checklist_verdict(item, debug_info, validation_passed)
+    
+    def _screen_checklist_verdict(
+        self,
+        item: Dict,
+        result: Dict,
+        conversation_text: str
+    ) -> Tuple[Optional[Tuple[bool, float, str, Dict]], Dict]:
+        """
+        Run the local guards (no network) on a raw LLM verdict
+        
+        Args:
+            item: Checklist item dict
+            result: Parsed LLM verdict {completed, confidence, evidence, reasoning}
+            conversation_text: Conversation the verdict was based on
             
+        Returns:
+            (final result or None, debug_info). None means the verdict passed
+            the local guards and its evidence still needs validation.
+        """
+        completed = result.get("completed", False)
+        confidence = result.get("confidence", 0.0)
+        evidence = result.get("evidence", "") or ""
+        reasoning = result.get("reasoning", "") or ""
+        
+        debug_info = {
+            "stage": "initial_check",
+            "context_preview": conversation_text[-200:],  # Last 200 chars
+            "first_completed": completed,
+            "first_confidence": confidence,
+            "first_evidence": evidence,
+            "first_reasoning": reasoning,
+            "guards_passed": []
+        }
+        
+        if not completed:
             debug_info["stage"] = "accepted"
-            debug_info["final_decision"] = "completed" if completed else "not_completed"
-            return completed, confidence, evidence, debug_info
+            debug_info["final_decision"] = "not_completed"
+            return (False, confidence, evidence, debug_info), debug_info
+        
+        # Guard 1: Only accept high confidence completions
+        if confidence < 0.7: # Lowered from 0.8 to 0.7
+            debug_info["stage"] = "guard_1_low_confidence"
+            debug_info["guards_passed"].append("confidence < 0.7")
+            return (False, confidence, "Confidence too low", debug_info), debug_info
+        
+        # Guard 2: Evidence must exist and be substantial
+        if len(evidence.strip()) < 10:
+            debug_info["stage"] = "guard_2_evidence_too_short"
+            debug_info["guards_passed"].append("evidence length < 10")
+            return (False, confidence, "Evidence too short", debug_info), debug_info
+        
+        return None, debug_info
+    
+    def _finalize_checklist_verdict(
+        self,
+        item: Dict,
+        debug_info: Dict,
+        validation_passed: bool
+    ) -> Tuple[bool, float, str, Dict]:
+        """
+        Turn a screened verdict plus its evidence validation into the final result
+        
+        Args:
+            item: Checklist item dict
+            debug_info: debug_info returned by _screen_checklist_verdict
+            validation_passed: Result of the evidence validation pass
             
-        except Exception as e:
-            print(f"   ⚠️ Item check failed for {item_id}: {e}")
-            debug_info = {
-                "stage": "error",
-                "error": str(e)
-            }
-            return False, 0.0, str(e), debug_info
+        Returns:
+            (completed: bool, confidence: float, evidence: str, debug_info: dict)
+        """
+        confidence = debug_info["first_confidence"]
+        evidence = debug_info["first_evidence"]
+        debug_info["validation_passed"] = validation_passed
+        
+        if not validation_passed:
+            print(f"   ⚠️ Evidence validation FAILED for '{item['content'][:50]}...'")
+            debug_info["stage"] = "guard_3_validation_failed"
+            debug_info["guards_passed"].append("validation failed")
+            return False, confidence, f"Evidence not relevant: {evidence[:100]}", debug_info
+        
+        debug_info["stage"] = "accepted"
+        debug_info["final_decision"] = "completed"
+        return True, confidence, evidence, debug_info
+    
+    def _parse_llm_json(self, response: str, label: str, call_type: str = "other"):
+        """
+        Parse an LLM response as JSON
+        
+        Args:
+            response: Text returned by _call_llm / _call_llm_async
+            label: What was requested (for log messages)
+            call_type: Usage meter bucket the parse outcome is recorded under
+            
+        Returns:
+            Parsed JSON value
+            
+        Raises:
+            ValueError: Response is not valid JSON
+            requests.exceptions.RequestException: Response is the API error sentinel
+        """
+        try:
+            result = json.loads(response)
+        except json.JSONDecodeError:
+            get_llm_usage_meter().record_parse(call_type, ok=False)
+            print(f"   ⚠️ LLM returned invalid JSON for {label}: {response}")
+            raise ValueError(f"LLM returned invalid JSON: {response}")
+        
+        # Check if the response was an error from _call_llm
+        if isinstance(result, dict) and "error" in result:
+            raise requests.exceptions.RequestException(result.get("details", "Unknown API error"))
+        
+        get_llm_usage_meter().record_parse(call_type, ok=True)
+        return result
+    
+    def _checklist_error_result(self, item: Dict, error: Exception) -> Tuple[bool, float, str, Dict]:
+        """Build the (not completed) result returned when an item check fails"""
+        print(f"   ⚠️ Item check failed for {item['id']}: {error}")
+        debug_info = {
+            "stage": "error",
+            "error": str(error)
+        }
+        return False, 0.0, str(error), debug_info
     
     def _validate_evidence_relevance(
         self,
@@ -247,6 +504,55 @@ Return ONLY valid JSON:
         Returns:
             True if evidence is relevant, False if not
         """
+        if not self._prefilter_checklist_evidence(item_content, evidence):
+            return False
+        
+        system_prompt, validation_prompt = self._build_evidence_validation_prompt(item_content, evidence, reasoning, item_type)
+        
+        try:
+            response = self._call_llm(
+                validation_prompt, temperature=0.05, max_tokens=150, system_prompt=system_prompt, call_type="validation",
+                response_schema=validation_schema()
+            )
+            return self._parse_validation_response(response, "evidence validation", "Validation")
+            
+        except Exception as e:
+            print(f"   ⚠️ Evidence validation error: {e}")
+            # On error, be conservative - reject to avoid false positives
+            return False
+    
+    async def _validate_evidence_relevance_async(
+        self,
+        item_content: str,
+        evidence: str,
+        reasoning: str,
+        item_type: str = "discuss"
+    ) -> bool:
+        """Awaitable variant of _validate_evidence_relevance"""
+        if not self._prefilter_checklist_evidence(item_content, evidence):
+            return False
+        
+        system_prompt, validation_prompt = self._build_evidence_validation_prompt(item_content, evidence, reasoning, item_type)
+        
+        try:
+            response = await self._call_llm_async(
+                validation_prompt, temperature=0.05, max_tokens=150, system_prompt=system_prompt, call_type="validation",
+                response_schema=validation_schema()
+            )
+            return self._parse_validation_response(response, "evidence validation", "Validation")
+            
+        except Exception as e:
+            print(f"   ⚠️ Evidence validation error: {e}")
+            # On error, be conservative - reject to avoid false positives
+            return False
+    
+    def _prefilter_checklist_evidence(self, item_content: str, evidence: str) -> bool:
+        """
+        Hard-coded local filters for checklist evidence (no network)
+        
+        Returns:
+            False if evidence is obviously invalid, True if it needs LLM validation
+        """
         print(f"      🔍 VALIDATING Evidence for: '{item_content[:60]}...'")
         print(f"         Evidence: '{evidence[:100]}...'")
         
@@ -310,49 +616,27 @@ Return ONLY valid JSON:
             print(f"      🚫 Rejected: Evidence too short ({word_count} words)")
             return False
         
-        # Build type-specific instructions
-        if item_type == "discuss":
-            type_check = """
-ACTION TYPE: DISCUSS/ASK
-The evidence MUST show either:
-1. A QUESTION being asked (e.g., "berapa umur?", "apa yang...", "bagaimana...")
-2. An ANSWER that implies the question was asked (e.g., "usia 8 tahun" for "ask about age")
-
-REJECT if evidence is:
-- Just acknowledgment ("oke", "baik")
-- Unrelated statement that doesn't answer the question
-- Promise to discuss later ("nanti kita bahas")
-"""
-        else:  # "say"
-            type_check = """
-ACTION TYPE: SAY/EXPLAIN
-The evidence MUST show the manager STATING or EXPLAINING something.
-- For complex topics, this should be a clear explanation.
-- For simple courtesies (e.g., "Thank you"), the courtesy itself is sufficient evidence.
-
-REJECT if evidence is:
-- A question instead of a statement (unless the action is a question).
-- A promise to do something later ("nanti saya jelaskan").
-"""
+        return True
+    
+    def _build_evidence_validation_prompt(
+        self,
+        item_content: str,
+        evidence: str,
+        reasoning: str,
+        item_type: str
+    ) -> Tuple[str, str]:
+        """
+        Build the second-pass checklist evidence validation prompt
         
-        validation_prompt = f"""You are a STRICT evidence validator for a sales call checklist.
-
-REQUIRED ACTION:
-"{item_content}"
-
-PROVIDED EVIDENCE:
-"{evidence}"
-
-ORIGINAL REASONING:
-"{reasoning}"
-
-{type_check}
+        Returns:
+            (system prompt compiled once per action, user message with the evidence)
+        """
+        def build() -> str:
+            type_check = self._get_validation_type_check(item_type)
+            return f"""You are a STRICT evidence validator for a sales call checklist.
 
 CRITICAL CHECKS:
-1. Does evidence contain actual content (not just "oke", "ya", "baik")?
-2. Does evidence SEMANTICALLY match the action topic?
-3. Is evidence specific enough to prove completion?
-4. Does evidence match the action type (discuss vs explain)?
+{EVIDENCE_CRITICAL_CHECKS}
 
 EXAMPLES OF INVALID MATCHING:
 ❌ Action: "Ask about child's age" 
@@ -383,35 +667,351 @@ Return ONLY valid JSON:
   "is_valid": true/false,
   "explanation": "specific reason why evidence does/doesn't prove the action"
 }}
+{type_check}
+REQUIRED ACTION:
+"{item_content}"
 """
         
+        system_prompt = self._compiled_system_prompt(("evidence_validation", item_type, item_content), build)
+        return system_prompt, f"""PROVIDED EVIDENCE:
+"{evidence}"
+
+ORIGINAL REASONING:
+"{reasoning}"
+"""
+    
+    def _get_validation_type_check(self, item_type: str) -> str:
+        """Type-specific rules for the evidence validation prompts"""
+        if item_type == "discuss":
+            return """
+ACTION TYPE: DISCUSS/ASK
+The evidence MUST show either:
+1. A QUESTION being asked (e.g., "berapa umur?", "apa yang...", "bagaimana...")
+2. An ANSWER that implies the question was asked (e.g., "usia 8 tahun" for "ask about age")
+
+REJECT if evidence is:
+- Just acknowledgment ("oke", "baik")
+- Unrelated statement that doesn't answer the question
+- Promise to discuss later ("nanti kita bahas")
+"""
+        # "say"
+        return """
+ACTION TYPE: SAY/EXPLAIN
+The evidence MUST show the manager STATING or EXPLAINING something.
+- For complex topics, this should be a clear explanation.
+- For simple courtesies (e.g., "Thank you"), the courtesy itself is sufficient evidence.
+
+REJECT if evidence is:
+- A question instead of a statement (unless the action is a question).
+- A promise to do something later ("nanti saya jelaskan").
+"""
+    
+    def _parse_validation_response(self, response: str, label: str, log_prefix: str) -> bool:
+        """
+        Parse an {is_valid, explanation} validation response
+        
+        Invalid JSON and API errors are treated as rejection (conservative).
+        """
         try:
-            response = self._call_llm(validation_prompt, temperature=0.05, max_tokens=150)
-            try:
-                result = json.loads(response)
-            except json.JSONDecodeError:
-                print(f"   ⚠️ LLM returned invalid JSON for evidence validation: {response}")
-                return False
+            result = json.loads(response)
+        except json.JSONDecodeError:
+            get_llm_usage_meter().record_parse("validation", ok=False)
+            print(f"   ⚠️ LLM returned invalid JSON for {label}: {response}")
+            return False
 
-            # Check if the response was an error from _call_llm
-            if "error" in result:
-                # If the API call fails, we can't validate, so be conservative and reject
-                return False
+        # Check if the response was an error from _call_llm
+        if "error" in result:
+            # If the API call fails, we can't validate, so be conservative and reject
+            return False
+        
+        get_llm_usage_meter().record_parse("validation", ok=True)
 
-            is_valid = result.get("is_valid", False)
-            explanation = result.get("explanation", "")
-            
-            if not is_valid:
-                print(f"      🔍 Validation REJECTED: {explanation}")
-            else:
-                print(f"      ✅ Validation PASSED: {explanation}")
-            
-            return is_valid
-            
+        is_valid = result.get("is_valid", False)
+        explanation = result.get("explanation", "")
+        
+        if not is_valid:
+            print(f"      🔍 {log_prefix} REJECTED: {explanation}")
+        else:
+            print(f"      ✅ {log_prefix} PASSED: {explanation}")
+        
+        return is_valid
+    
+    def validate_evidence_batch(self, candidates: List[Dict]) -> Dict[str, bool]:
+        """
+        Validate evidence for several checklist items / client fields in one LLM call
+        
+        The hard-coded local filters run first as a short-circuit; only the
+        candidates that survive them are sent to the LLM, all in one request.
+        When the session LLM budget is exhausted the request is skipped and
+        only high-confidence first-pass verdicts are kept.
+        
+        Args:
+            candidates: List of candidate dicts, either
+                {key, kind: "checklist", action, item_type, evidence, reasoning, confidence} or
+                {key, kind: "client_field", label, value, evidence, confidence}
+                
+        Returns:
+            Dict of key → is_valid
+        """
+        verdicts, survivors = self._prefilter_validation_candidates(candidates)
+        if not survivors:
+            return verdicts
+        
+        if get_llm_usage_meter().budget_level() == BUDGET_EXHAUSTED:
+            verdicts.update(self._validate_without_llm(survivors))
+            return verdicts
+        
+        system_prompt, prompt, label, log_prefix, max_tokens, schema = self._build_validation_request(survivors)
+        
+        try:
+            response = self._call_llm(
+                prompt, temperature=0.05, max_tokens=max_tokens, system_prompt=system_prompt, call_type="validation",
+                response_schema=schema
+            )
+            verdicts.update(self._parse_validation_batch_response(response, survivors, label, log_prefix))
         except Exception as e:
             print(f"   ⚠️ Evidence validation error: {e}")
             # On error, be conservative - reject to avoid false positives
-            return False
+            verdicts.update({c['key']: False for c in survivors})
+        
+        return verdicts
+    
+    async def validate_evidence_batch_async(self, candidates: List[Dict]) -> Dict[str, bool]:
+        """
+        Awaitable variant of validate_evidence_batch
+        
+        Returns:
+            Dict of key → is_valid
+        """
+        verdicts, survivors = self._prefilter_validation_candidates(candidates)
+        if not survivors:
+            return verdicts
+        
+        if get_llm_usage_meter().budget_level() == BUDGET_EXHAUSTED:
+            verdicts.update(self._validate_without_llm(survivors))
+            return verdicts
+        
+        system_prompt, prompt, label, log_prefix, max_tokens, schema = self._build_validation_request(survivors)
+        
+        try:
+            response = await self._call_llm_async(
+                prompt, temperature=0.05, max_tokens=max_tokens, system_prompt=system_prompt, call_type="validation",
+                response_schema=schema
+            )
+            verdicts.update(self._parse_validation_batch_response(response, survivors, label, log_prefix))
+        except Exception as e:
+            print(f"   ⚠️ Evidence validation error: {e}")
+            # On error, be conservative - reject to avoid false positives
+            verdicts.update({c['key']: False for c in survivors})
+        
+        return verdicts
+    
+    def _prefilter_validation_candidates(self, candidates: List[Dict]) -> Tuple[Dict[str, bool], List[Dict]]:
+        """
+        Apply the local filters to every candidate
+        
+        Returns:
+            (key → False for locally rejected candidates, candidates that need the LLM)
+        """
+        rejected = {}
+        survivors = []
+        for candidate in candidates:
+            if candidate['kind'] == "checklist":
+                passed = self._prefilter_checklist_evidence(candidate['action'], candidate['evidence'])
+            else:
+                passed = self._prefilter_client_field_evidence(candidate['value'], candidate['evidence'])
+            
+            if passed:
+                survivors.append(candidate)
+            else:
+                rejected[candidate['key']] = False
+        
+        if candidates:
+            print(f"      🔍 Evidence validation: {len(survivors)}/{len(candidates)} candidates need LLM check")
+        return rejected, survivors
+    
+    def _validate_without_llm(self, survivors: List[Dict]) -> Dict[str, bool]:
+        """
+        Budget fallback: skip the validation call, keep only high-confidence verdicts
+        
+        Returns:
+            Dict of key → is_valid
+        """
+        print(f"      💸 Session LLM budget exhausted - skipping validation call for {len(survivors)} candidates")
+        verdicts = {}
+        for candidate in survivors:
+            is_valid = candidate.get('confidence', 0.0) >= BUDGET_SKIP_VALIDATION_MIN_CONFIDENCE
+            if not is_valid:
+                print(f"      🔍 Validation SKIPPED [{candidate['key']}]: confidence {candidate.get('confidence', 0.0):.0%} too low without validation")
+            verdicts[candidate['key']] = is_valid
+        return verdicts
+    
+    def _build_validation_request(self, survivors: List[Dict]) -> Tuple[str, str, str, str, int, Dict]:
+        """
+        Build the validation prompt for the surviving candidates
+        
+        A single candidate uses the dedicated single-item prompt; several
+        candidates are combined into one batched prompt.
+        
+        Returns:
+            (system_prompt, prompt, label, log_prefix, max_tokens, response schema)
+        """
+        if len(survivors) == 1:
+            candidate = survivors[0]
+            if candidate['kind'] == "checklist":
+                system_prompt, prompt = self._build_evidence_validation_prompt(
+                    candidate['action'], candidate['evidence'], candidate['reasoning'], candidate['item_type']
+                )
+                return system_prompt, prompt, "evidence validation", "Validation", 150, validation_schema()
+            system_prompt, prompt = self._build_client_field_validation_prompt(
+                candidate['label'], candidate['value'], candidate['evidence']
+            )
+            return system_prompt, prompt, "client field validation", "Client field", 150, validation_schema()
+        
+        system_prompt, prompt = self._build_batch_validation_prompt(survivors)
+        return (system_prompt, prompt, "batch evidence validation", "Validation", 60 + 90 * len(survivors),
+                batch_validation_schema([c['key'] for c in survivors]))
+    
+    def _build_batch_validation_prompt(self, candidates: List[Dict]) -> Tuple[str, str]:
+        """
+        Build one validation prompt covering several candidates
+        
+        Returns:
+            (static system prompt, user message with the candidates)
+        """
+        def build() -> str:
+            discuss_check = self._get_validation_type_check("discuss")
+            say_check = self._get_validation_type_check("say")
+            return f"""You are a STRICT evidence validator for a sales call analysis.
+
+Validate EACH candidate INDEPENDENTLY.
+
+RULES FOR CHECKLIST ACTIONS:
+{discuss_check}
+{say_check}
+CRITICAL CHECKS:
+{EVIDENCE_CRITICAL_CHECKS}
+
+❌ Action: "Ask about child's age" / Evidence: "Oke, selamat datang" → NO semantic connection to age
+❌ Action: "Explain curriculum structure" / Evidence: "Mau tau kurikulum kami?" → Asking, not explaining
+✅ Action: "Ask about child's age" / Evidence: "Anaknya berapa tahun?" → Direct question about age
+
+RULES FOR CLIENT INFORMATION:
+{CLIENT_FIELD_CRITICAL_CHECKS}
+
+✅ "Anaknya bernama Andi" → child name "Andi"
+❌ "Oke, selamat datang, Seki" → child name "Seki" (greeting, not introduction)
+❌ "Kita akan belajar coding hari ini" → parent goal (about lesson, not goal)
+
+BE EXTREMELY STRICT. If there's ANY doubt, mark as invalid.
+
+Return ONLY valid JSON with exactly one entry per candidate key:
+{{
+  "results": [
+    {{
+      "key": "candidate key from the list",
+      "is_valid": true/false,
+      "explanation": "specific reason why evidence does/doesn't prove it"
+    }}
+  ]
+}}
+"""
+        
+        blocks = []
+        for candidate in candidates:
+            if candidate['kind'] == "checklist":
+                blocks.append(
+                    f"- key: {candidate['key']}\n"
+                    f"  kind: checklist action ({candidate['item_type']})\n"
+                    f"  required action: \"{candidate['action']}\"\n"
+                    f"  provided evidence: \"{candidate['evidence']}\"\n"
+                    f"  original reasoning: \"{candidate['reasoning']}\""
+                )
+            else:
+                blocks.append(
+                    f"- key: {candidate['key']}\n"
+                    f"  kind: client information\n"
+                    f"  field: {candidate['label']}\n"
+                    f"  extracted value: \"{candidate['value']}\"\n"
+                    f"  provided evidence: \"{candidate['evidence']}\""
+                )
+        candidates_text = "\n".join(blocks)
+        
+        system_prompt = self._compiled_system_prompt(("batch_validation",), build)
+        return system_prompt, f"""CANDIDATES:
+{candidates_text}
+"""
+    
+    def _parse_validation_batch_response(
+        self,
+        response: str,
+        candidates: List[Dict],
+        label: str,
+        log_prefix: str
+    ) -> Dict[str, bool]:
+        """
+        Map a (single or batched) validation response back to candidate keys
+        
+        Candidates missing from the response are rejected (conservative).
+        """
+        if len(candidates) == 1:
+            return {candidates[0]['key']: self._parse_validation_response(response, label, log_prefix)}
+        
+        try:
+            result = json.loads(response)
+        except json.JSONDecodeError:
+            get_llm_usage_meter().record_parse("validation", ok=False)
+            print(f"   ⚠️ LLM returned invalid JSON for {label}: {response}")
+            return {c['key']: False for c in candidates}
+        
+        # Check if the response was an error from _call_llm
+        if isinstance(result, dict) and "error" in result:
+            # If the API call fails, we can't validate, so be conservative and reject
+            return {c['key']: False for c in candidates}
+        
+        get_llm_usage_meter().record_parse("validation", ok=True)
+        
+        entries = result.get("results", []) if isinstance(result, dict) else result
+        by_key = {
+            str(entry.get("key")): entry
+            for entry in entries
+            if isinstance(entry, dict) and entry.get("key") is not None
+        }
+        
+        verdicts = {}
+        for candidate in candidates:
+            entry = by_key.get(candidate['key'])
+            is_valid = bool(entry and entry.get("is_valid", False))
+            explanation = entry.get("explanation", "") if entry else "no verdict returned"
+            if not is_valid:
+                print(f"      🔍 {log_prefix} REJECTED [{candidate['key']}]: {explanation}")
+            else:
+                print(f"      ✅ {log_prefix} PASSED [{candidate['key']}]: {explanation}")
+            verdicts[candidate['key']] = is_valid
+        return verdicts
+    
+    def _checklist_validation_candidate(self, item: Dict, debug_info: Dict) -> Dict:
+        """Validation candidate for a screened checklist verdict"""
+        return {
+            'key': item['id'],
+            'kind': "checklist",
+            'action': item['content'],
+            'item_type': item['type'],
+            'evidence': debug_info["first_evidence"],
+            'reasoning': debug_info["first_reasoning"],
+            'confidence': debug_info.get("first_confidence", 0.0)
+        }
+    
+    def _client_field_validation_candidate(self, candidate: Dict) -> Dict:
+        """Validation candidate for a screened client card field"""
+        return {
+            'key': f"field:{candidate['field_id']}",
+            'kind': "client_field",
+            'label': candidate['label'],
+            'value': candidate['value'],
+            'evidence': candidate['evidence'],
+            'confidence': candidate['confidence']
+        }
     
     def extract_client_card_fields(
         self,
@@ -432,22 +1032,93 @@ Return ONLY valid JSON:
         if len(conversation_text.strip()) < 200:
             return {}
         
-        # Build field descriptions for LLM
-        field_descriptions = []
-        for field in self.client_card_fields:
-            field_id = field['id']
-            label = field['label']
-            hint = get_extraction_hint(field_id)
-            current = current_values.get(field_id, "")
+        system_prompt, prompt = self._build_client_card_prompt(conversation_text)
+        
+        try:
+            response = self._call_llm(
+                prompt, temperature=0.3, max_tokens=800, system_prompt=system_prompt, call_type="client_card",
+                response_schema=client_card_schema([field['id'] for field in self.client_card_fields])
+            )
+            result = self._parse_llm_json(response, "client card", "client_card")
+            candidates = self._screen_client_card_candidates(result, current_values)
             
-            field_descriptions.append(f"- {field_id} ({label}): {hint}")
+            # Guard 4: Validate evidence relevance (all fields in one call)
+            validations = self.validate_evidence_batch([
+                self._client_field_validation_candidate(c) for c in candidates
+            ])
+            return self._finish_client_card_updates(candidates, validations)
+            
+        except Exception as e:
+            print(f"   ⚠️ Client card extraction failed: {e}")
+            return {}
+    
+    async def extract_client_card_fields_async(
+        self,
+        conversation_text: str,
+        current_values: Dict[str, str]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Awaitable variant of extract_client_card_fields
         
-        fields_str = "\n".join(field_descriptions)
+        Returns:
+            Dict of field_id → {value: str, evidence: str} (only fields with new info)
+        """
+        candidates = await self._collect_client_card_candidates_async(conversation_text, current_values)
         
-        prompt = f"""You are analyzing a sales call in Bahasa Indonesia to extract client information.
-
-Conversation (Bahasa Indonesia):
-{conversation_text}
+        # Guard 4: Validate evidence relevance (all fields in one call)
+        validations = await self.validate_evidence_batch_async([
+            self._client_field_validation_candidate(c) for c in candidates
+        ])
+        return self._finish_client_card_updates(candidates, validations)
+    
+    async def _collect_client_card_candidates_async(
+        self,
+        conversation_text: str,
+        current_values: Dict[str, str]
+    ) -> List[Dict]:
+        """
+        Request client card extraction and run the local guards (no evidence validation)
+        
+        Returns:
+            Candidates whose evidence still needs validation (empty on failure)
+        """
+        # Guard: Skip if conversation too short (need substantial conversation)
+        if len(conversation_text.strip()) < 200:
+            return []
+        
+        system_prompt, prompt = self._build_client_card_prompt(conversation_text)
+        
+        try:
+            response = await self._call_llm_async(
+                prompt, temperature=0.3, max_tokens=800, system_prompt=system_prompt, call_type="client_card",
+                response_schema=client_card_schema([field['id'] for field in self.client_card_fields])
+            )
+            result = self._parse_llm_json(response, "client card", "client_card")
+            return self._screen_client_card_candidates(result, current_values)
+            
+        except Exception as e:
+            print(f"   ⚠️ Client card extraction failed: {e}")
+            return []
+    
+    def _build_client_card_prompt(self, conversation_text: str) -> Tuple[str, str]:
+        """
+        Build the client card extraction prompt
+        
+        Returns:
+            (system prompt compiled once per field configuration, user message with the conversation)
+        """
+        field_key = tuple((field['id'], field['label']) for field in self.client_card_fields)
+        
+        def build() -> str:
+            # Build field descriptions for LLM
+            field_descriptions = []
+            for field_id, label in field_key:
+                hint = get_extraction_hint(field_id)
+                field_descriptions.append(f"- {field_id} ({label}): {hint}")
+            
+            fields_str = "\n".join(field_descriptions)
+            
+            return f"""You are analyzing a sales call in Bahasa Indonesia to extract client information.
 
 Extract information for these fields (only if clearly mentioned):
 {fields_str}
@@ -515,93 +1186,107 @@ Return ONLY valid JSON with confidence:
 If no clear information found, return EMPTY object: {{}}
 """
         
-        try:
-            response = self._call_llm(prompt, temperature=0.3, max_tokens=800)
-            try:
-                result = json.loads(response)
-            except json.JSONDecodeError:
-                print(f"   ⚠️ LLM returned invalid JSON for client card: {response}")
-                raise ValueError(f"LLM returned invalid JSON: {response}")
-
-            # Check if the response was an error from _call_llm
-            if "error" in result:
-                raise requests.exceptions.RequestException(result.get("details", "Unknown API error"))
-
-            # Filter out fields that already have values (don't overwrite unless significantly different)
-            updates = {}
-            for field_id, field_data in result.items():
-                if field_id in current_values and current_values[field_id]:
-                    # Skip if we already have this field filled
-                    continue
-                
-                # Handle both old format (string) and new format (dict with value/evidence)
-                if isinstance(field_data, dict):
-                    value = field_data.get('value', '')
-                    evidence = field_data.get('evidence', '')
-                    confidence = field_data.get('confidence', 1.0)
-                else:
-                    value = str(field_data)
-                    evidence = ''
-                    confidence = 1.0
-                
-                # Guard 0: Reject placeholder values (LLM hallucinations)
-                value_lower = value.lower().strip()
-                placeholder_values = [
-                    "tidak disebutkan",
-                    "not mentioned",
-                    "unknown",
-                    "tidak ada",
-                    "tidak jelas",
-                    "belum disebutkan",
-                    "n/a",
-                    "na",
-                    "-",
-                    "none"
-                ]
-                if value_lower in placeholder_values or any(placeholder in value_lower for placeholder in ["tidak di", "not men", "belum di"]):
-                    print(f"   🚫 Rejected placeholder value for {field_id}: '{value}'")
-                    continue
-                
-                # Guard 1: Value must be substantial
-                if not value or len(value.strip()) <= 5:
-                    continue
-                
-                # Guard 2: Confidence must be high
-                if confidence < 0.7:
-                    print(f"   ⚠️ Low confidence ({confidence:.0%}) for {field_id}, skipping")
-                    continue
-                
-                # Guard 3: Evidence must exist
-                if not evidence or len(evidence.strip()) < 10:
-                    print(f"   ⚠️ Evidence too short for {field_id}, skipping")
-                    continue
-                
-                # Guard 4: Validate evidence relevance
-                # Get field label for validation
-                field_label = next((f['label'] for f in self.client_card_fields if f['id'] == field_id), field_id)
-                
-                validation_passed = self._validate_client_field_evidence(
-                    field_label=field_label,
-                    value=value,
-                    evidence=evidence
-                )
-                
-                if not validation_passed:
-                    print(f"   ⚠️ Evidence validation FAILED for {field_id}")
-                    continue
-                
-                updates[field_id] = {
-                    'value': value.strip(),
-                    'evidence': evidence.strip(),
-                    'confidence': confidence,
-                    'label': field_label
-                }
+        system_prompt = self._compiled_system_prompt(("client_card",) + field_key, build)
+        return system_prompt, f"""Conversation (Bahasa Indonesia):
+{conversation_text}
+"""
+    
+    def _screen_client_card_candidates(
+        self,
+        result: Dict,
+        current_values: Dict[str, str]
+    ) -> List[Dict]:
+        """
+        Run the local guards (no network) on extracted client card fields
+        
+        Args:
+            result: Parsed LLM extraction {field_id: {value, evidence, confidence}}
+            current_values: Current field values (filled fields are skipped)
             
-            return updates
+        Returns:
+            List of {field_id, value, evidence, confidence, label} candidates
+            whose evidence still needs validation
+        """
+        candidates = []
+        # Filter out fields that already have values (don't overwrite unless significantly different)
+        for field_id, field_data in result.items():
+            if field_id in current_values and current_values[field_id]:
+                # Skip if we already have this field filled
+                continue
             
-        except Exception as e:
-            print(f"   ⚠️ Client card extraction failed: {e}")
-            return {}
+            # Handle both old format (string) and new format (dict with value/evidence)
+            if isinstance(field_data, dict):
+                value = field_data.get('value', '')
+                evidence = field_data.get('evidence', '')
+                confidence = field_data.get('confidence', 1.0)
+            else:
+                value = str(field_data)
+                evidence = ''
+                confidence = 1.0
+            
+            # Guard 0: Reject placeholder values (LLM hallucinations)
+            value_lower = value.lower().strip()
+            placeholder_values = [
+                "tidak disebutkan",
+                "not mentioned",
+                "unknown",
+                "tidak ada",
+                "tidak jelas",
+                "belum disebutkan",
+                "n/a",
+                "na",
+                "-",
+                "none"
+            ]
+            if value_lower in placeholder_values or any(placeholder in value_lower for placeholder in ["tidak di", "not men", "belum di"]):
+                print(f"   🚫 Rejected placeholder value for {field_id}: '{value}'")
+                continue
+            
+            # Guard 1: Value must be substantial
+            if not value or len(value.strip()) <= 5:
+                continue
+            
+            # Guard 2: Confidence must be high
+            if confidence < 0.7:
+                print(f"   ⚠️ Low confidence ({confidence:.0%}) for {field_id}, skipping")
+                continue
+            
+            # Guard 3: Evidence must exist
+            if not evidence or len(evidence.strip()) < 10:
+                print(f"   ⚠️ Evidence too short for {field_id}, skipping")
+                continue
+            
+            # Get field label for validation
+            field_label = next((f['label'] for f in self.client_card_fields if f['id'] == field_id), field_id)
+            
+            candidates.append({
+                'field_id': field_id,
+                'value': value,
+                'evidence': evidence,
+                'confidence': confidence,
+                'label': field_label
+            })
+        
+        return candidates
+    
+    def _finish_client_card_updates(self, candidates: List[Dict], validations: Dict[str, bool]) -> Dict[str, Dict]:
+        """Keep candidates whose evidence passed validation"""
+        updates = {}
+        for candidate in candidates:
+            if not validations.get(f"field:{candidate['field_id']}", False):
+                print(f"   ⚠️ Evidence validation FAILED for {candidate['field_id']}")
+                continue
+            updates[candidate['field_id']] = self._client_card_update(candidate)
+        return updates
+    
+    def _client_card_update(self, candidate: Dict) -> Dict:
+        """Build the client card entry for a validated candidate"""
+        return {
+            'value': candidate['value'].strip(),
+            'evidence': candidate['evidence'].strip(),
+            'confidence': candidate['confidence'],
+            'label': candidate['label']
+        }
     
     def _validate_client_field_evidence(
         self,
@@ -621,6 +1306,54 @@ If no clear information found, return EMPTY object: {{}}
         Returns:
             True if evidence is relevant, False if not
         """
+        if not self._prefilter_client_field_evidence(value, evidence):
+            return False
+        
+        system_prompt, validation_prompt = self._build_client_field_validation_prompt(field_label, value, evidence)
+        
+        try:
+            response = self._call_llm(
+                validation_prompt, temperature=0.05, max_tokens=150, system_prompt=system_prompt, call_type="validation",
+                response_schema=validation_schema()
+            )
+            return self._parse_validation_response(response, "client field validation", "Client field")
+            
+        except Exception as e:
+            print(f"   ⚠️ Client field validation error: {e}")
+            # On error, be conservative - reject to avoid false positives
+            return False
+    
+    async def _validate_client_field_evidence_async(
+        self,
+        field_label: str,
+        value: str,
+        evidence: str
+    ) -> bool:
+        """Awaitable variant of _validate_client_field_evidence"""
+        if not self._prefilter_client_field_evidence(value, evidence):
+            return False
+        
+        system_prompt, validation_prompt = self._build_client_field_validation_prompt(field_label, value, evidence)
+        
+        try:
+            response = await self._call_llm_async(
+                validation_prompt, temperature=0.05, max_tokens=150, system_prompt=system_prompt, call_type="validation",
+                response_schema=validation_schema()
+            )
+            return self._parse_validation_response(response, "client field validation", "Client field")
+            
+        except Exception as e:
+            print(f"   ⚠️ Client field validation error: {e}")
+            # On error, be conservative - reject to avoid false positives
+            return False
+    
+    def _prefilter_client_field_evidence(self, value: str, evidence: str) -> bool:
+        """
+        Hard-coded local filters for client field evidence (no network)
+        
+        Returns:
+            False if evidence is obviously invalid, True if it needs LLM validation
+        """
         if not evidence or len(evidence.strip()) < 5:
             return False
         
@@ -665,19 +1398,22 @@ If no clear information found, return EMPTY object: {{}}
                 print(f"      🚫 Client field rejected: Value '{value}' not found in evidence")
                 return False
         
-        validation_prompt = f"""You are a STRICT validator for client information extraction.
-
-FIELD: {field_label}
-EXTRACTED VALUE: "{value}"
-PROVIDED EVIDENCE: "{evidence}"
+        return True
+    
+    def _build_client_field_validation_prompt(self, field_label: str, value: str, evidence: str) -> Tuple[str, str]:
+        """
+        Build the client field evidence validation prompt
+        
+        Returns:
+            (system prompt compiled once per field, user message with value and evidence)
+        """
+        def build() -> str:
+            return f"""You are a STRICT validator for client information extraction.
 
 TASK: Verify that the evidence DIRECTLY AND CLEARLY proves this specific information.
 
 CRITICAL CHECKS:
-1. Is evidence about the CLIENT (child/parent), not about the lesson?
-2. Does evidence explicitly state or strongly imply the extracted value?
-3. Is evidence specific, not just generic conversation?
-4. Is the extracted value actually present (or clearly implied) in the evidence?
+{CLIENT_FIELD_CRITICAL_CHECKS}
 
 SPECIFIC FIELD CHECKS:
 
@@ -708,62 +1444,666 @@ Return ONLY valid JSON:
   "is_valid": true/false,
   "explanation": "specific reason why evidence does/doesn't prove the information"
 }}
+
+FIELD: {field_label}
 """
         
+        system_prompt = self._compiled_system_prompt(("client_field_validation", field_label), build)
+        return system_prompt, f"""EXTRACTED VALUE: "{value}"
+PROVIDED EVIDENCE: "{evidence}"
+"""
+    
+    def batch_check_items(
+        self,
+        items: List[Dict],
+        conversation_text: str
+    ) -> Dict[str, Tuple[bool, float, str, Dict]]:
+        """
+        Check multiple checklist items with a single LLM call
+        
+        All pending items are sent in one structured prompt and the model
+        returns one verdict per item. Each verdict then goes through the same
+        guards as check_checklist_item (confidence >= 0.7, evidence length,
+        evidence validation). Evidence of all accepted verdicts is validated
+        together in one more call.
+        
+        Args:
+            items: List of checklist item dicts ({id, content, type, extended_description})
+            conversation_text: Recent conversation
+            
+        Returns:
+            Dict of item_id → (completed, confidence, evidence, debug_info), in item order
+        """
+        if not items:
+            return {}
+        
+        # Guard: Skip if conversation too short
+        guarded = self._guard_short_context_per_item(items, conversation_text)
+        if guarded is not None:
+            return guarded
+        
+        system_prompt, prompt = self._build_batch_checklist_prompt(items, conversation_text)
+        
+        print(f"   📦 Batch checking {len(items)} items in one LLM call...")
+        
         try:
-            response = self._call_llm(validation_prompt, temperature=0.05, max_tokens=150)
-            try:
-                result = json.loads(response)
-            except json.JSONDecodeError:
-                print(f"   ⚠️ LLM returned invalid JSON for client field validation: {response}")
-                return False
-
-            # Check if the response was an error from _call_llm
-            if "error" in result:
-                # If the API call fails, we can't validate, so be conservative and reject
-                return False
-
-            is_valid = result.get("is_valid", False)
-            explanation = result.get("explanation", "")
+            response = self._call_llm(
+                prompt, temperature=0.2, max_tokens=self._batch_max_tokens(items),
+                system_prompt=system_prompt, call_type="checklist",
+                response_schema=batch_checklist_schema([item['id'] for item in items])
+            )
+            verdicts = self._parse_batch_verdicts(self._parse_llm_json(response, "batch checklist", "checklist"))
+        except Exception as e:
+            return {item['id']: self._checklist_error_result(item, e) for item in items}
+        
+        results, needs_validation = self._screen_batch_verdicts(items, verdicts, conversation_text)
+        validations = self.validate_evidence_batch([
+            self._checklist_validation_candidate(item, debug_info)
+            for item, debug_info in needs_validation
+        ])
+        return self._finish_checklist_results(items, results, needs_validation, validations)
+    
+    async def batch_check_items_async(
+        self,
+        items: List[Dict],
+        conversation_text: str
+    ) -> Dict[str, Tuple[bool, float, str, Dict]]:
+        """
+        Awaitable variant of batch_check_items
+        
+        Returns:
+            Dict of item_id → (completed, confidence, evidence, debug_info), in item order
+        """
+        results, needs_validation = await self._collect_batch_verdicts_async(items, conversation_text)
+        validations = await self.validate_evidence_batch_async([
+            self._checklist_validation_candidate(item, debug_info)
+            for item, debug_info in needs_validation
+        ])
+        return self._finish_checklist_results(items, results, needs_validation, validations)
+    
+    async def check_items_concurrently_async(
+        self,
+        items: List[Dict],
+        conversation_text: str,
+        max_concurrency: int = None,
+        deadline_seconds: float = None
+    ) -> Dict[str, Tuple[bool, float, str, Dict]]:
+        """
+        Check items with one LLM call each, dispatched in parallel
+        
+        At most max_concurrency checks are in flight at once. Checks still
+        running when the cycle deadline expires are cancelled and reported
+        as not completed, so they are retried in a later cycle. Evidence of
+        the accepted verdicts is then validated together in one call.
+        
+        Args:
+            items: Checklist items to evaluate
+            conversation_text: Recent conversation
+            max_concurrency: Parallel request limit (default: CHECKLIST_MAX_CONCURRENCY)
+            deadline_seconds: Cycle deadline (default: CHECKLIST_CYCLE_DEADLINE_SECONDS)
             
-            if not is_valid:
-                print(f"      🔍 Client field REJECTED: {explanation}")
-            else:
-                print(f"      ✅ Client field PASSED: {explanation}")
+        Returns:
+            Dict of item_id → (completed, confidence, evidence, debug_info), in item order
+        """
+        results, needs_validation = await self._collect_concurrent_verdicts_async(
+            items, conversation_text, max_concurrency, deadline_seconds
+        )
+        validations = await self.validate_evidence_batch_async([
+            self._checklist_validation_candidate(item, debug_info)
+            for item, debug_info in needs_validation
+        ])
+        return self._finish_checklist_results(items, results, needs_validation, validations)
+    
+    async def evaluate_checklist_items_async(
+        self,
+        items: List[Dict],
+        conversation_text: str
+    ) -> Dict[str, Tuple[bool, float, str, Dict]]:
+        """
+        Evaluate pending checklist items using the configured CHECKLIST_EVAL_MODE
+        
+        Returns:
+            Dict of item_id → (completed, confidence, evidence, debug_info), in item order
+        """
+        if CHECKLIST_EVAL_MODE == "concurrent":
+            return await self.check_items_concurrently_async(items, conversation_text)
+        return await self.batch_check_items_async(items, conversation_text)
+    
+    async def analyze_cycle_async(
+        self,
+        items: List[Dict],
+        checklist_text: str,
+        client_text: str,
+        current_values: Dict[str, str],
+        deadline: float = None
+    ) -> Tuple[Dict[str, Tuple[bool, float, str, Dict]], Dict[str, Dict[str, str]]]:
+        """
+        Run one live analysis cycle: checklist + client card, one validation pass
+        
+        Checklist verdicts and client card extraction are requested in
+        parallel. Every candidate that passes the local guards - checklist
+        evidence and client field evidence alike - is then validated in a
+        single batched request. With the model cascade configured, checklist
+        verdicts come from the screening model (see _collect_cascade_verdicts_async).
+        
+        When the deadline expires, outstanding requests are cancelled and the
+        cycle returns what it has: items without a final verdict are reported
+        as "deadline_exceeded" (not completed, re-checked next cycle) and
+        unvalidated client fields are dropped. Client card extraction still
+        running once only CYCLE_VALIDATION_RESERVE_RATIO of the time is left
+        is cancelled so the checklist evidence can be validated.
+        
+        Args:
+            items: Checklist items due this cycle
+            checklist_text: Conversation window for checklist checks
+            client_text: Conversation window for client card extraction
+            current_values: Current client card values (filled fields are skipped)
+            deadline: time.monotonic() timestamp to return by (None = no deadline)
+            
+        Returns:
+            (item_id → (completed, confidence, evidence, debug_info), client card updates)
+        """
+        if self.cascade["enabled"]:
+            collect_checklist = self._collect_cascade_verdicts_async(items, checklist_text)
+        elif CHECKLIST_EVAL_MODE == "concurrent":
+            collect_checklist = self._collect_concurrent_verdicts_async(
+                items, checklist_text, deadline_seconds=self._seconds_until(deadline)
+            )
+        else:
+            collect_checklist = self._collect_batch_verdicts_async(items, checklist_text)
+        
+        # Part of the time left is kept for the validation pass; client card
+        # extraction is the first thing given up when the checklist needs it
+        validation_start_by = None
+        if deadline is not None:
+            validation_start_by = deadline - self._seconds_until(deadline) * CYCLE_VALIDATION_RESERVE_RATIO
+        
+        checklist_task = asyncio.create_task(collect_checklist)
+        client_task = asyncio.create_task(self._collect_client_card_candidates_async(client_text, current_values))
+        try:
+            await asyncio.wait({checklist_task, client_task}, timeout=self._seconds_until(validation_start_by))
+            if not client_task.done():
+                client_task.cancel()
+            if not checklist_task.done():
+                await asyncio.wait({checklist_task}, timeout=self._seconds_until(deadline))
+        finally:
+            late = [task for task in (checklist_task, client_task) if not task.done()]
+            for task in late:
+                task.cancel()
+        if late:
+            await asyncio.gather(*late, return_exceptions=True)
+        
+        if checklist_task.cancelled():
+            print(f"   ⏰ Cycle deadline hit: checklist verdicts cancelled")
+            results = {item['id']: self._deadline_result("checklist") for item in items}
+            needs_validation = []
+        else:
+            results, needs_validation = checklist_task.result()
+        if client_task.cancelled():
+            print(f"   ⏰ Cycle deadline hit: client card extraction cancelled")
+            client_candidates = []
+        else:
+            client_candidates = client_task.result()
+        
+        if not needs_validation and not client_candidates:
+            return self._finish_checklist_results(items, results, [], {}), {}
+        
+        started = time.monotonic()
+        try:
+            validations = await asyncio.wait_for(
+                self.validate_evidence_batch_async(
+                    [self._checklist_validation_candidate(item, debug_info) for item, debug_info in needs_validation]
+                    + [self._client_field_validation_candidate(c) for c in client_candidates]
+                ),
+                timeout=self._seconds_until(deadline)
+            )
+        except asyncio.TimeoutError:
+            print(f"   ⏰ Cycle deadline hit: evidence validation cancelled "
+                  f"({len(needs_validation)} items carried over, {len(client_candidates)} fields dropped)")
+            results.update({item['id']: self._deadline_result("validation") for item, _ in needs_validation})
+            return {item['id']: results[item['id']] for item in items}, {}
+        
+        if self.cascade["enabled"] and needs_validation:
+            self.cascade_stats.record_tier("validation", time.monotonic() - started)
+            if self.cascade["confirm"] != CASCADE_CONFIRM_RECHECK:
+                for item, debug_info in needs_validation:
+                    self.cascade_stats.record_confirmation(
+                        debug_info["cascade_screen_confidence"], validations.get(item['id'], False)
+                    )
+        
+        checklist_results = self._finish_checklist_results(items, results, needs_validation, validations)
+        client_updates = self._finish_client_card_updates(client_candidates, validations)
+        return checklist_results, client_updates
+    
+    def _seconds_until(self, deadline: Optional[float]) -> Optional[float]:
+        """Time left until a time.monotonic() deadline (None = no deadline)"""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+    
+    def _deadline_result(self, phase: str, deadline_seconds: float = None) -> Tuple[bool, float, str, Dict]:
+        """Result for an item whose check was cancelled by the cycle deadline (re-checked next cycle)"""
+        debug_info = {
+            "stage": "deadline_exceeded",
+            "phase": phase
+        }
+        if deadline_seconds is not None:
+            debug_info["deadline_seconds"] = deadline_seconds
+        return False, 0.0, "Cycle deadline exceeded", debug_info
+    
+    async def _collect_batch_verdicts_async(
+        self,
+        items: List[Dict],
+        conversation_text: str
+    ) -> Tuple[Dict[str, Tuple[bool, float, str, Dict]], List[Tuple[Dict, Dict]]]:
+        """
+        Request batched checklist verdicts and run the local guards
+        
+        Returns:
+            (item_id → final result for items decided locally,
+             [(item, debug_info)] for verdicts whose evidence needs validation)
+        """
+        if not items:
+            return {}, []
+        
+        # Guard: Skip if conversation too short
+        guarded = self._guard_short_context_per_item(items, conversation_text)
+        if guarded is not None:
+            return guarded, []
+        
+        try:
+            verdicts = await self._request_batch_verdicts_async(items, conversation_text)
+        except Exception as e:
+            return {item['id']: self._checklist_error_result(item, e) for item in items}, []
+        
+        return self._screen_batch_verdicts(items, verdicts, conversation_text)
+    
+    async def _request_batch_verdicts_async(
+        self,
+        items: List[Dict],
+        conversation_text: str,
+        call_type: str = "checklist"
+    ) -> Dict[str, Dict]:
+        """
+        Request raw batched checklist verdicts (no guards applied)
+        
+        Args:
+            items: Checklist items to judge
+            conversation_text: Conversation window
+            call_type: "checklist", or "checklist_screen" for the cascade's screening model
             
-            return is_valid
+        Returns:
+            item_id → raw verdict
             
+        Raises:
+            Exception: On API errors and unparseable responses
+        """
+        system_prompt, prompt = self._build_batch_checklist_prompt(items, conversation_text)
+        
+        print(f"   📦 Batch checking {len(items)} items in one LLM call ({self._model_for(call_type)})...")
+        
+        schema = batch_checklist_schema([item['id'] for item in items])
+        if LLM_STREAM_RESPONSES:
+            # Return as soon as every requested item has its verdict object
+            item_ids = {item['id'] for item in items}
+            response = await self._stream_llm_async(
+                prompt, temperature=0.2, max_tokens=self._batch_max_tokens(items),
+                system_prompt=system_prompt, call_type=call_type, response_schema=schema,
+                stop=lambda parser: item_ids <= {
+                    entry.get("id") for entry in parser.items.get("items", []) if isinstance(entry, dict)
+                }
+            )
+        else:
+            response = await self._call_llm_async(
+                prompt, temperature=0.2, max_tokens=self._batch_max_tokens(items),
+                system_prompt=system_prompt, call_type=call_type, response_schema=schema
+            )
+        return self._parse_batch_verdicts(self._parse_llm_json(response, f"batch {call_type}", call_type))
+    
+    async def _collect_cascade_verdicts_async(
+        self,
+        items: List[Dict],
+        conversation_text: str
+    ) -> Tuple[Dict[str, Tuple[bool, float, str, Dict]], List[Tuple[Dict, Dict]]]:
+        """
+        Screen all items with the cheap model; confirm only its confident positives
+        
+        Screening verdicts that are not completed, or completed below
+        LLM_CASCADE_MIN_CONFIDENCE, are final. Positives go to the validation
+        pass directly, or are first re-checked by the "checklist" model
+        (LLM_CASCADE_CONFIRM=recheck).
+        
+        Returns:
+            Same shape as _collect_batch_verdicts_async
+        """
+        if not items:
+            return {}, []
+        
+        # Guard: Skip if conversation too short
+        guarded = self._guard_short_context_per_item(items, conversation_text)
+        if guarded is not None:
+            return guarded, []
+        
+        started = time.monotonic()
+        try:
+            verdicts = await self._request_batch_verdicts_async(items, conversation_text, call_type="checklist_screen")
         except Exception as e:
-            print(f"   ⚠️ Client field validation error: {e}")
-            # On error, be conservative - reject to avoid false positives
-            return False
+            return {item['id']: self._checklist_error_result(item, e) for item in items}, []
+        screen_seconds = time.monotonic() - started
+        self.cascade_stats.record_tier("screen", screen_seconds)
+        
+        results = {}
+        positives = []
+        negatives = []
+        for item in items:
+            verdict = verdicts.get(item['id'])
+            if verdict is None:
+                results[item['id']] = self._batch_missing_result(conversation_text)
+                continue
+            
+            if verdict.get("completed") and self._verdict_confidence(verdict) >= self.cascade["min_confidence"]:
+                positives.append(item)
+                continue
+            
+            decided, debug_info = self._screen_checklist_verdict(item, {**verdict, "completed": False}, conversation_text)
+            debug_info["cascade_tier"] = "screen"
+            debug_info["screen_completed"] = bool(verdict.get("completed"))
+            results[item['id']] = decided
+            negatives.append(item)
+        
+        self.cascade_stats.record_screen(len(items), len(positives))
+        print(f"   🪜 Cascade screen: {len(positives)}/{len(items)} positives forwarded ({screen_seconds * 1000:.0f}ms)")
+        
+        if negatives and self._should_audit_cascade():
+            self._start_background_task(self._audit_cascade_negatives_async(negatives, conversation_text))
+        
+        if not positives:
+            return results, []
+        
+        screen_confidence = {item['id']: self._verdict_confidence(verdicts[item['id']]) for item in positives}
+        confirm_verdicts = verdicts
+        if self.cascade["confirm"] == CASCADE_CONFIRM_RECHECK:
+            started = time.monotonic()
+            try:
+                confirm_verdicts = await self._request_batch_verdicts_async(positives, conversation_text)
+            except Exception as e:
+                results.update({item['id']: self._checklist_error_result(item, e) for item in positives})
+                return results, []
+            self.cascade_stats.record_tier("recheck", time.monotonic() - started)
+            for item in positives:
+                self.cascade_stats.record_confirmation(
+                    screen_confidence[item['id']], bool(confirm_verdicts.get(item['id'], {}).get("completed"))
+                )
+        
+        confirmed, needs_validation = self._screen_batch_verdicts(positives, confirm_verdicts, conversation_text)
+        for item_id, result in confirmed.items():
+            result[3]["cascade_tier"] = self.cascade["confirm"]
+            if self.cascade["confirm"] != CASCADE_CONFIRM_RECHECK:
+                # Rejected by the local guards before reaching validation
+                self.cascade_stats.record_confirmation(screen_confidence[item_id], False)
+        for item, debug_info in needs_validation:
+            debug_info["cascade_tier"] = self.cascade["confirm"]
+            debug_info["cascade_screen_confidence"] = screen_confidence[item['id']]
+        
+        results.update(confirmed)
+        return results, needs_validation
     
-    def batch_check_items(
+    def _verdict_confidence(self, verdict: Dict) -> float:
+        """Numeric confidence of a raw verdict (0.0 if missing or malformed)"""
+        try:
+            return float(verdict.get("confidence") or 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+    
+    def _should_audit_cascade(self) -> bool:
+        """Sample cycles for a background re-check of screen negatives (never over budget)"""
+        return (
+            self.cascade["audit_rate"] > 0
+            and random.random() < self.cascade["audit_rate"]
+            and get_llm_usage_meter().budget_level() == BUDGET_NORMAL
+        )
+    
+    async def _audit_cascade_negatives_async(self, items: List[Dict], conversation_text: str):
+        """Re-check screen negatives with the "checklist" model to measure what the screen misses"""
+        started = time.monotonic()
+        try:
+            verdicts = await self._request_batch_verdicts_async(items, conversation_text)
+        except Exception as e:
+            print(f"   ⚠️ Cascade audit failed: {e}")
+            return
+        self.cascade_stats.record_tier("audit", time.monotonic() - started)
+        
+        missed = sum(
+            1 for item in items
+            if verdicts.get(item['id'], {}).get("completed")
+            and self._verdict_confidence(verdicts[item['id']]) >= self.cascade["min_confidence"]
+        )
+        self.cascade_stats.record_audit(len(items), missed)
+        if missed:
+            print(f"   🪜 Cascade audit: screen missed {missed}/{len(items)} items")
+    
+    def _start_background_task(self, coroutine) -> asyncio.Task:
+        """Run a coroutine the caller does not wait for (cancelled on aclose)"""
+        task = asyncio.create_task(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def _collect_concurrent_verdicts_async(
         self,
         items: List[Dict],
+        conversation_text: str,
+        max_concurrency: int = None,
+        deadline_seconds: float = None
+    ) -> Tuple[Dict[str, Tuple[bool, float, str, Dict]], List[Tuple[Dict, Dict]]]:
+        """
+        Request one verdict per item in parallel (bounded, with deadline) and run the local guards
+        
+        Returns:
+            (item_id → final result for items decided locally,
+             [(item, debug_info)] for verdicts whose evidence needs validation)
+        """
+        if not items:
+            return {}, []
+        
+        max_concurrency = max_concurrency or CHECKLIST_MAX_CONCURRENCY
+        if deadline_seconds is None:
+            deadline_seconds = CHECKLIST_CYCLE_DEADLINE_SECONDS
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def screen_one(item: Dict):
+            async with semaphore:
+                return await self._screen_checklist_item_async(item, conversation_text)
+        
+        print(f"   🔀 Checking {len(items)} items concurrently (limit {max_concurrency}, deadline {deadline_seconds:.0f}s)...")
+        
+        tasks = {item['id']: asyncio.create_task(screen_one(item)) for item in items}
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline_seconds)
+        
+        for task in pending:
+            task.cancel()
+        if pending:
+            print(f"   ⏰ Cycle deadline hit: {len(pending)} checks cancelled")
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        results = {}
+        needs_validation = []
+        for item in items:
+            task = tasks[item['id']]
+            if task in done and not task.cancelled() and task.exception() is None:
+                decided, debug_info = task.result()
+                if decided is not None:
+                    results[item['id']] = decided
+                else:
+                    needs_validation.append((item, debug_info))
+            elif task in done and not task.cancelled():
+                results[item['id']] = self._checklist_error_result(item, task.exception())
+            else:
+                results[item['id']] = self._deadline_result("checklist", deadline_seconds)
+        
+        return results, needs_validation
+    
+    async def _screen_checklist_item_async(
+        self,
+        item: Dict,
         conversation_text: str
-    ) -> Dict[str, Tuple[bool, float, str]]:
+    ) -> Tuple[Optional[Tuple[bool, float, str, Dict]], Dict]:
+        """
+        Single-item checklist call plus local guards (no evidence validation)
+        
+        Returns:
+            (final result or None, debug_info) - see _screen_checklist_verdict
+        """
+        guard_result = self._guard_short_context(conversation_text)
+        if guard_result is not None:
+            return guard_result, guard_result[3]
+        
+        system_prompt, prompt = self._build_checklist_prompt(item, conversation_text)
+        
+        try:
+            response = await self._call_llm_async(
+                prompt, temperature=0.2, max_tokens=200, system_prompt=system_prompt, call_type="checklist",
+                response_schema=checklist_item_schema()
+            )
+            result = self._parse_llm_json(response, "checklist item", "checklist")
+            return self._screen_checklist_verdict(item, result, conversation_text)
+        except Exception as e:
+            error_result = self._checklist_error_result(item, e)
+            return error_result, error_result[3]
+    
+    def _screen_batch_verdicts(
+        self,
+        items: List[Dict],
+        verdicts: Dict[str, Dict],
+        conversation_text: str
+    ) -> Tuple[Dict[str, Tuple[bool, float, str, Dict]], List[Tuple[Dict, Dict]]]:
+        """Run the local guards on every verdict of a batched response"""
+        results = {}
+        needs_validation = []
+        for item in items:
+            verdict = verdicts.get(item['id'])
+            if verdict is None:
+                results[item['id']] = self._batch_missing_result(conversation_text)
+                continue
+            
+            decided, debug_info = self._screen_checklist_verdict(item, verdict, conversation_text)
+            debug_info["batch_size"] = len(items)
+            if decided is not None:
+                results[item['id']] = decided
+            else:
+                needs_validation.append((item, debug_info))
+        
+        return results, needs_validation
+    
+    def _finish_checklist_results(
+        self,
+        items: List[Dict],
+        results: Dict[str, Tuple[bool, float, str, Dict]],
+        needs_validation: List[Tuple[Dict, Dict]],
+        validations: Dict[str, bool]
+    ) -> Dict[str, Tuple[bool, float, str, Dict]]:
+        """Apply evidence validation verdicts and return results in item order"""
+        for item, debug_info in needs_validation:
+            validation_passed = validations.get(item['id'], False)
+            results[item['id']] = self._finalize_checklist_verdict(item, debug_info, validation_passed)
+        
+        return {item['id']: results[item['id']] for item in items}
+    
+    def _batch_max_tokens(self, items: List[Dict]) -> int:
+        """Output token budget for a batched checklist call (~120 tokens per verdict plus JSON overhead)"""
+        return 100 + 120 * len(items)
+    
+    def _batch_missing_result(self, conversation_text: str) -> Tuple[bool, float, str, Dict]:
+        """Result for an item the batched response did not include"""
+        debug_info = {
+            "stage": "batch_missing_item",
+            "context_preview": conversation_text[-200:]
+        }
+        return False, 0.0, "No verdict returned", debug_info
+    
+    def _build_batch_checklist_prompt(self, items: List[Dict], conversation_text: str) -> Tuple[str, str]:
         """
-        Batch check multiple items at once (more efficient)
+        Build a single prompt that asks for a verdict on every item
         
         Args:
-            items: List of {id, content, type} dicts
+            items: Checklist items to evaluate
             conversation_text: Recent conversation
             
         Returns:
-            Dict of item_id → (completed, confidence, evidence)
+            (static system prompt, user message with the items and the conversation)
         """
-        # For now, check items individually
-        # TODO: Could optimize with a single LLM call for multiple items
-        results = {}
-        for item in items:
-            completed, confidence, evidence, debug_info = self.check_checklist_item(
-                item,
-                conversation_text
+        def build() -> str:
+            discuss_rules = self._get_checklist_type_instructions("discuss")
+            say_rules = self._get_checklist_type_instructions("say")
+            return f"""You are a STRICT quality checker analyzing a sales call in Bahasa Indonesia.
+
+TASK: For EACH action in the list, check if it was completed in the conversation.
+Judge every action INDEPENDENTLY. The same quote must not be used as evidence for different actions.
+{discuss_rules}
+{say_rules}
+{CHECKLIST_VALIDATION_RULES}
+
+Return ONLY valid JSON with exactly one entry per action id:
+{{
+  "items": [
+    {{
+      "id": "action id from the list",
+      "completed": true/false,
+      "confidence": 0.0-1.0,
+      "evidence": "exact quote showing action (empty if not completed)",
+      "reasoning": "WHY this evidence proves (or doesn't prove) the action"
+    }}
+  ]
+}}
+"""
+        
+        items_text = "\n".join(self._batch_item_block(item) for item in items)
+        
+        system_prompt = self._compiled_system_prompt(("batch_checklist",), build)
+        return system_prompt, f"""Actions to check:
+{items_text}
+
+Recent conversation (Bahasa Indonesia):
+{conversation_text}
+"""
+    
+    def _batch_item_block(self, item: Dict) -> str:
+        """Action entry for the batched checklist prompt (compiled once per item)"""
+        extended_description = item.get('extended_description', '')
+        return self._compiled_system_prompt(
+            ("batch_item", item['id'], item['type'], item['content'], extended_description),
+            lambda: (
+                f"- id: {item['id']}\n"
+                f"  type: {item['type']}\n"
+                f"  action: \"{item['content']}\"\n"
+                f"  context: {extended_description}"
             )
-            results[item['id']] = (completed, confidence, evidence)
+        )
+    
+    def _parse_batch_verdicts(self, result) -> Dict[str, Dict]:
+        """
+        Normalize a batched checklist response into item_id → verdict
+        
+        Accepts {"items": [...]}, a bare list, or an {item_id: verdict} mapping.
+        """
+        if isinstance(result, dict) and isinstance(result.get("items"), list):
+            entries = result["items"]
+        elif isinstance(result, list):
+            entries = result
+        elif isinstance(result, dict):
+            entries = [
+                {"id": item_id, **verdict}
+                for item_id, verdict in result.items()
+                if isinstance(verdict, dict)
+            ]
+        else:
+            raise ValueError(f"Unexpected batch response shape: {type(result).__name__}")
         
-        return results
+        verdicts = {}
+        for entry in entries:
+            if isinstance(entry, dict) and entry.get("id"):
+                verdicts[entry["id"]] = entry
+        return verdicts
     
     def detect_current_stage(
         self,
@@ -787,31 +2127,99 @@ Return ONLY valid JSON:
             # At start, assume first stage
             return stages[0]['id'] if stages else '', 0.5
         
-        # Build stage descriptions for LLM
-        stage_descriptions = []
-        for i, stage in enumerate(stages):
-            items_summary = []
-            for item in stage['items'][:3]:  # First 3 items as examples
-                items_summary.append(f"- {item['content']}")
-            items_text = "\n".join(items_summary)
-            if len(stage['items']) > 3:
-                items_text += f"\n- ...and {len(stage['items']) - 3} more"
-            
-            recommended_time = f"{stage['startOffsetSeconds']//60}-{(stage['startOffsetSeconds'] + stage['durationSeconds'])//60} min"
-            
-            stage_descriptions.append(
-                f"{i+1}. **{stage['name']}** (recommended: {recommended_time})\n"
-                f"   Focus: {items_text}"
+        # OpenRouter down: don't wait for a request that would fail anyway
+        if not self.is_llm_available():
+            return self._fallback_stage_by_time(stages, call_elapsed_seconds)
+        
+        system_prompt, prompt = self._build_stage_prompt(conversation_text, stages, call_elapsed_seconds)
+        
+        try:
+            response = self._call_llm(
+                prompt, temperature=0.2, max_tokens=200, system_prompt=system_prompt, call_type="stage",
+                response_schema=stage_schema([stage['id'] for stage in stages])
             )
+            result = self._parse_llm_json(response, "stage detection", "stage")
+            return self._parse_stage_result(result, stages)
+            
+        except Exception as e:
+            print(f"   ⚠️ Stage detection failed: {e}")
+            # Fallback to time-based detection
+            return self._fallback_stage_by_time(stages, call_elapsed_seconds)
+    
+    async def detect_current_stage_async(
+        self,
+        conversation_text: str,
+        stages: List[Dict],
+        call_elapsed_seconds: int
+    ) -> Tuple[str, float]:
+        """
+        Awaitable variant of detect_current_stage
         
-        stages_text = "\n\n".join(stage_descriptions)
+        Returns:
+            (stage_id: str, confidence: float)
+        """
+        # Guard: Skip if conversation too short
+        if len(conversation_text.strip()) < 100:
+            # At start, assume first stage
+            return stages[0]['id'] if stages else '', 0.5
         
-        prompt = f"""You are analyzing a sales call in Bahasa Indonesia to determine the current stage.
-
-Call elapsed time: {call_elapsed_seconds // 60} minutes {call_elapsed_seconds % 60} seconds (reference only)
-
-Recent conversation:
-{conversation_text}
+        # OpenRouter down: don't wait for a request that would fail anyway
+        if not self.is_llm_available():
+            return self._fallback_stage_by_time(stages, call_elapsed_seconds)
+        
+        system_prompt, prompt = self._build_stage_prompt(conversation_text, stages, call_elapsed_seconds)
+        
+        schema = stage_schema([stage['id'] for stage in stages])
+        
+        try:
+            if LLM_STREAM_RESPONSES:
+                # The reasoning that follows stage_id/confidence is not needed to act
+                response = await self._stream_llm_async(
+                    prompt, temperature=0.2, max_tokens=200, system_prompt=system_prompt, call_type="stage",
+                    response_schema=schema,
+                    stop=lambda parser: "stage_id" in parser.fields and "confidence" in parser.fields
+                )
+            else:
+                response = await self._call_llm_async(
+                    prompt, temperature=0.2, max_tokens=200, system_prompt=system_prompt, call_type="stage",
+                    response_schema=schema
+                )
+            result = self._parse_llm_json(response, "stage detection", "stage")
+            return self._parse_stage_result(result, stages)
+            
+        except Exception as e:
+            print(f"   ⚠️ Stage detection failed: {e}")
+            # Fallback to time-based detection
+            return self._fallback_stage_by_time(stages, call_elapsed_seconds)
+    
+    def _build_stage_prompt(self, conversation_text: str, stages: List[Dict], call_elapsed_seconds: int) -> Tuple[str, str]:
+        """
+        Build the stage detection prompt
+        
+        Returns:
+            (system prompt compiled once per call structure, user message with time and conversation)
+        """
+        def build() -> str:
+            # Build stage descriptions for LLM
+            stage_descriptions = []
+            for i, stage in enumerate(stages):
+                items_summary = []
+                for item in stage['items'][:3]:  # First 3 items as examples
+                    items_summary.append(f"- {item['content']}")
+                items_text = "\n".join(items_summary)
+                if len(stage['items']) > 3:
+                    items_text += f"\n- ...and {len(stage['items']) - 3} more"
+                
+                recommended_time = f"{stage['startOffsetSeconds']//60}-{(stage['startOffsetSeconds'] + stage['durationSeconds'])//60} min"
+                
+                stage_descriptions.append(
+                    f"{i+1}. **{stage['name']}** (stage_id: {stage['id']}, recommended: {recommended_time})\n"
+                    f"   Focus: {items_text}"
+                )
+            
+            stages_text = "\n\n".join(stage_descriptions)
+            
+            return f"""You are analyzing a sales call in Bahasa Indonesia to determine the current stage.
 
 Available stages:
 {stages_text}
@@ -833,94 +2241,547 @@ Return ONLY valid JSON:
 }}
 """
         
-        try:
-            response = self._call_llm(prompt, temperature=0.2, max_tokens=200)
-            try:
-                result = json.loads(response)
-            except json.JSONDecodeError:
-                print(f"   ⚠️ LLM returned invalid JSON for stage detection: {response}")
-                raise ValueError(f"LLM returned invalid JSON: {response}")
-
-            # Check if the response was an error from _call_llm
-            if "error" in result:
-                raise requests.exceptions.RequestException(result.get("details", "Unknown API error"))
+        stage_key = tuple(
+            (stage['id'], stage['name'], stage['startOffsetSeconds'], stage['durationSeconds'],
+             tuple(item['content'] for item in stage['items']))
+            for stage in stages
+        )
+        system_prompt = self._compiled_system_prompt(("stage_detection",) + stage_key, build)
+        return system_prompt, f"""Call elapsed time: {call_elapsed_seconds // 60} minutes {call_elapsed_seconds % 60} seconds (reference only)
 
-            stage_id = result.get("stage_id", "")
-            confidence = result.get("confidence", 0.0)
-            
-            # Validate stage_id exists
-            valid_ids = [s['id'] for s in stages]
-            if stage_id not in valid_ids:
-                print(f"   ⚠️ Invalid stage_id '{stage_id}', using first stage")
-                return stages[0]['id'] if stages else '', 0.5
-            
-            return stage_id, confidence
-            
-        except Exception as e:
-            print(f"   ⚠️ Stage detection failed: {e}")
-            # Fallback to time-based detection
-            for stage in stages:
-                start = stage['startOffsetSeconds']
-                end = start + stage['durationSeconds']
-                if start <= call_elapsed_seconds < end:
-                    return stage['id'], 0.3  # Low confidence = fallback
-            return stages[0]['id'] if stages else '', 0.3
+Recent conversation:
+{conversation_text}
+"""
+    
+    def _parse_stage_result(self, result: Dict, stages: List[Dict]) -> Tuple[str, float]:
+        """Validate a stage detection verdict against the known stages"""
+        stage_id = result.get("stage_id", "")
+        confidence = result.get("confidence", 0.0)
+        
+        # Validate stage_id exists
+        valid_ids = [s['id'] for s in stages]
+        if stage_id not in valid_ids:
+            print(f"   ⚠️ Invalid stage_id '{stage_id}', using first stage")
+            return stages[0]['id'] if stages else '', 0.5
+        
+        return stage_id, confidence
     
-    def _call_llm(self, prompt: str, temperature: float = 0.5, max_tokens: int = 500) -> str:
+    def _fallback_stage_by_time(self, stages: List[Dict], call_elapsed_seconds: int) -> Tuple[str, float]:
+        """Time-based stage detection used when the LLM is unavailable"""
+        for stage in stages:
+            start = stage['startOffsetSeconds']
+            end = start + stage['durationSeconds']
+            if start <= call_elapsed_seconds < end:
+                return stage['id'], 0.3  # Low confidence = fallback
+        return stages[0]['id'] if stages else '', 0.3
+    
+    def _call_llm(
+        self,
+        prompt: str,
+        temperature: float = 0.5,
+        max_tokens: int = 500,
+        system_prompt: str = None,
+        call_type: str = "other",
+        response_schema: Dict = None
+    ) -> str:
         """
-        Call OpenRouter API
+        Call OpenRouter API (blocking)
         
         Args:
-            prompt: The prompt
+            prompt: The per-call user message
             temperature: Creativity level
             max_tokens: Max response length
+            system_prompt: Static instructions sent first (cacheable prefix)
+            call_type: Usage meter bucket ("checklist", "validation", "client_card", "stage")
+            response_schema: Expected output shape (llm_response_schemas), sent as response_format
             
         Returns:
             LLM response text
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        payload = self._build_llm_payload(
+            prompt, temperature, max_tokens, system_prompt, self._model_for(call_type), response_schema
+        )
+        cache_key = self._cache_key(payload)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            get_llm_usage_meter().record(call_type, cache_hit=True)
+            return cached
         
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": temperature,
-            "max_tokens": max_tokens
-        }
+        if not self.circuit_breaker.allow_request():
+            return self._llm_error_response(CircuitOpenError("LLM circuit open - failing fast"))
         
         try:
-            response = requests.post(
+            response = self._get_http_session().post(
                 self.api_url,
-                headers=headers,
                 json=payload,
-                timeout=30
+                timeout=LLM_TIMEOUT_SECONDS
             )
             response.raise_for_status()
             data = response.json()
         except requests.exceptions.RequestException as e:
             print(f"   🚨 LLM API call failed: {e}")
+            self._record_transport_error(e)
+            get_llm_usage_meter().record(call_type, failed=True)
+            if self._reject_json_schema(payload, e):
+                return self._call_llm(prompt, temperature, max_tokens, system_prompt, call_type, response_schema)
             # Return a JSON string that indicates an error
-            return json.dumps({
-                "error": "API call failed",
-                "details": str(e)
+            return self._llm_error_response(e)
+        
+        content = self._completion_content(data, call_type)
+        if content is None:
+            return self._llm_error_response(ValueError("Malformed completion: no choices[0].message.content"))
+        self._store_in_cache(cache_key, content)
+        return content
+    
+    async def _call_llm_async(
+        self,
+        prompt: str,
+        temperature: float = 0.5,
+        max_tokens: int = 500,
+        system_prompt: str = None,
+        call_type: str = "other",
+        response_schema: Dict = None
+    ) -> str:
+        """
+        Call OpenRouter API without blocking the event loop
+        
+        Uses a pooled keep-alive httpx client shared by all async calls.
+        Call types listed in LLM_HEDGE_CALL_TYPES are hedged (see _post_llm_async).
+        A call whose prompt fingerprint matches a request still in flight
+        awaits that request instead of sending another one.
+        
+        Args:
+            prompt: The per-call user message
+            temperature: Creativity level
+            max_tokens: Max response length
+            system_prompt: Static instructions sent first (cacheable prefix)
+            call_type: Usage meter bucket ("checklist", "validation", "client_card", "stage")
+            response_schema: Expected output shape (llm_response_schemas), sent as response_format
+            
+        Returns:
+            LLM response text (or the JSON error sentinel)
+        """
+        payload = self._build_llm_payload(
+            prompt, temperature, max_tokens, system_prompt, self._model_for(call_type), response_schema
+        )
+        cache_key = self._cache_key(payload)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            get_llm_usage_meter().record(call_type, cache_hit=True)
+            return cached
+        
+        content, shared = await self.single_flight.do(
+            cache_key, lambda: self._request_llm_async(payload, call_type, cache_key)
+        )
+        if shared:
+            get_llm_usage_meter().record(call_type, coalesced=True)
+        return content
+    
+    async def _request_llm_async(self, payload: Dict, call_type: str, cache_key: str) -> str:
+        """
+        Send one completion request through the circuit breaker and cache the answer
+        
+        Returns:
+            LLM response text (or the JSON error sentinel)
+        """
+        if not self.circuit_breaker.allow_request():
+            return self._llm_error_response(CircuitOpenError("LLM circuit open - failing fast"))
+        
+        try:
+            data = await self._post_llm_async(payload, call_type)
+        except asyncio.CancelledError:
+            # Cycle deadline cancelled us - not a verdict on the service
+            self.circuit_breaker.record_cancelled()
+            raise
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"   🚨 LLM API call failed: {e!r}")
+            self._record_transport_error(e)
+            get_llm_usage_meter().record(call_type, failed=True)
+            if self._reject_json_schema(payload, e):
+                return await self._request_llm_async(
+                    {**payload, "response_format": {"type": RESPONSE_FORMAT_JSON_OBJECT}}, call_type, cache_key
+                )
+            return self._llm_error_response(e)
+        
+        content = self._completion_content(data, call_type)
+        if content is None:
+            return self._llm_error_response(ValueError("Malformed completion: no choices[0].message.content"))
+        self._store_in_cache(cache_key, content)
+        return content
+    
+    async def _post_llm_async(self, payload: Dict, call_type: str) -> Dict:
+        """
+        Send a completion request, hedging it if the call type is latency-critical
+        
+        If no answer arrived after the rolling p90 latency of this call type,
+        a duplicate request is fired and the first successful answer wins;
+        the other request is cancelled and counted as wasted. One latency
+        sample is recorded per logical request, from the primary's start until
+        the answer (or the failure / cancellation), so slow requests that lost
+        to a hedge still count towards the p90.
+        
+        Returns:
+            Parsed completion response
+        """
+        self.hedging.record_request(call_type)
+        started = time.monotonic()
+        try:
+            return await self._hedge_llm_request_async(payload, call_type)
+        finally:
+            self.hedging.record_latency(call_type, time.monotonic() - started)
+    
+    async def _hedge_llm_request_async(self, payload: Dict, call_type: str) -> Dict:
+        """Primary request plus, past the hedge delay, a duplicate; first success wins"""
+        delay = self.hedging.hedge_delay(call_type)
+        if delay is None:
+            return await self._send_llm_request_async(payload)
+        
+        primary = asyncio.create_task(self._send_llm_request_async(payload))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if primary in done:
+                return primary.result()
+            
+            print(f"   🏁 {call_type} request slower than p90 ({delay * 1000:.0f}ms) - hedging")
+            hedge = asyncio.create_task(self._send_llm_request_async(payload))
+            tasks.append(hedge)
+            
+            pending = set(tasks)
+            first_error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.hedging.record_hedge(call_type, hedge_won=task is hedge)
+                        return task.result()
+                    first_error = first_error or task.exception()
+            
+            self.hedging.record_hedge(call_type, hedge_won=False)
+            raise first_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _send_llm_request_async(self, payload: Dict) -> Dict:
+        """POST one completion request"""
+        response = await self._get_async_client().post(self.api_url, json=payload)
+        response.raise_for_status()
+        return response.json()
+    
+    async def _stream_llm_async(
+        self,
+        prompt: str,
+        temperature: float = 0.5,
+        max_tokens: int = 500,
+        system_prompt: str = None,
+        call_type: str = "other",
+        response_schema: Dict = None,
+        on_event=None,
+        stop=None
+    ) -> str:
+        """
+        Call OpenRouter API with a streamed (SSE) response
+        
+        Content deltas are fed into an IncrementalJSONParser as they arrive.
+        Once `stop(parser)` returns True the caller gets the fields parsed so
+        far (as a JSON string) right away; the rest of the stream is read in
+        the background so usage is still metered and the full response cached.
+        Streamed calls are not hedged.
+        
+        Args:
+            prompt: The per-call user message
+            temperature: Creativity level
+            max_tokens: Max response length
+            system_prompt: Static instructions sent first (cacheable prefix)
+            call_type: Usage meter bucket ("checklist", "validation", "client_card", "stage")
+            response_schema: Expected output shape (llm_response_schemas), sent as response_format
+            on_event: Called with each parser event (kind, key, value) as it completes
+            stop: Called with the parser after every delta; True returns early
+            
+        Returns:
+            LLM response text, the partial JSON on early return, or the JSON error sentinel
+        """
+        payload = self._build_llm_payload(
+            prompt, temperature, max_tokens, system_prompt, self._model_for(call_type), response_schema
+        )
+        cache_key = self._cache_key(payload)
+        parser = IncrementalJSONParser()
+        
+        early = asyncio.get_running_loop().create_future()
+        
+        def on_delta(text: str):
+            for event in parser.feed(text):
+                if on_event is not None:
+                    on_event(event)
+            if stop is not None and not early.done() and stop(parser):
+                early.set_result(json.dumps(parser.partial()))
+        
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            get_llm_usage_meter().record(call_type, cache_hit=True)
+            on_delta(cached)
+            return cached
+        
+        if not self.circuit_breaker.allow_request():
+            return self._llm_error_response(CircuitOpenError("LLM circuit open - failing fast"))
+        
+        stream = asyncio.create_task(self._consume_llm_stream_async(payload, call_type, cache_key, on_delta))
+        try:
+            await asyncio.wait({stream, early}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            stream.cancel()
+            raise
+        
+        if stream.done():
+            return stream.result()
+        
+        # Caller has what it needs - finish reading for the usage meter and cache
+        self._background_tasks.add(stream)
+        stream.add_done_callback(self._background_tasks.discard)
+        return early.result()
+    
+    async def _consume_llm_stream_async(self, payload: Dict, call_type: str, cache_key: str, on_delta) -> str:
+        """
+        Read one streamed completion to the end
+        
+        Returns:
+            Full response text (or the JSON error sentinel)
+        """
+        parts = []
+        usage = None
+        try:
+            async with self._get_async_client().stream(
+                "POST", self.api_url, json={**payload, "stream": True}
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    # Skip blank lines and SSE comments (": OPENROUTER PROCESSING")
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    if chunk.get("error"):
+                        raise ValueError(f"Stream error: {chunk['error']}")
+                    if chunk.get("usage"):
+                        usage = chunk["usage"]
+                    for choice in chunk.get("choices", []):
+                        text = (choice.get("delta") or {}).get("content")
+                        if text:
+                            parts.append(text)
+                            on_delta(text)
+        except asyncio.CancelledError:
+            self.circuit_breaker.record_cancelled()
+            raise
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"   🚨 LLM stream failed: {e!r}")
+            self._record_transport_error(e)
+            get_llm_usage_meter().record(call_type, failed=True)
+            # Not retried mid-stream; later calls for this model use json_object
+            self._reject_json_schema(payload, e)
+            return self._llm_error_response(e)
+        
+        self.circuit_breaker.record_success()
+        get_llm_usage_meter().record(call_type, usage=usage)
+        content = self._strip_code_fences("".join(parts))
+        self._store_in_cache(cache_key, content)
+        return content
+    
+    def _build_llm_payload(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str = None,
+        model: str = None,
+        response_schema: Dict = None
+    ) -> Dict:
+        """
+        Build the chat completion request body
+        
+        The static system prompt always comes first and the per-call content
+        last, so repeated calls share a byte-identical prefix that the
+        provider can serve from its prompt cache.
+        """
+        model = model or self.model
+        messages = []
+        if system_prompt:
+            messages.append({
+                "role": "system",
+                "content": system_prompt
             })
+        messages.append({
+            "role": "user",
+            "content": prompt
+        })
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            # Ask OpenRouter to report token counts and cost for the usage meter
+            "usage": {"include": True}
+        }
+        response_format = build_response_format(response_schema, self._response_format_mode_for(model))
+        if response_format is not None:
+            payload["response_format"] = response_format
+        return payload
+    
+    def _response_format_mode_for(self, model: str) -> str:
+        """Configured response format mode, downgraded for models that rejected json_schema"""
+        if self.response_format_mode == RESPONSE_FORMAT_JSON_SCHEMA and model in self._json_schema_rejected_models:
+            return RESPONSE_FORMAT_JSON_OBJECT
+        return self.response_format_mode
+    
+    def _reject_json_schema(self, payload: Dict, error: Exception) -> bool:
+        """
+        Downgrade a model to json_object if its provider refused a json_schema request
         
-        content = data["choices"][0]["message"]["content"]
+        Returns:
+            True if the request should be retried without the schema
+        """
+        response_format = payload.get("response_format") or {}
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+        if response_format.get("type") != RESPONSE_FORMAT_JSON_SCHEMA or status_code not in (400, 404, 422):
+            return False
+        print(f"   📐 {payload['model']} rejected json_schema output (HTTP {status_code}) - using json_object")
+        self._json_schema_rejected_models.add(payload["model"])
+        return True
+    
+    def _model_for(self, call_type: str) -> str:
+        """Model serving a call type (routing table, default model otherwise)"""
+        return self.model_routes.get(call_type, self.model)
+    
+    def _compiled_system_prompt(self, key: tuple, build) -> str:
+        """
+        Return a compiled system prompt, building it on first use
         
-        # Try to extract JSON if wrapped in markdown
+        Args:
+            key: Prompt kind plus every static input the text depends on
+            build: Zero-argument function producing the prompt text
+        """
+        system_prompt = self._system_prompts.get(key)
+        if system_prompt is None:
+            system_prompt = build()
+            self._system_prompts[key] = system_prompt
+        return system_prompt
+    
+    def _cache_key(self, payload: Dict) -> str:
+        """Response cache key: (model, temperature, max_tokens, prompt hash)"""
+        return prompt_fingerprint(
+            payload["model"],
+            payload["temperature"],
+            payload["max_tokens"],
+            payload["messages"]
+        )
+    
+    def _store_in_cache(self, cache_key: str, content: str):
+        """Cache a response only if it is valid JSON (bad outputs should be retried)"""
+        try:
+            json.loads(content)
+        except json.JSONDecodeError:
+            return
+        self.cache.put(cache_key, content)
+    
+    def _llm_headers(self) -> Dict[str, str]:
+        """HTTP headers for OpenRouter requests"""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _record_transport_error(self, error: Exception):
+        """
+        Feed a failed request into the circuit breaker
+        
+        Timeouts, connection errors, rate limits (429) and 5xx count as
+        service failures; other HTTP errors mean the service answered and
+        do not trip the breaker.
+        """
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+        if status_code is None or status_code == 429 or status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+    
+    def is_llm_available(self) -> bool:
+        """False while the circuit breaker is open (calls would fail fast)"""
+        return self.circuit_breaker.is_available()
+    
+    def _llm_error_response(self, error: Exception) -> str:
+        """JSON sentinel returned to callers when the API call fails"""
+        return json.dumps({
+            "error": "API call failed",
+            "details": str(error)
+        })
+    
+    def _completion_content(self, data: Dict, call_type: str) -> Optional[str]:
+        """
+        Validate a completion body and feed the outcome to the breaker and usage meter
+        
+        Returns:
+            Message text, or None if the body has no choices[0].message.content
+            (counted as a failure, not as a success of the service)
+        """
+        try:
+            content = self._extract_llm_content(data)
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            print(f"   🚨 Malformed LLM response: {e!r}")
+            self.circuit_breaker.record_failure()
+            get_llm_usage_meter().record(call_type, failed=True)
+            return None
+        
+        self.circuit_breaker.record_success()
+        get_llm_usage_meter().record(call_type, usage=data.get("usage"))
+        return content
+    
+    def _extract_llm_content(self, data: Dict) -> str:
+        """Pull the message text out of a completion and strip markdown fences"""
+        return self._strip_code_fences(data["choices"][0]["message"]["content"])
+    
+    def _strip_code_fences(self, content: str) -> str:
+        """Extract the JSON body if the model wrapped it in markdown fences"""
         if "```json" in content:
             content = content.split("```json")[1].split("```")[0].strip()
         elif "```" in content:
             content = content.split("```")[1].split("```")[0].strip()
         
         return content.strip()
+    
+    def _get_http_session(self) -> requests.Session:
+        """Lazily create the keep-alive session used by blocking calls"""
+        if self._http_session is None:
+            self._http_session = requests.Session()
+            self._http_session.headers.update(self._llm_headers())
+        return self._http_session
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled keep-alive client used by async calls"""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                headers=self._llm_headers(),
+                timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT_SECONDS),
+                limits=httpx.Limits(
+                    max_connections=LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                    keepalive_expiry=LLM_KEEPALIVE_SECONDS
+                )
+            )
+        return self._async_client
+    
+    async def aclose(self):
+        """Close pooled HTTP connections (call on server shutdown)"""
+        for task in list(self._background_tasks):
+            task.cancel()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
 
 
 # Global instance
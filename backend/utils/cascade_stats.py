@@ -0,0 +1,98 @@
+"""
+Tuning statistics for the checklist model cascade
+Per-tier latency plus agreement between the screening model and whatever
+confirms its verdicts, bucketed by screening confidence, so the cascade
+threshold can be chosen from data
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+def _confidence_bucket(confidence: float) -> str:
+    """0.1-wide bucket label, e.g. 0.73 → "0.7-0.8" """
+    low = min(9, max(0, int(float(confidence) * 10)))
+    return f"{low / 10:.1f}-{(low + 1) / 10:.1f}"
+
+
+class CascadeStats:
+    """Thread-safe cascade counters for /health"""
+
+    def __init__(self, latency_window: int = 200):
+        self.latency_window = latency_window
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._counters = {
+            "cycles": 0,
+            "screened_items": 0,
+            "screen_positives": 0,
+            "audited_negatives": 0,
+            "missed_by_screen": 0  # audited negatives the strong model marked completed
+        }
+        # Screening confidence bucket → {confirmed, rejected}
+        self._agreement: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record_tier(self, tier: str, seconds: float):
+        """Latency of one cascade tier ("screen", "recheck", "validation", "audit")"""
+        with self._lock:
+            self._latencies.setdefault(tier, deque(maxlen=self.latency_window)).append(seconds)
+
+    def record_screen(self, screened: int, positives: int):
+        """One screening pass: items judged and how many were forwarded"""
+        with self._lock:
+            self._counters["cycles"] += 1
+            self._counters["screened_items"] += screened
+            self._counters["screen_positives"] += positives
+
+    def record_confirmation(self, confidence: float, confirmed: bool):
+        """Outcome of confirming one screen positive"""
+        with self._lock:
+            bucket = self._agreement.setdefault(_confidence_bucket(confidence), {"confirmed": 0, "rejected": 0})
+            bucket["confirmed" if confirmed else "rejected"] += 1
+
+    def record_audit(self, negatives: int, missed: int):
+        """Background re-check of screen negatives by the strong model"""
+        with self._lock:
+            self._counters["audited_negatives"] += negatives
+            self._counters["missed_by_screen"] += missed
+
+    def stats(self) -> Dict:
+        """Counters, per-tier latency and agreement by confidence bucket"""
+        with self._lock:
+            latency = {}
+            for tier, samples in self._latencies.items():
+                ordered = sorted(samples)
+                latency[tier] = {
+                    "samples": len(ordered),
+                    "p50_ms": round(ordered[len(ordered) // 2] * 1000),
+                    "p90_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))] * 1000)
+                }
+
+            agreement = {}
+            for bucket, counts in sorted(self._agreement.items()):
+                total = counts["confirmed"] + counts["rejected"]
+                agreement[bucket] = {**counts, "agreement_rate": round(counts["confirmed"] / total, 3)}
+
+            counters = dict(self._counters)
+            return {
+                **counters,
+                "forward_rate": round(counters["screen_positives"] / counters["screened_items"], 3)
+                if counters["screened_items"] else 0.0,
+                "screen_miss_rate": round(counters["missed_by_screen"] / counters["audited_negatives"], 3)
+                if counters["audited_negatives"] else None,
+                "latency_by_tier": latency,
+                "agreement_by_confidence": agreement
+            }
+
+
+# Global instance
+_cascade_stats: Optional[CascadeStats] = None
+
+
+def get_cascade_stats() -> CascadeStats:
+    """Get or create the shared cascade statistics"""
+    global _cascade_stats
+    if _cascade_stats is None:
+        _cascade_stats = CascadeStats()
+    return _cascade_stats
@@ -0,0 +1,260 @@
+"""
+Checklist scheduler for the live analysis loop
+Decides which checklist items are worth sending to the LLM in a cycle
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+from call_structure_config import get_stage_timing_status
+from utils.llm_usage import BUDGET_DEGRADED, BUDGET_EXHAUSTED, BUDGET_NORMAL
+from utils.relevance_index import ChecklistRelevanceIndex
+
+
+# Item verdicts that did not actually look at the transcript - retry next cycle
+UNEVALUATED_STAGES = {"error", "deadline_exceeded", "batch_missing_item"}
+
+# How much recent transcript is kept for relevance scoring
+RECENT_TEXT_MAX_CHARS = 4000
+
+# Budget governor: budget level → (re-check interval multiplier, max items per cycle, neighbour stages)
+BUDGET_POLICIES = {
+    BUDGET_NORMAL: (1, None, True),
+    BUDGET_DEGRADED: (2, int(os.getenv("CHECKLIST_DEGRADED_MAX_ITEMS", "6")), False),
+    BUDGET_EXHAUSTED: (4, int(os.getenv("CHECKLIST_EXHAUSTED_MAX_ITEMS", "2")), False),
+}
+
+
+class ChecklistScheduler:
+    """Change-driven scheduling of checklist item evaluations"""
+
+    def __init__(
+        self,
+        min_new_chars: int = None,
+        min_new_segments: int = None,
+        relevance_index: Optional[ChecklistRelevanceIndex] = None,
+        stage_lookbehind: int = None,
+        stage_lookahead: int = None,
+        sparse_every_cycles: int = None
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            min_new_chars: New transcript characters needed before an item is re-checked
+            min_new_segments: New transcript segments needed before an item is re-checked
+            relevance_index: Lexical pre-filter; items the new speech is not about are skipped
+            stage_lookbehind: Stages before the current one that are checked every cycle
+            stage_lookahead: Stages after the current one that are checked every cycle
+            sparse_every_cycles: Stages outside that window are checked every Nth cycle
+        """
+        self.min_new_chars = min_new_chars if min_new_chars is not None else int(
+            os.getenv("CHECKLIST_MIN_NEW_CHARS", "120")
+        )
+        self.min_new_segments = min_new_segments if min_new_segments is not None else int(
+            os.getenv("CHECKLIST_MIN_NEW_SEGMENTS", "3")
+        )
+
+        # Monotonic transcript offsets (never shrink, unlike the trimmed transcript text)
+        self.total_chars = 0
+        self.total_segments = 0
+
+        # item_id → (total_chars, total_segments) at last evaluation
+        self.watermarks: Dict[str, Tuple[int, int]] = {}
+
+        self.relevance_index = relevance_index
+
+        # Stage window: current stage ± lookbehind/lookahead every cycle, the rest sampled
+        self.stage_lookbehind = stage_lookbehind if stage_lookbehind is not None else int(
+            os.getenv("CHECKLIST_STAGE_LOOKBEHIND", "1")
+        )
+        self.stage_lookahead = stage_lookahead if stage_lookahead is not None else int(
+            os.getenv("CHECKLIST_STAGE_LOOKAHEAD", "1")
+        )
+        self.sparse_every_cycles = max(1, sparse_every_cycles if sparse_every_cycles is not None else int(
+            os.getenv("CHECKLIST_SPARSE_EVERY_CYCLES", "5")
+        ))
+        self.cycles = 0
+        # (total_chars after chunk, chunk text) - bounded tail of the transcript
+        self.recent_chunks: List[Tuple[int, str]] = []
+
+        self.items_scheduled = 0
+        self.items_skipped_unchanged = 0
+        self.items_skipped_irrelevant = 0
+        self.items_skipped_out_of_stage = 0
+        self.items_skipped_budget = 0
+
+    def record_transcript(self, text: str, segment_count: int = 1):
+        """
+        Advance the transcript offsets after new speech was transcribed
+
+        Args:
+            text: Newly transcribed text
+            segment_count: Number of Whisper segments it came from
+        """
+        text = text.strip()
+        self.total_chars += len(text)
+        self.total_segments += segment_count
+
+        if text:
+            self.recent_chunks.append((self.total_chars, text))
+            # Drop the oldest chunks once the tail exceeds the budget (keep at least one)
+            while len(self.recent_chunks) > 1 and self.total_chars - self.recent_chunks[0][0] > RECENT_TEXT_MAX_CHARS:
+                self.recent_chunks.pop(0)
+
+    def new_speech_since(self, item_id: str) -> Tuple[int, int]:
+        """(new chars, new segments) since the item was last evaluated"""
+        chars_mark, segments_mark = self.watermarks.get(item_id, (0, 0))
+        return self.total_chars - chars_mark, self.total_segments - segments_mark
+
+    def text_since(self, item_id: str) -> str:
+        """Transcript added since the item was last evaluated (bounded to the recent tail)"""
+        chars_mark = self.watermarks.get(item_id, (0, 0))[0]
+        return " ".join(text for end, text in self.recent_chunks if end > chars_mark)
+
+    def is_due(self, item_id: str, interval_factor: int = 1) -> bool:
+        """True if enough new speech arrived since the item was last evaluated"""
+        if item_id not in self.watermarks:
+            return True
+        new_chars, new_segments = self.new_speech_since(item_id)
+        return (
+            new_chars >= self.min_new_chars * interval_factor
+            or new_segments >= self.min_new_segments * interval_factor
+        )
+
+    def eligible_stage_ids(
+        self,
+        call_structure: List[Dict],
+        current_stage_id: Optional[str],
+        elapsed_seconds: Optional[int] = None,
+        include_neighbours: bool = True
+    ) -> Optional[set]:
+        """
+        Stages whose items are checked this cycle
+
+        The current stage, `stage_lookbehind` stages before it and
+        `stage_lookahead` after it are always eligible, as is any stage the
+        call timing says should be running now (the context-detected stage
+        can lag). Every `sparse_every_cycles` cycles all stages are
+        eligible, so late or early completions are still picked up.
+        With include_neighbours=False (budget governor) only the current
+        stage is eligible and there are no sweeps.
+
+        Returns:
+            Set of stage ids, or None if every stage is eligible
+        """
+        stage_ids = [stage['id'] for stage in call_structure]
+        if current_stage_id not in stage_ids:
+            return None
+        if not include_neighbours:
+            return {current_stage_id}
+        if self.cycles % self.sparse_every_cycles == 0:
+            return None
+
+        current_index = stage_ids.index(current_stage_id)
+        first = max(0, current_index - self.stage_lookbehind)
+        last = current_index + self.stage_lookahead
+        eligible = set(stage_ids[first:last + 1])
+
+        if elapsed_seconds is not None:
+            for stage_id in stage_ids:
+                if get_stage_timing_status(stage_id, elapsed_seconds)['status'] == 'on_time':
+                    eligible.add(stage_id)
+
+        return eligible
+
+    def select_items(
+        self,
+        call_structure: List[Dict],
+        checklist_progress: Dict[str, bool],
+        current_stage_id: Optional[str] = None,
+        elapsed_seconds: Optional[int] = None,
+        budget_level: str = BUDGET_NORMAL
+    ) -> List[Dict]:
+        """
+        Pick the items to evaluate this cycle
+
+        Args:
+            call_structure: Stages with their items
+            checklist_progress: item_id → completed
+            current_stage_id: Detected stage (None = no stage scoping)
+            elapsed_seconds: Seconds since call start (for timing-based eligibility)
+            budget_level: Session LLM budget level; above normal, items are re-checked
+                less often, only the current stage is considered and the cycle is capped
+
+        Returns:
+            Items due for evaluation, in call structure order
+        """
+        self.cycles += 1
+        interval_factor, max_items, include_neighbours = BUDGET_POLICIES.get(
+            budget_level, BUDGET_POLICIES[BUDGET_NORMAL]
+        )
+        eligible_stages = self.eligible_stage_ids(
+            call_structure, current_stage_id, elapsed_seconds, include_neighbours
+        )
+
+        selected = []
+        delta_scores: Dict[int, Dict[str, float]] = {}  # chars watermark → item scores
+        for stage in call_structure:
+            in_window = eligible_stages is None or stage['id'] in eligible_stages
+            for item in stage['items']:
+                # Skip if already completed
+                if checklist_progress.get(item['id'], False):
+                    continue
+
+                # Skip if the stage is far from the current one (sampled sparsely instead)
+                if not in_window:
+                    self.items_skipped_out_of_stage += 1
+                    continue
+
+                # Skip if not enough new speech since last check
+                if not self.is_due(item['id'], interval_factor):
+                    self.items_skipped_unchanged += 1
+                    continue
+
+                # Skip if the new speech is not about this item at all
+                if self.relevance_index is not None and self.relevance_index.enabled:
+                    chars_mark = self.watermarks.get(item['id'], (0, 0))[0]
+                    if chars_mark not in delta_scores:
+                        # Items sharing a watermark share the delta - score it once
+                        delta_scores[chars_mark] = self.relevance_index.score(self.text_since(item['id']))
+                    item_score = delta_scores[chars_mark].get(item['id'], float("inf"))
+                    if item_score < self.relevance_index.min_score:
+                        self.items_skipped_irrelevant += 1
+                        continue
+
+                selected.append(item)
+
+        # Budget governor: cap the cycle (earliest stages first)
+        if max_items is not None and len(selected) > max_items:
+            self.items_skipped_budget += len(selected) - max_items
+            selected = selected[:max_items]
+
+        self.items_scheduled += len(selected)
+        return selected
+
+    def mark_evaluated(self, results: Dict[str, tuple]):
+        """
+        Move watermarks for items that received a real verdict
+
+        Args:
+            results: item_id → (completed, confidence, evidence, debug_info)
+        """
+        for item_id, (_, _, _, debug_info) in results.items():
+            if debug_info.get("stage") in UNEVALUATED_STAGES:
+                continue
+            self.watermarks[item_id] = (self.total_chars, self.total_segments)
+
+    def stats(self) -> Dict:
+        """Scheduler counters for debugging"""
+        return {
+            "transcript_chars": self.total_chars,
+            "transcript_segments": self.total_segments,
+            "items_scheduled": self.items_scheduled,
+            "items_skipped_unchanged": self.items_skipped_unchanged,
+            "items_skipped_irrelevant": self.items_skipped_irrelevant,
+            "items_skipped_out_of_stage": self.items_skipped_out_of_stage,
+            "items_skipped_budget": self.items_skipped_budget,
+            "cycles": self.cycles,
+            "relevance_min_score": self.relevance_index.min_score if self.relevance_index else None
+        }
@@ -0,0 +1,156 @@
+"""
+Circuit breaker for the analyzer's LLM transport
+Trips after consecutive failures/timeouts, fails fast while open and lets
+a single probe request through once the (exponentially growing) cool-down
+has passed
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+
+STATE_CLOSED = "closed"        # normal operation
+STATE_OPEN = "open"            # failing fast, no requests sent
+STATE_HALF_OPEN = "half_open"  # cool-down over, probe requests decide
+
+
+class CircuitOpenError(Exception):
+    """Raised/reported when a request is rejected because the circuit is open"""
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker with adaptive cool-down"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 15.0,
+        max_reset_timeout_seconds: float = 120.0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Initialize breaker
+
+        Args:
+            name: Name for logs
+            failure_threshold: Consecutive failures that trip the breaker
+            reset_timeout_seconds: Initial cool-down before a probe is allowed
+            max_reset_timeout_seconds: Cap for the cool-down, which doubles every time a probe fails
+            half_open_max_calls: Probe requests allowed at once while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout_seconds
+        self.max_reset_timeout = max_reset_timeout_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.reset_timeout = reset_timeout_seconds
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self._lock = threading.Lock()
+
+        self.trips = 0
+        self.rejected = 0
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent now (reserves a probe slot when half-open)
+
+        Returns:
+            False if the caller should fail fast
+        """
+        with self._lock:
+            if self.state == STATE_OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = STATE_HALF_OPEN
+                self.probes_in_flight = 0
+                print(f"   🔌 {self.name} circuit half-open - probing")
+
+            if self.state == STATE_HALF_OPEN:
+                if self.probes_in_flight >= self.half_open_max_calls:
+                    self.rejected += 1
+                    return False
+                self.probes_in_flight += 1
+
+            return True
+
+    def is_available(self) -> bool:
+        """True unless the circuit is open and still cooling down (does not reserve a probe)"""
+        with self._lock:
+            return not (self.state == STATE_OPEN and time.monotonic() - self.opened_at < self.reset_timeout)
+
+    def record_success(self):
+        """A request reached the service and got a usable answer"""
+        with self._lock:
+            if self.state == STATE_HALF_OPEN:
+                print(f"   ✅ {self.name} circuit closed - service recovered")
+            self.state = STATE_CLOSED
+            self.consecutive_failures = 0
+            self.reset_timeout = self.base_reset_timeout
+            self.probes_in_flight = 0
+
+    def record_failure(self):
+        """A request failed or timed out"""
+        with self._lock:
+            self.consecutive_failures += 1
+
+            if self.state == STATE_HALF_OPEN:
+                # Probe failed - back off harder before the next one
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self._trip()
+            elif self.state == STATE_CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._trip()
+
+    def record_cancelled(self):
+        """A request was cancelled before finishing (frees its probe slot, no verdict)"""
+        with self._lock:
+            if self.state == STATE_HALF_OPEN and self.probes_in_flight > 0:
+                self.probes_in_flight -= 1
+
+    def _trip(self):
+        """Open the circuit (lock must be held)"""
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic()
+        self.probes_in_flight = 0
+        self.trips += 1
+        print(f"   ⚡ {self.name} circuit OPEN after {self.consecutive_failures} consecutive failures "
+              f"- failing fast for {self.reset_timeout:.0f}s")
+
+    def stats(self) -> Dict:
+        """Breaker state and counters for /health"""
+        with self._lock:
+            retry_in = 0.0
+            if self.state == STATE_OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "reset_timeout_seconds": self.reset_timeout,
+                "retry_in_seconds": round(retry_in, 1),
+                "trips": self.trips,
+                "rejected": self.rejected
+            }
+
+
+# Global instance (shared by all sessions - an outage is not per session)
+_llm_breaker: Optional[CircuitBreaker] = None
+
+
+def get_llm_circuit_breaker() -> CircuitBreaker:
+    """Get or create the circuit breaker guarding OpenRouter calls"""
+    global _llm_breaker
+    if _llm_breaker is None:
+        _llm_breaker = CircuitBreaker(
+            name="OpenRouter",
+            failure_threshold=int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5")),
+            reset_timeout_seconds=float(os.getenv("LLM_BREAKER_RESET_SECONDS", "15")),
+            max_reset_timeout_seconds=float(os.getenv("LLM_BREAKER_MAX_RESET_SECONDS", "120"))
+        )
+    return _llm_breaker
@@ -0,0 +1,177 @@
+"""
+Per-session LLM usage meter with a budget governor
+Records the token/cost usage OpenRouter reports for every analyzer call,
+broken down by call type, and tells the live loop when to degrade
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+
+# Budget levels, from cheapest to most expensive behaviour allowed
+BUDGET_NORMAL = "normal"
+BUDGET_DEGRADED = "degraded"    # soft limit reached: fewer items, longer intervals
+BUDGET_EXHAUSTED = "exhausted"  # hard limit reached: minimal checks, no validation calls
+
+
+def _empty_counters() -> Dict:
+    return {
+        "requests": 0,
+        "cache_hits": 0,
+        "coalesced": 0,  # awaited an identical request already in flight
+        "failures": 0,
+        "parsed_responses": 0,
+        "parse_failures": 0,  # responses that were not valid JSON
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cached_tokens": 0,
+        "cost_usd": 0.0
+    }
+
+
+def _parse_failure_rate(counters: Dict) -> float:
+    parsed = counters["parsed_responses"] + counters["parse_failures"]
+    return round(counters["parse_failures"] / parsed, 3) if parsed else 0.0
+
+
+class LLMUsageMeter:
+    """Thread-safe token / request / cost counters for one session"""
+
+    def __init__(self, token_budget: int = 0, cost_budget_usd: float = 0.0, soft_limit_ratio: float = 0.8):
+        """
+        Initialize meter
+
+        Args:
+            token_budget: Max prompt + completion tokens per session (0 = unlimited)
+            cost_budget_usd: Max spend per session in USD (0 = unlimited)
+            soft_limit_ratio: Fraction of the budget at which the loop starts degrading
+        """
+        self.token_budget = token_budget
+        self.cost_budget_usd = cost_budget_usd
+        self.soft_limit_ratio = soft_limit_ratio
+
+        self.totals = _empty_counters()
+        self.by_call_type: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        call_type: str,
+        usage: Optional[Dict] = None,
+        cache_hit: bool = False,
+        coalesced: bool = False,
+        failed: bool = False
+    ):
+        """
+        Record one analyzer LLM call
+
+        Args:
+            call_type: "checklist" | "validation" | "client_card" | "stage" | ...
+            usage: OpenRouter `usage` object ({prompt_tokens, completion_tokens, cost, prompt_tokens_details})
+            cache_hit: Served from the local response cache (no API request)
+            coalesced: Shared the response of an identical in-flight request (no API request)
+            failed: API request failed (no usage reported)
+        """
+        usage = usage or {}
+        prompt_details = usage.get("prompt_tokens_details") or {}
+        delta = {
+            "requests": 0 if cache_hit or coalesced else 1,
+            "cache_hits": 1 if cache_hit else 0,
+            "coalesced": 1 if coalesced else 0,
+            "failures": 1 if failed else 0,
+            "prompt_tokens": int(usage.get("prompt_tokens") or 0),
+            "completion_tokens": int(usage.get("completion_tokens") or 0),
+            "cached_tokens": int(prompt_details.get("cached_tokens") or 0),
+            "cost_usd": float(usage.get("cost") or 0.0)
+        }
+
+        with self._lock:
+            per_type = self.by_call_type.setdefault(call_type, _empty_counters())
+            for counters in (self.totals, per_type):
+                for key, value in delta.items():
+                    counters[key] += value
+
+    def record_parse(self, call_type: str, ok: bool):
+        """
+        Record whether a response could be parsed as JSON
+
+        Args:
+            call_type: Usage meter bucket of the call
+            ok: False if the response was not valid JSON
+        """
+        key = "parsed_responses" if ok else "parse_failures"
+        with self._lock:
+            per_type = self.by_call_type.setdefault(call_type, _empty_counters())
+            self.totals[key] += 1
+            per_type[key] += 1
+
+    @property
+    def total_tokens(self) -> int:
+        return self.totals["prompt_tokens"] + self.totals["completion_tokens"]
+
+    def budget_used_ratio(self) -> float:
+        """Largest fraction used of any configured budget (0.0 if unlimited)"""
+        ratios = [0.0]
+        if self.token_budget > 0:
+            ratios.append(self.total_tokens / self.token_budget)
+        if self.cost_budget_usd > 0:
+            ratios.append(self.totals["cost_usd"] / self.cost_budget_usd)
+        return max(ratios)
+
+    def budget_level(self) -> str:
+        """Current budget level: normal, degraded or exhausted"""
+        used = self.budget_used_ratio()
+        if used >= 1.0:
+            return BUDGET_EXHAUSTED
+        if used >= self.soft_limit_ratio:
+            return BUDGET_DEGRADED
+        return BUDGET_NORMAL
+
+    def stats(self) -> Dict:
+        """Session totals and per-call-type breakdown for /health and coach updates"""
+        with self._lock:
+            return {
+                "totals": {
+                    **self.totals,
+                    "total_tokens": self.total_tokens,
+                    "cost_usd": round(self.totals["cost_usd"], 6),
+                    "parse_failure_rate": _parse_failure_rate(self.totals)
+                },
+                "by_call_type": {
+                    call_type: {
+                        **counters,
+                        "cost_usd": round(counters["cost_usd"], 6),
+                        "parse_failure_rate": _parse_failure_rate(counters)
+                    }
+                    for call_type, counters in self.by_call_type.items()
+                },
+                "budget": {
+                    "token_budget": self.token_budget,
+                    "cost_budget_usd": self.cost_budget_usd,
+                    "used_ratio": round(self.budget_used_ratio(), 3),
+                    "level": self.budget_level()
+                }
+            }
+
+
+# Global instance (one per live session)
+_usage_meter: Optional[LLMUsageMeter] = None
+
+
+def get_llm_usage_meter() -> LLMUsageMeter:
+    """Get or create the usage meter of the current session"""
+    global _usage_meter
+    if _usage_meter is None:
+        _usage_meter = LLMUsageMeter(
+            token_budget=int(os.getenv("LLM_SESSION_TOKEN_BUDGET", "0")),
+            cost_budget_usd=float(os.getenv("LLM_SESSION_COST_BUDGET_USD", "0")),
+            soft_limit_ratio=float(os.getenv("LLM_BUDGET_SOFT_LIMIT_RATIO", "0.8"))
+        )
+    return _usage_meter
+
+
+def reset_llm_usage_meter():
+    """Start a fresh meter (new session)"""
+    global _usage_meter
+    _usage_meter = None
@@ -7,10 +7,13 @@ Handles incomplete WebM chunks from getDisplayMedia
 import subprocess
 import tempfile
 import os
+import threading
+import time
 from typing import Optional, List, Dict
 import io
 import wave
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 try:
     import av  # PyAV for Opus decoding
@@ -19,29 +22,107 @@ except ImportError:
     HAS_PYAV = False
     print("⚠️ PyAV not installed, WebM decoding may fail")
 
+SAMPLE_RATE = 16000  # Whisper input rate
+WEBM_MAGIC = b'\x1aE\xdf\xa3'  # EBML header
+
+# Decode buffers with PyAV and pass NumPy arrays to Whisper instead of
+# writing WebM/WAV temp files and spawning ffmpeg for every buffer
+TRANSCRIBE_IN_MEMORY = os.getenv("TRANSCRIBE_IN_MEMORY", "true").lower() == "true"
+
+# Same floor as the file path's 4000-byte WAV check (~0.125s)
+MIN_TRANSCRIBE_SAMPLES = 2000
+
+# Whisper's encoder window; longer buffers cannot share a batch
+WHISPER_CHUNK_SECONDS = 30
+# Batched clips are padded past half a window so the pipeline never merges
+# two sessions' buffers into one chunk (Whisper zero-pads to 30s anyway)
+BATCH_CLIP_SECONDS = WHISPER_CHUNK_SECONDS / 2 + 0.1
+
 
 class RealtimeTranscriber:
     """Transcribe audio in real-time using Whisper"""
     
-    def __init__(self, model_size: str = "base"):
+    def __init__(self, model_size: str = "base", cpu_threads: int = 0):
         """
         Initialize transcriber
         
         Args:
             model_size: Whisper model size (tiny, base, small, medium, large)
+            cpu_threads: CTranslate2 inference threads (0 = library default)
         """
         self.model_size = model_size
+        self.cpu_threads = cpu_threads
         self._model: Optional[WhisperModel] = None
+        self._batched_pipeline: Optional[BatchedInferencePipeline] = None
+        # Startup warm-up and the first transcription may race for the load
+        self._model_lock = threading.Lock()
+        
+        # Warm-up state for /health
+        self.ready = False
+        self.warmup_error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
         
     @property
     def model(self) -> WhisperModel:
         """Lazy load Whisper model"""
         if self._model is None:
-            print(f"🔄 Loading Whisper model '{self.model_size}' for real-time transcription...")
-            self._model = WhisperModel(self.model_size, device="cpu", compute_type="int8")
-            print(f"✅ Whisper model ready for real-time transcription")
+            with self._model_lock:
+                if self._model is None:
+                    print(f"🔄 Loading Whisper model '{self.model_size}' for real-time transcription...")
+                    started = time.perf_counter()
+                    self._model = WhisperModel(
+                        self.model_size, device="cpu", compute_type="int8", cpu_threads=self.cpu_threads
+                    )
+                    self.load_seconds = time.perf_counter() - started
+                    print(f"✅ Whisper model ready for real-time transcription ({self.load_seconds:.1f}s)")
         return self._model
     
+    @property
+    def batched_pipeline(self) -> BatchedInferencePipeline:
+        """Batched inference over the same (lazily loaded) model"""
+        if self._batched_pipeline is None:
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+        return self._batched_pipeline
+    
+    def warm_up(self, seconds: float = 1.0, language: str = "id"):
+        """
+        Load the model and run one inference on synthetic silence
+        
+        The first real buffer then skips the model load (and a possible
+        Hugging Face download) as well as first-inference setup costs.
+        
+        Args:
+            seconds: Length of the silent clip
+            language: Language code used for the warm-up decode
+        """
+        self.warmup_error = None
+        try:
+            model = self.model
+            started = time.perf_counter()
+            silence = np.zeros(int(16000 * seconds), dtype=np.float32)
+            # Segments are generated lazily - consume them to actually decode
+            segments, _info = model.transcribe(silence, language=language, beam_size=5)
+            list(segments)
+            self.warmup_seconds = time.perf_counter() - started
+            self.ready = True
+            print(f"🔥 Whisper warm-up done ({self.warmup_seconds:.1f}s)")
+        except Exception as e:
+            self.warmup_error = str(e)
+            print(f"❌ Whisper warm-up failed: {e}")
+            raise
+    
+    def status(self) -> Dict:
+        """Readiness and load timings for /health"""
+        return {
+            "model_size": self.model_size,
+            "ready": self.ready,
+            "loaded": self._model is not None,
+            "load_seconds": round(self.load_seconds, 2) if self.load_seconds is not None else None,
+            "warmup_seconds": round(self.warmup_seconds, 2) if self.warmup_seconds is not None else None,
+            "error": self.warmup_error
+        }
+    
     def convert_webm_to_wav(self, webm_path: str, tolerant: bool = False) -> str:
         """
         Convert WebM to WAV using FFmpeg
@@ -150,6 +231,48 @@ class RealtimeTranscriber:
                 except:
                     pass
     
+    def decode_audio_pyav(self, data: bytes, container_format: Optional[str] = None) -> np.ndarray:
+        """
+        Decode an in-memory audio container with PyAV (no temp files, no ffmpeg process)
+        
+        Args:
+            data: Container bytes (WebM/Opus, WAV, ...; incomplete WebM tolerated)
+            container_format: PyAV format name ("webm", "wav"), None to probe
+            
+        Returns:
+            float32 samples in [-1, 1], mono, 16kHz
+        """
+        if not HAS_PYAV:
+            raise Exception("PyAV not installed")
+        
+        container = av.open(io.BytesIO(data), format=container_format)
+        try:
+            audio_stream = next((s for s in container.streams if s.type == 'audio'), None)
+            if audio_stream is None:
+                raise Exception("No audio stream found")
+            
+            resampler = av.AudioResampler(format='flt', layout='mono', rate=SAMPLE_RATE)
+            chunks = []
+            try:
+                for frame in container.decode(audio_stream):
+                    frame.pts = None
+                    for resampled in resampler.resample(frame):
+                        chunks.append(resampled.to_ndarray().reshape(-1))
+            except av.error.InvalidDataError as e:
+                # Truncated trailing cluster of a chunked recording - keep what decoded
+                if not chunks:
+                    raise
+                print(f"   ⚠️ PyAV stopped at damaged data: {e}")
+            # Flush samples buffered inside the resampler
+            for resampled in resampler.resample(None):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+        finally:
+            container.close()
+        
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(chunks).astype(np.float32, copy=False)
+    
     def decode_webm_chunks_pyav(self, webm_data: bytes) -> bytes:
         """
         Decode WebM chunks using PyAV (handles incomplete WebM files)
@@ -160,65 +283,193 @@ class RealtimeTranscriber:
         Returns:
             PCM audio bytes (16-bit mono, 16kHz)
         """
-        if not HAS_PYAV:
-            raise Exception("PyAV not installed")
+        audio = self.decode_audio_pyav(webm_data, container_format='webm')
+        return (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+    
+    def decode_to_array(self, buffer_data: bytes) -> np.ndarray:
+        """
+        Decode a buffer (WAV, WebM or raw PCM Int16) to float32 samples in memory
         
-        print(f"🔧 Decoding WebM with PyAV ({len(webm_data)} bytes)...")
+        Returns:
+            float32 samples in [-1, 1], mono, 16kHz
+        """
+        if buffer_data[:4] == b'RIFF':
+            return self.decode_audio_pyav(buffer_data, container_format='wav')
+        if buffer_data[:4] == WEBM_MAGIC:
+            return self.decode_audio_pyav(buffer_data, container_format='webm')
+        # RAW PCM Int16 16kHz mono (drop a dangling odd byte)
+        pcm = np.frombuffer(buffer_data[:len(buffer_data) - len(buffer_data) % 2], dtype=np.int16)
+        return pcm.astype(np.float32) / 32768.0
+    
+    def _run_whisper(self, audio, language: str) -> List[Dict]:
+        """Transcribe a file path or float32 16kHz array into segment dicts"""
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            vad_filter=True,
+            beam_size=5
+        )
         
-        try:
-            # Create BytesIO from the WebM data
-            webm_buffer = io.BytesIO(webm_data)
-            print(f"   📦 Created BytesIO buffer")
-            
-            # Open with PyAV - more tolerant to incomplete WebM
-            print(f"   🔓 Opening with av.open(format='webm')...")
-            container = av.open(webm_buffer, format='webm')
-            print(f"   ✅ Container opened")
-            
-            # Extract audio stream
-            audio_stream = None
-            for stream in container.streams:
-                print(f"   📹 Found stream: type={stream.type}, codec={getattr(stream, 'codec_name', 'unknown')}")
-                if stream.type == 'audio':
-                    audio_stream = stream
-                    break
-            
-            if not audio_stream:
-                raise Exception("No audio stream found in WebM")
-            
-            print(f"📻 Audio: {audio_stream.codec_name}, {audio_stream.sample_rate}Hz, {audio_stream.channels}ch")
-            
-            # Decode to PCM
-            pcm_data = io.BytesIO()
-            resampler = av.AudioResampler(format='s16', layout='mono', rate=16000)
-            print(f"   🔄 Resampler created: s16, mono, 16kHz")
-            
-            frame_count = 0
-            for frame in container.decode(audio_stream):
-                frame_count += 1
-                frame.pts = None
-                resampled = resampler.resample(frame)
-                
-                if resampled:
-                    pcm_bytes = resampled.to_ndarray().tobytes()
-                    pcm_data.write(pcm_bytes)
-                    if frame_count <= 3:
-                        print(f"   🎵 Frame {frame_count}: {len(pcm_bytes)} bytes decoded")
+        result_segments = []
+        for segment in segments:
+            result_segments.append({
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text.strip()
+            })
+        
+        print(f"✅ Transcribed: {len(result_segments)} segments")
+        
+        return result_segments
+
+    def transcribe_buffer(self, buffer_data: bytes, language: str = "id") -> List[Dict]:
+        """
+        Transcribe audio buffer directly
+        
+        Decodes in memory with PyAV and hands Whisper a NumPy array; falls
+        back to the ffmpeg/temp file path when PyAV is missing, disabled
+        (TRANSCRIBE_IN_MEMORY=false) or cannot decode the buffer.
+        
+        Args:
+            buffer_data: Raw audio bytes (WebM, WAV, or raw PCM Int16)
+            language: Language code (default: "id" for Bahasa Indonesia)
             
-            result = pcm_data.getvalue()
-            print(f"✅ Decoded {frame_count} frames: {len(result)} bytes (16kHz mono)")
+        Returns:
+            A list of segment dictionaries with start, end, and text
+        """
+        if not (HAS_PYAV and TRANSCRIBE_IN_MEMORY):
+            return self.transcribe_buffer_via_ffmpeg(buffer_data, language=language)
+        
+        print(f"📁 Processing buffer in memory: {len(buffer_data)} bytes")
+        try:
+            audio = self.decode_to_array(buffer_data)
+        except Exception as e:
+            print(f"   ⚠️ In-memory decode failed ({e}), falling back to ffmpeg")
+            return self.transcribe_buffer_via_ffmpeg(buffer_data, language=language)
+        
+        return self.transcribe_array(audio, language=language)
+    
+    def transcribe_words(
+        self,
+        audio: np.ndarray,
+        language: str = "id",
+        initial_prompt: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Transcribe decoded audio into timed words (streaming mode)
+        
+        Args:
+            audio: float32 samples in [-1, 1], mono, 16kHz
+            language: Language code (default: "id" for Bahasa Indonesia)
+            initial_prompt: Previously committed text, to keep the window consistent with it
             
-            return result
+        Returns:
+            A list of word dictionaries with start, end (seconds into `audio`) and word
+        """
+        if len(audio) < MIN_TRANSCRIBE_SAMPLES:
+            return []
+        
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            vad_filter=True,
+            beam_size=5,
+            word_timestamps=True,
+            initial_prompt=initial_prompt or None,
+            # Each window is re-decoded from scratch; the prompt carries the context
+            condition_on_previous_text=False
+        )
+        
+        words = []
+        for segment in segments:
+            for word in segment.words or []:
+                text = word.word.strip()
+                if text:
+                    words.append({"start": word.start, "end": word.end, "word": text})
+        return words
+    
+    def transcribe_array(self, audio: np.ndarray, language: str = "id") -> List[Dict]:
+        """
+        Transcribe already decoded audio
+        
+        Args:
+            audio: float32 samples in [-1, 1], mono, 16kHz
+            language: Language code (default: "id" for Bahasa Indonesia)
             
+        Returns:
+            A list of segment dictionaries with start, end, and text
+        """
+        if len(audio) < MIN_TRANSCRIBE_SAMPLES:
+            print(f"⚠️ Audio too short ({len(audio)} samples), skipping")
+            return []
+        
+        try:
+            print(f"🎤 Transcribing {len(audio) / SAMPLE_RATE:.1f}s of audio (language: {language})...")
+            return self._run_whisper(audio, language)
         except Exception as e:
-            print(f"❌ PyAV decode error: {e}")
+            print(f"❌ Transcription error: {e}")
             import traceback
             traceback.print_exc()
-            raise
-
-    def transcribe_buffer(self, buffer_data: bytes, language: str = "id") -> List[Dict]:
+            return []
+    
+    def transcribe_batch(self, audios: List[np.ndarray], language: str = "id") -> List[List[Dict]]:
         """
-        Transcribe audio buffer directly
+        Transcribe several buffers (e.g. from different sessions) in one batched pass
+        
+        The buffers are laid end to end, each as its own clip, and decoded as
+        one batch by faster-whisper's BatchedInferencePipeline; segments are
+        routed back to the buffer they came from.
+        
+        Args:
+            audios: float32 16kHz arrays, each at most WHISPER_CHUNK_SECONDS long
+            language: Language code shared by the whole batch
+            
+        Returns:
+            One list of segment dicts (times relative to its own buffer) per input
+        """
+        clip_samples = int(BATCH_CLIP_SECONDS * SAMPLE_RATE)
+        padded, clips, offsets = [], [], []
+        position = 0
+        for audio in audios:
+            if len(audio) > WHISPER_CHUNK_SECONDS * SAMPLE_RATE:
+                raise ValueError(f"Buffer longer than {WHISPER_CHUNK_SECONDS}s cannot be batched")
+            length = max(len(audio), clip_samples)
+            padded.append(np.pad(audio.astype(np.float32, copy=False), (0, length - len(audio))))
+            clips.append({"start": position / SAMPLE_RATE, "end": (position + length) / SAMPLE_RATE})
+            offsets.append(position / SAMPLE_RATE)
+            position += length
+        
+        segments, info = self.batched_pipeline.transcribe(
+            np.concatenate(padded),
+            language=language,
+            beam_size=5,
+            batch_size=len(audios),
+            vad_filter=False,
+            clip_timestamps=clips,
+            without_timestamps=False
+        )
+        
+        results: List[List[Dict]] = [[] for _ in audios]
+        for segment in segments:
+            text = segment.text.strip()
+            # Clip i covers [offsets[i], offsets[i + 1])
+            index = max(0, np.searchsorted(offsets, segment.start + 0.01, side="right") - 1)
+            start = segment.start - offsets[index]
+            duration = len(audios[index]) / SAMPLE_RATE
+            if not text or start >= duration:
+                continue  # decoded from the zero padding
+            results[index].append({
+                "start": start,
+                "end": min(segment.end - offsets[index], duration),
+                "text": text
+            })
+        
+        print(f"✅ Batch transcribed: {len(audios)} buffers → {sum(len(r) for r in results)} segments")
+        return results
+    
+    def transcribe_buffer_via_ffmpeg(self, buffer_data: bytes, language: str = "id") -> List[Dict]:
+        """
+        Transcribe audio buffer through temp files and ffmpeg (fallback path)
         
         Args:
             buffer_data: Raw audio bytes (WebM, WAV, or raw PCM Int16)
@@ -240,7 +491,7 @@ class RealtimeTranscriber:
                 with open(temp_wav_path, 'wb') as f:
                     f.write(buffer_data)
                     
-            elif buffer_data[:4] == b'\x1aE\xdf\xa3':  # EBML WebM header
+            elif buffer_data[:4] == WEBM_MAGIC:
                 print("🎵 Detected WebM format (EBML header)")
                 # Попробуем WebM обработку
                 temp_webm = tempfile.mktemp(suffix='.webm')
@@ -286,35 +537,18 @@ class RealtimeTranscriber:
             
             if wav_size < 4000:
                 print(f"⚠️ WAV too small ({wav_size} bytes), skipping")
-                return ""
+                return []
             
             # Transcribe
             print(f"🎤 Transcribing {wav_size} bytes (language: {language})...")
             
-            segments, info = self.model.transcribe(
-                temp_wav_path,
-                language=language,
-                vad_filter=True,
-                beam_size=5
-            )
-            
-            result_segments = []
-            for segment in segments:
-                result_segments.append({
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip()
-                })
-            
-            print(f"✅ Transcribed: {len(result_segments)} segments")
-            
-            return result_segments
+            return self._run_whisper(temp_wav_path, language)
             
         except Exception as e:
             print(f"❌ Transcription error: {e}")
             import traceback
             traceback.print_exc()
-            return ""
+            return []
             
         finally:
             if temp_wav_path and os.path.exists(temp_wav_path):
@@ -332,7 +566,7 @@ def get_transcriber() -> RealtimeTranscriber:
     """Get or create global transcriber instance"""
     global _transcriber
     if _transcriber is None:
-        _transcriber = RealtimeTranscriber(model_size="base")
+        _transcriber = RealtimeTranscriber(model_size=os.getenv("WHISPER_MODEL_SIZE", "base"))
     return _transcriber
 
 
@@ -350,3 +584,16 @@ def transcribe_audio_buffer(buffer_data: bytes, language: str = "id") -> List[Di
     transcriber = get_transcriber()
     return transcriber.transcribe_buffer(buffer_data, language=language)
 
+
+def transcribe_audio_array(audio: np.ndarray, language: str = "id") -> List[Dict]:
+    """
+    Convenience function to transcribe decoded audio (e.g. from the streaming decoder)
+    
+    Args:
+        audio: float32 samples in [-1, 1], mono, 16kHz
+        language: Language code (default: "id" for Bahasa Indonesia)
+        
+    Returns:
+        A list of segment dictionaries with start, end, and text
+    """
+    return get_transcriber().transcribe_array(audio, language=language)
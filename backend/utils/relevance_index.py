@@ -0,0 +1,138 @@
+"""
+Lexical relevance index over checklist items
+BM25 over each item's content + extended_description, used to skip LLM
+checks for items the new transcript does not even talk about
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+
+# Filler words (Bahasa Indonesia + English) that carry no topical signal
+STOPWORDS = {
+    # Bahasa Indonesia
+    "yang", "dan", "di", "ke", "dari", "untuk", "ini", "itu", "ya", "yaa", "yah",
+    "dengan", "akan", "ada", "juga", "atau", "jadi", "kita", "kami", "saya", "aku",
+    "kamu", "dia", "nya", "nih", "sih", "dong", "kok", "deh", "lah", "kan", "pun",
+    "sudah", "udah", "belum", "bisa", "mau", "oke", "ok", "baik", "nanti", "saat",
+    "sama", "kalau", "kalo", "karena", "agar", "biar", "seperti", "dalam", "pada",
+    "apa", "apakah", "bagaimana", "gimana", "tidak", "gak", "nggak", "enggak",
+    # English
+    "the", "a", "an", "and", "or", "of", "to", "in", "on", "for", "with", "is",
+    "are", "be", "this", "that", "it", "as", "at", "by", "if", "not", "should",
+    "would", "such", "like", "ai", "item", "look", "only", "you", "i", "we",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase content tokens
+
+    Args:
+        text: Transcript or item text (Bahasa Indonesia / English)
+
+    Returns:
+        Tokens without stopwords and single characters
+    """
+    # Item content stores line breaks as literal "\n"
+    text = text.replace("\\n", " ").lower()
+    return [
+        token for token in TOKEN_PATTERN.findall(text)
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+class ChecklistRelevanceIndex:
+    """BM25 index with one document per checklist item"""
+
+    def __init__(self, call_structure: List[Dict], k1: float = 1.2, b: float = 0.75, min_score: float = None):
+        """
+        Build the index (done once per call structure)
+
+        Args:
+            call_structure: Stages with their items
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+            min_score: Score an item needs to be sent to the LLM (<= 0 disables filtering)
+        """
+        self.k1 = k1
+        self.b = b
+        self.min_score = min_score if min_score is not None else float(
+            os.getenv("CHECKLIST_RELEVANCE_MIN_SCORE", "2.0")
+        )
+
+        # item_id → Counter of term frequencies, item_id → document length
+        self.term_freqs: Dict[str, Counter] = {}
+        self.doc_lengths: Dict[str, int] = {}
+
+        for stage in call_structure:
+            for item in stage['items']:
+                tokens = tokenize(f"{item['content']} {item.get('extended_description', '')}")
+                self.term_freqs[item['id']] = Counter(tokens)
+                self.doc_lengths[item['id']] = len(tokens)
+
+        doc_count = len(self.term_freqs)
+        self.avg_doc_length = (sum(self.doc_lengths.values()) / doc_count) if doc_count else 0.0
+
+        # Term → inverse document frequency (BM25+ style, never negative)
+        doc_freqs: Counter = Counter()
+        for freqs in self.term_freqs.values():
+            doc_freqs.update(freqs.keys())
+        self.idf: Dict[str, float] = {
+            term: math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for term, df in doc_freqs.items()
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.min_score > 0 and bool(self.term_freqs)
+
+    def score(self, text: str, item_ids: List[str] = None) -> Dict[str, float]:
+        """
+        Score transcript text against checklist items
+
+        Args:
+            text: Transcript text (usually the delta since the item was last checked)
+            item_ids: Items to score (default: all indexed items)
+
+        Returns:
+            item_id → BM25 score (higher = more on-topic)
+        """
+        # Unique terms only: a repeated filler phrase should not inflate the score
+        query_terms = [term for term in set(tokenize(text)) if term in self.idf]
+        item_ids = item_ids if item_ids is not None else list(self.term_freqs.keys())
+
+        scores = {}
+        for item_id in item_ids:
+            freqs = self.term_freqs.get(item_id)
+            if freqs is None:
+                # Item not in the index (structure changed) - never filter it out
+                scores[item_id] = float("inf")
+                continue
+
+            length_norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[item_id] / (self.avg_doc_length or 1))
+            total = 0.0
+            for term in query_terms:
+                tf = freqs.get(term, 0)
+                if tf:
+                    total += self.idf[term] * tf * (self.k1 + 1) / (tf + length_norm)
+            scores[item_id] = total
+
+        return scores
+
+    def is_relevant(self, item_id: str, text: str) -> Tuple[bool, float]:
+        """
+        Check if text is on-topic enough for an item to be worth an LLM call
+
+        Returns:
+            (relevant, score)
+        """
+        if not self.enabled:
+            return True, 0.0
+        item_score = self.score(text, [item_id])[item_id]
+        return item_score >= self.min_score, item_score
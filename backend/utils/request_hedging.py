@@ -0,0 +1,137 @@
+"""
+Hedged LLM requests for latency-critical call types
+Tracks a rolling latency window per call type; when a request is slower
+than the rolling p90, the analyzer fires a duplicate and takes whichever
+answer arrives first
+"""
+
+import os
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Set
+
+
+def _percentile(samples, q: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+    return ordered[index]
+
+
+class HedgingPolicy:
+    """Rolling latency percentiles plus hedge / waste counters per call type"""
+
+    def __init__(
+        self,
+        hedged_call_types: Set[str],
+        percentile: float = 0.9,
+        window: int = 100,
+        min_samples: int = 10,
+        min_delay_seconds: float = 0.2
+    ):
+        """
+        Initialize policy
+
+        Args:
+            hedged_call_types: Call types that may be hedged (e.g. {"stage"}); empty disables hedging
+            percentile: Latency percentile after which the duplicate is fired
+            window: Latency samples kept per call type
+            min_samples: Samples needed before hedging starts (no hedging on a cold window)
+            min_delay_seconds: Never hedge earlier than this
+        """
+        self.hedged_call_types = hedged_call_types
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay_seconds = min_delay_seconds
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _counters_for(self, call_type: str) -> Dict[str, int]:
+        return self._counters.setdefault(call_type, {
+            "requests": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "wasted_requests": 0
+        })
+
+    def record_latency(self, call_type: str, seconds: float):
+        """Add one logical request's latency (until success, failure or cancellation) to the rolling window"""
+        with self._lock:
+            samples = self._latencies.setdefault(call_type, deque(maxlen=self.window))
+            samples.append(seconds)
+
+    def hedge_delay(self, call_type: str) -> Optional[float]:
+        """
+        How long to wait before firing a duplicate request
+
+        Returns:
+            Delay in seconds, or None if this call should not be hedged
+        """
+        if call_type not in self.hedged_call_types:
+            return None
+        with self._lock:
+            samples = self._latencies.get(call_type)
+            if not samples or len(samples) < self.min_samples:
+                return None
+            return max(self.min_delay_seconds, _percentile(samples, self.percentile))
+
+    def record_request(self, call_type: str):
+        """A logical request was made (hedged or not)"""
+        with self._lock:
+            self._counters_for(call_type)["requests"] += 1
+
+    def record_hedge(self, call_type: str, hedge_won: bool):
+        """
+        A duplicate request was fired; one of the two answers was thrown away
+
+        Args:
+            hedge_won: True if the duplicate answered first
+        """
+        with self._lock:
+            counters = self._counters_for(call_type)
+            counters["hedges"] += 1
+            counters["wasted_requests"] += 1
+            if hedge_won:
+                counters["hedge_wins"] += 1
+
+    def stats(self) -> Dict:
+        """Latency percentiles and hedge counters for /health"""
+        with self._lock:
+            by_call_type = {}
+            for call_type in set(self._latencies) | set(self._counters):
+                samples = list(self._latencies.get(call_type, []))
+                counters = dict(self._counters_for(call_type))
+                by_call_type[call_type] = {
+                    **counters,
+                    "hedge_rate": round(counters["hedges"] / counters["requests"], 3) if counters["requests"] else 0.0,
+                    "latency_samples": len(samples),
+                    "latency_p50_ms": round(_percentile(samples, 0.5) * 1000) if samples else None,
+                    "latency_p90_ms": round(_percentile(samples, 0.9) * 1000) if samples else None
+                }
+            return {
+                "hedged_call_types": sorted(self.hedged_call_types),
+                "percentile": self.percentile,
+                "by_call_type": by_call_type
+            }
+
+
+# Global instance
+_hedging_policy: Optional[HedgingPolicy] = None
+
+
+def get_hedging_policy() -> HedgingPolicy:
+    """Get or create the shared hedging policy"""
+    global _hedging_policy
+    if _hedging_policy is None:
+        call_types = os.getenv("LLM_HEDGE_CALL_TYPES", "")
+        _hedging_policy = HedgingPolicy(
+            hedged_call_types={t.strip() for t in call_types.split(",") if t.strip()},
+            percentile=float(os.getenv("LLM_HEDGE_PERCENTILE", "0.9")),
+            window=int(os.getenv("LLM_HEDGE_WINDOW", "100")),
+            min_samples=int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "10")),
+            min_delay_seconds=float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "0.2"))
+        )
+    return _hedging_policy
@@ -0,0 +1,77 @@
+"""
+Single-flight coalescing of identical in-flight async calls
+The first caller for a key starts the work; callers arriving while it is
+still running await the same task instead of starting their own
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class _Flight:
+    """One running call and how many callers are waiting on it"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Per-key deduplication of concurrent coroutine calls (one event loop)
+
+    The shared task is shielded from its callers: a caller that is
+    cancelled (e.g. by a cycle deadline) stops waiting, but the call keeps
+    running for the others. It is only cancelled when its last waiter is.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._counters = {
+            "leaders": 0,    # calls that did the work
+            "coalesced": 0   # calls that awaited a leader instead
+        }
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run `factory()` unless an identical call is already in flight
+
+        Args:
+            key: Identity of the call (e.g. the prompt fingerprint)
+            factory: Zero-argument function returning the coroutine to run
+
+        Returns:
+            (result, shared) - shared is True if another caller's result was reused
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _task: self._forget(key, flight))
+            self._counters["leaders"] += 1
+        else:
+            self._counters["coalesced"] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), shared
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> Dict:
+        """Leader / coalesced counters and calls currently in flight"""
+        total = self._counters["leaders"] + self._counters["coalesced"]
+        return {
+            **self._counters,
+            "in_flight": len(self._flights),
+            "coalesced_ratio": round(self._counters["coalesced"] / total, 3) if total else 0.0
+        }
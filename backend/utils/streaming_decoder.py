@@ -0,0 +1,186 @@
+"""
+Persistent streaming WebM/Opus decoder for one /ingest session
+MediaRecorder only sends the EBML header in its first chunk, so buffers cut
+out of the stream later are not valid WebM files on their own. This decoder
+keeps one PyAV demuxer/decoder open for the whole session, is fed every
+chunk as it arrives, and accumulates a continuous 16kHz float32 PCM stream
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import av
+    HAS_PYAV = True
+except ImportError:
+    HAS_PYAV = False
+
+SAMPLE_RATE = 16000
+
+# Matroska Cluster element ID: media data starts here, everything before is the init segment
+WEBM_CLUSTER_ID = b'\x1fC\xb6u'
+
+
+def webm_init_segment(first_chunk: bytes) -> bytes:
+    """
+    The EBML header, Segment info and Tracks of a MediaRecorder stream
+    
+    Prepending it to chunks cut from later in the stream makes them a WebM
+    file a demuxer can open (it resyncs at the next Cluster).
+    
+    Args:
+        first_chunk: The session's first chunk (starts with the EBML header)
+        
+    Returns:
+        Bytes before the first Cluster (the whole chunk if it holds no Cluster)
+    """
+    cluster_at = first_chunk.find(WEBM_CLUSTER_ID)
+    return first_chunk[:cluster_at] if cluster_at > 0 else first_chunk
+
+
+class _ChunkPipe:
+    """Non-seekable file-like object: writes come from the event loop, blocking reads from the decoder thread"""
+
+    def __init__(self):
+        self._chunks: Deque[bytes] = deque()
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def write(self, data: bytes):
+        with self._cond:
+            self._chunks.append(data)
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def read(self, size: int = -1) -> bytes:
+        """Block until data is available; b"" only once closed and drained (EOF)"""
+        with self._cond:
+            while not self._chunks and not self._closed:
+                self._cond.wait()
+            if not self._chunks:
+                return b""
+            data = self._chunks.popleft()
+            if 0 < size < len(data):
+                self._chunks.appendleft(data[size:])
+                data = data[:size]
+            return data
+
+
+class StreamingWebMDecoder:
+    """Long-lived PyAV demuxer + Opus decoder fed chunk by chunk"""
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE):
+        """
+        Initialize decoder (the decoder thread starts with the first chunk)
+
+        Args:
+            sample_rate: Output sample rate (mono float32)
+        """
+        if not HAS_PYAV:
+            raise RuntimeError("PyAV not installed")
+        self.sample_rate = sample_rate
+
+        self._pipe = _ChunkPipe()
+        self._thread: Optional[threading.Thread] = None
+        self._pcm: List[np.ndarray] = []
+        self._pcm_samples = 0
+        self._lock = threading.Lock()
+
+        self.error: Optional[str] = None
+        self.bytes_fed = 0
+        self.packets_decoded = 0
+        self.packets_skipped = 0
+        self.samples_decoded = 0
+
+    @property
+    def healthy(self) -> bool:
+        """False once the demuxer gave up (caller should fall back to per-buffer decoding)"""
+        return self.error is None
+
+    def feed(self, chunk: bytes):
+        """Hand the next MediaRecorder chunk to the decoder thread (non-blocking)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="webm-decoder", daemon=True)
+            self._thread.start()
+        self.bytes_fed += len(chunk)
+        self._pipe.write(chunk)
+
+    def _run(self):
+        """Decoder thread: demux and decode until the pipe is closed"""
+        container = None
+        try:
+            container = av.open(self._pipe, format="webm")
+            audio_stream = next((s for s in container.streams if s.type == 'audio'), None)
+            if audio_stream is None:
+                raise RuntimeError("No audio stream found in WebM")
+            print(f"📻 Streaming decoder: {audio_stream.codec_name}, "
+                  f"{audio_stream.sample_rate}Hz, {audio_stream.channels}ch")
+
+            resampler = av.AudioResampler(format='flt', layout='mono', rate=self.sample_rate)
+            for packet in container.demux(audio_stream):
+                try:
+                    frames = packet.decode()
+                except av.error.InvalidDataError:
+                    # One damaged packet must not end the session's stream
+                    self.packets_skipped += 1
+                    continue
+                self.packets_decoded += 1
+                for frame in frames:
+                    frame.pts = None
+                    for resampled in resampler.resample(frame):
+                        self._append(resampled.to_ndarray().reshape(-1))
+            for resampled in resampler.resample(None):
+                self._append(resampled.to_ndarray().reshape(-1))
+        except Exception as e:
+            self.error = str(e)
+            print(f"❌ Streaming decoder stopped: {e}")
+        finally:
+            if container is not None:
+                container.close()
+
+    def _append(self, samples: np.ndarray):
+        with self._lock:
+            self._pcm.append(samples.astype(np.float32, copy=False))
+            self._pcm_samples += len(samples)
+            self.samples_decoded += len(samples)
+
+    def available_seconds(self) -> float:
+        """Decoded audio not yet taken by read_pcm"""
+        with self._lock:
+            return self._pcm_samples / self.sample_rate
+
+    def read_pcm(self) -> np.ndarray:
+        """
+        Take everything decoded since the previous call
+
+        Returns:
+            float32 samples in [-1, 1], mono, at sample_rate
+        """
+        with self._lock:
+            chunks, self._pcm, self._pcm_samples = self._pcm, [], 0
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(chunks)
+
+    def close(self, timeout: float = 2.0):
+        """Signal end of stream and wait briefly for the decoder thread"""
+        self._pipe.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict:
+        """Decoder counters for logs"""
+        return {
+            "bytes_fed": self.bytes_fed,
+            "packets_decoded": self.packets_decoded,
+            "packets_skipped": self.packets_skipped,
+            "seconds_decoded": round(self.samples_decoded / self.sample_rate, 2),
+            "error": self.error
+        }
@@ -0,0 +1,132 @@
+"""
+Incremental JSON parser for streamed LLM responses
+Emits top-level fields and elements of top-level arrays as soon as they are
+complete, so callers can act on e.g. `stage_id` or one item verdict of a
+batched response before the whole completion has arrived
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+# Event kinds
+FIELD = "field"  # (FIELD, key, value) - a top-level member is complete
+ITEM = "item"    # (ITEM, key, element) - an object inside a top-level array member is complete
+
+
+class IncrementalJSONParser:
+    """Character-level scanner over a growing JSON object (markdown fences tolerated)"""
+
+    def __init__(self):
+        self.buffer = ""
+        self.position = 0
+        self.started = False  # saw the opening '{'
+        self.finished = False
+
+        self.stack: List[str] = []
+        self.in_string = False
+        self.escaped = False
+
+        self.current_key: Optional[str] = None
+        self.key_start: Optional[int] = None
+        self.value_start: Optional[int] = None
+        self.element_start: Optional[int] = None
+
+        # Completed top-level members and array elements seen so far
+        self.fields: Dict[str, Any] = {}
+        self.items: Dict[str, List[Any]] = {}
+
+    def feed(self, chunk: str) -> List[Tuple[str, str, Any]]:
+        """
+        Consume the next piece of streamed text
+
+        Args:
+            chunk: Newly received content
+
+        Returns:
+            Events completed by this chunk, in order
+        """
+        self.buffer += chunk
+        events = []
+
+        while self.position < len(self.buffer) and not self.finished:
+            i = self.position
+            c = self.buffer[i]
+            self.position += 1
+
+            if not self.started:
+                # Skip anything before the object (```json fences, prose)
+                if c == "{":
+                    self.started = True
+                    self.stack.append("{")
+                continue
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif c == "\\":
+                    self.escaped = True
+                elif c == '"':
+                    self.in_string = False
+                    if self.key_start is not None:
+                        self.current_key = json.loads(self.buffer[self.key_start:i + 1])
+                        self.key_start = None
+                continue
+
+            depth = len(self.stack)
+            if c == '"':
+                self.in_string = True
+                if depth == 1 and self.value_start is None:
+                    self.key_start = i
+            elif c == ":" and depth == 1:
+                self.value_start = i + 1
+            elif c in "{[":
+                self.stack.append(c)
+                if c == "{" and depth == 2 and self.stack[1] == "[":
+                    self.element_start = i
+            elif c in "}]":
+                self.stack.pop()
+                depth = len(self.stack)
+                if depth == 0:
+                    # End of the top-level object: flush a trailing scalar member
+                    events.extend(self._complete_field(i))
+                    self.finished = True
+                elif depth == 2 and self.stack[1] == "[" and self.element_start is not None:
+                    element = self._loads(self.buffer[self.element_start:i + 1])
+                    self.element_start = None
+                    if element is not None and self.current_key is not None:
+                        self.items.setdefault(self.current_key, []).append(element)
+                        events.append((ITEM, self.current_key, element))
+                elif depth == 1:
+                    # Container value closed
+                    events.extend(self._complete_field(i + 1))
+            elif c == "," and depth == 1:
+                events.extend(self._complete_field(i))
+
+        return events
+
+    def _complete_field(self, end: int) -> List[Tuple[str, str, Any]]:
+        """Finish the current top-level member whose value ends at `end`"""
+        if self.value_start is None or self.current_key is None:
+            return []
+        raw = self.buffer[self.value_start:end].strip()
+        key = self.current_key
+        self.value_start = None
+        self.current_key = None
+        value = self._loads(raw)
+        if value is None and raw != "null":
+            return []
+        self.fields[key] = value
+        return [(FIELD, key, value)]
+
+    @staticmethod
+    def _loads(text: str) -> Any:
+        try:
+            return json.loads(text.strip())
+        except json.JSONDecodeError:
+            return None
+
+    def partial(self) -> Dict[str, Any]:
+        """Everything complete so far as a dict (arrays hold their completed elements)"""
+        result = {key: list(elements) for key, elements in self.items.items()}
+        result.update(self.fields)
+        return result
@@ -0,0 +1,229 @@
+"""
+Sliding-window streaming transcription with local-agreement stitching
+Re-transcribes an overlapping window of the session's PCM every short hop
+and commits a word only once two consecutive hypotheses agree on it
+(LocalAgreement-2), so committed text is stable and words at window
+boundaries are not cut
+"""
+
+import os
+import re
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# Seconds of new audio between two window transcriptions
+STREAMING_HOP_SECONDS = float(os.getenv("STREAMING_HOP_SECONDS", "1.5"))
+# The window is trimmed back to the last committed word once it grows past this
+STREAMING_WINDOW_SECONDS = float(os.getenv("STREAMING_WINDOW_SECONDS", "15"))
+# Committed words passed to Whisper as the prompt for the next window
+STREAMING_PROMPT_WORDS = 40
+
+
+def normalize_word(word: str) -> str:
+    """Comparison key for a word (case and punctuation insensitive)"""
+    return re.sub(r"[^\w]", "", word.lower())
+
+
+class LocalAgreementStitcher:
+    """
+    Commits the longest common prefix of consecutive hypotheses
+
+    Words are {start, end, word} dicts on the absolute stream timeline.
+    """
+
+    def __init__(self, max_ngram: int = 5):
+        """
+        Args:
+            max_ngram: Longest committed tail repeated at a hypothesis start that is dropped
+        """
+        self.max_ngram = max_ngram
+        self.committed: List[Dict] = []
+        self.last_committed_end = 0.0
+        self._previous: List[Dict] = []  # uncommitted tail of the previous hypothesis
+
+    def insert(self, words: List[Dict]) -> List[Dict]:
+        """
+        Add the newest hypothesis for the current window
+
+        Args:
+            words: Word dicts of the whole window, in order
+
+        Returns:
+            Words newly committed by this hypothesis
+        """
+        # Only what follows the committed text can still change
+        new = [w for w in words if w["start"] > self.last_committed_end - 0.1]
+        new = self._drop_repeated_tail(new)
+
+        commit = []
+        while new and self._previous and normalize_word(new[0]["word"]) == normalize_word(self._previous[0]["word"]):
+            commit.append(new.pop(0))
+            self._previous.pop(0)
+        self._previous = new
+
+        if commit:
+            self.committed.extend(commit)
+            self.last_committed_end = commit[-1]["end"]
+        return commit
+
+    def _drop_repeated_tail(self, new: List[Dict]) -> List[Dict]:
+        """Remove an n-gram at the hypothesis start that repeats the end of the committed text"""
+        if not new or not self.committed or abs(new[0]["start"] - self.last_committed_end) > 1.0:
+            return new
+        for n in range(min(self.max_ngram, len(self.committed), len(new)), 0, -1):
+            tail = [normalize_word(w["word"]) for w in self.committed[-n:]]
+            head = [normalize_word(w["word"]) for w in new[:n]]
+            if tail == head:
+                return new[n:]
+        return new
+
+    def pending(self) -> List[Dict]:
+        """Latest uncommitted words (not yet confirmed by a second hypothesis)"""
+        return list(self._previous)
+
+    def flush(self) -> List[Dict]:
+        """Commit whatever is pending (end of stream)"""
+        commit, self._previous = self._previous, []
+        if commit:
+            self.committed.extend(commit)
+            self.last_committed_end = commit[-1]["end"]
+        return commit
+
+    def reset_hypothesis(self):
+        """Forget the pending hypothesis (its audio was trimmed away)"""
+        self._previous = []
+
+
+class StreamingTranscriber:
+    """Sliding audio window over one session's PCM stream"""
+
+    def __init__(
+        self,
+        transcriber,
+        language: str = "id",
+        hop_seconds: float = STREAMING_HOP_SECONDS,
+        window_seconds: float = STREAMING_WINDOW_SECONDS
+    ):
+        """
+        Initialize streaming transcription
+
+        Args:
+            transcriber: RealtimeTranscriber (provides transcribe_words)
+            language: Language code
+            hop_seconds: New audio needed before the window is transcribed again
+            window_seconds: Window length that triggers trimming
+        """
+        self.transcriber = transcriber
+        self.language = language
+        self.hop_seconds = hop_seconds
+        self.window_seconds = window_seconds
+
+        self.stitcher = LocalAgreementStitcher()
+        self.audio = np.zeros(0, dtype=np.float32)
+        self.audio_offset = 0.0  # stream time of self.audio[0]
+        self._unprocessed_samples = 0
+
+    @property
+    def stream_seconds(self) -> float:
+        """Stream time at the end of the received audio"""
+        return self.audio_offset + len(self.audio) / SAMPLE_RATE
+
+    def append(self, pcm: np.ndarray):
+        """Add decoded float32 16kHz samples"""
+        if len(pcm):
+            self.audio = np.concatenate([self.audio, pcm])
+            self._unprocessed_samples += len(pcm)
+
+    def hop_ready(self) -> bool:
+        """True once a hop's worth of new audio arrived since the last step"""
+        return self._unprocessed_samples >= self.hop_seconds * SAMPLE_RATE
+
+    def step(self) -> List[Dict]:
+        """
+        Transcribe the current window and commit the words two hypotheses agree on
+
+        Returns:
+            Newly committed text as segment dicts ({start, end, text}; empty if none)
+        """
+        audio, prompt = self.window()
+        return self.commit(self.transcriber.transcribe_words(audio, language=self.language, initial_prompt=prompt))
+
+    def window(self) -> Tuple[np.ndarray, str]:
+        """
+        Audio and prompt for the next window transcription (for transcribing elsewhere, e.g. a worker pool)
+
+        Returns:
+            (window samples, committed text to prompt Whisper with)
+        """
+        self._unprocessed_samples = 0
+        prompt = " ".join(w["word"] for w in self.stitcher.committed[-STREAMING_PROMPT_WORDS:])
+        return self.audio, prompt
+
+    def commit(self, words: List[Dict]) -> List[Dict]:
+        """
+        Stitch the words transcribed from window() into the committed text
+
+        Args:
+            words: Word dicts with times relative to the window start
+
+        Returns:
+            Newly committed text as segment dicts ({start, end, text}; empty if none)
+        """
+        for word in words:
+            word["start"] += self.audio_offset
+            word["end"] += self.audio_offset
+
+        committed = self.stitcher.insert(words)
+        self._trim()
+        return self._as_segments(committed)
+
+    def finish(self) -> List[Dict]:
+        """Final step plus a flush of the pending hypothesis (end of session)"""
+        segments = self.step() if len(self.audio) else []
+        return segments + self.flush()
+    
+    def flush(self) -> List[Dict]:
+        """
+        Commit the pending hypothesis without another confirmation (end of session)
+        
+        finish() when the final window was transcribed elsewhere (window() / commit())
+        
+        Returns:
+            Flushed text as segment dicts ({start, end, text}; empty if none)
+        """
+        return self._as_segments(self.stitcher.flush())
+
+    def _trim(self):
+        """Drop audio before the last committed word once the window is too long"""
+        if len(self.audio) / SAMPLE_RATE <= self.window_seconds:
+            return
+        cut_at = self.stitcher.last_committed_end
+        if cut_at <= self.audio_offset:
+            # Nothing committed for a whole window (noise, music) - keep the newest half
+            cut_at = self.stream_seconds - self.window_seconds / 2
+            self.stitcher.reset_hypothesis()
+        cut_samples = int((cut_at - self.audio_offset) * SAMPLE_RATE)
+        self.audio = self.audio[cut_samples:]
+        self.audio_offset += cut_samples / SAMPLE_RATE
+
+    @staticmethod
+    def _as_segments(words: List[Dict]) -> List[Dict]:
+        if not words:
+            return []
+        return [{
+            "start": words[0]["start"],
+            "end": words[-1]["end"],
+            "text": " ".join(w["word"] for w in words)
+        }]
+
+    def stats(self) -> Dict:
+        """Window state for logs"""
+        return {
+            "window_seconds": round(len(self.audio) / SAMPLE_RATE, 2),
+            "stream_seconds": round(self.stream_seconds, 2),
+            "committed_words": len(self.stitcher.committed),
+            "pending_words": len(self.stitcher.pending())
+        }
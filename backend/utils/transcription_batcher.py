@@ -0,0 +1,234 @@
+"""
+Cross-session micro-batching in front of the Whisper transcriber
+Buffers that become ready in several live sessions within a short window
+are transcribed together in one batched pass (RealtimeTranscriber.
+transcribe_batch) and the segments are routed back to each session. A
+buffer that arrives alone is transcribed one-at-a-time as before
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import numpy as np
+
+from utils.realtime_transcriber import (
+    MIN_TRANSCRIBE_SAMPLES,
+    SAMPLE_RATE,
+    WHISPER_CHUNK_SECONDS,
+    RealtimeTranscriber
+)
+
+
+class _BatchItem:
+    """One session's buffer waiting for a batch"""
+
+    def __init__(self, session_id: str, audio: np.ndarray, language: str, future: asyncio.Future):
+        self.session_id = session_id
+        self.audio = audio
+        self.language = language
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class _Throughput:
+    """Audio seconds transcribed per compute second for one mode"""
+
+    def __init__(self):
+        self.calls = 0
+        self.buffers = 0
+        self.audio_seconds = 0.0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+
+    def add(self, buffers: int, audio_seconds: float, wall_seconds: float, cpu_seconds: float):
+        self.calls += 1
+        self.buffers += buffers
+        self.audio_seconds += audio_seconds
+        self.wall_seconds += wall_seconds
+        self.cpu_seconds += cpu_seconds
+
+    def stats(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "buffers": self.buffers,
+            "mean_batch_size": round(self.buffers / self.calls, 2) if self.calls else 0,
+            "audio_seconds": round(self.audio_seconds, 1),
+            "audio_seconds_per_cpu_second": round(self.audio_seconds / self.cpu_seconds, 2) if self.cpu_seconds else None,
+            "audio_seconds_per_wall_second": round(self.audio_seconds / self.wall_seconds, 2) if self.wall_seconds else None
+        }
+
+
+class TranscriptionBatcher:
+    """Collects ready buffers from all sessions and runs them as Whisper batches (one event loop)"""
+
+    def __init__(self, transcriber: RealtimeTranscriber, max_batch: int = 4, window_seconds: float = 0.25):
+        """
+        Initialize batcher (the scheduler task starts with the first buffer)
+
+        Args:
+            transcriber: RealtimeTranscriber whose model runs the batches
+            max_batch: Most buffers per batch
+            window_seconds: How long the first buffer waits for others to join its batch
+        """
+        self.transcriber = transcriber
+        self.max_batch = max_batch
+        self.window_seconds = window_seconds
+
+        self._pending: Deque[_BatchItem] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.batched = _Throughput()
+        self.single = _Throughput()
+        self.failed_batches = 0
+
+    async def transcribe(self, session_id: str, audio: np.ndarray, language: str) -> List[Dict]:
+        """
+        Transcribe one session's decoded buffer, batched with other sessions' buffers
+
+        Args:
+            session_id: Session the buffer belongs to
+            audio: float32 samples in [-1, 1], mono, 16kHz
+            language: Language code
+
+        Returns:
+            A list of segment dictionaries with start, end, and text
+        """
+        if len(audio) < MIN_TRANSCRIBE_SAMPLES:
+            return []
+        if len(audio) > WHISPER_CHUNK_SECONDS * SAMPLE_RATE:
+            # Too long to share a batch (e.g. YouTube chunks)
+            return await self._run_single(audio, language)
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._schedule())
+
+        item = _BatchItem(session_id, audio, language, asyncio.get_running_loop().create_future())
+        self._pending.append(item)
+        self._wakeup.set()
+        return await item.future
+
+    async def _schedule(self):
+        """Scheduler task: form a batch, run it, repeat while buffers are waiting"""
+        while True:
+            while not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            # Hold the batch open until it is full or the oldest buffer waited a full window
+            deadline = self._pending[0].enqueued_at + self.window_seconds
+            while len(self._pending) < self.max_batch and time.monotonic() < deadline:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), deadline - time.monotonic())
+                except asyncio.TimeoutError:
+                    break
+
+            batch = self._take_batch()
+            if batch:
+                await self._run_batch(batch)
+
+    def _take_batch(self) -> List[_BatchItem]:
+        """Up to max_batch waiting buffers sharing the oldest buffer's language"""
+        language = self._pending[0].language
+        batch, rest = [], deque()
+        while self._pending:
+            item = self._pending.popleft()
+            if item.future.done():
+                continue  # caller gave up (session ended)
+            if item.language == language and len(batch) < self.max_batch:
+                batch.append(item)
+            else:
+                rest.append(item)
+        self._pending = rest
+        return batch
+
+    async def _run_batch(self, batch: List[_BatchItem]):
+        """Transcribe a batch in the default executor and resolve every caller"""
+        if len(batch) == 1:
+            item = batch[0]
+            try:
+                result = await self._run_single(item.audio, item.language)
+            except Exception as e:
+                result = e
+            self._resolve(item, result)
+            return
+
+        audios = [item.audio for item in batch]
+        print(f"📦 Batching {len(batch)} buffers from sessions {[item.session_id for item in batch]}")
+        try:
+            results, wall, cpu = await asyncio.get_event_loop().run_in_executor(
+                None, self._timed, self.transcriber.transcribe_batch, audios, batch[0].language
+            )
+            self.batched.add(len(batch), sum(len(a) for a in audios) / SAMPLE_RATE, wall, cpu)
+        except Exception as e:
+            # Don't fail every session for one bad batch - retry them one at a time
+            self.failed_batches += 1
+            print(f"⚠️ Batched transcription failed ({e}), transcribing buffers one at a time")
+            for item in batch:
+                try:
+                    result = await self._run_single(item.audio, item.language)
+                except Exception as single_error:
+                    result = single_error
+                self._resolve(item, result)
+            return
+
+        for item, result in zip(batch, results):
+            self._resolve(item, result)
+
+    async def _run_single(self, audio: np.ndarray, language: str) -> List[Dict]:
+        """One-at-a-time transcription (same path as without the batcher)"""
+        result, wall, cpu = await asyncio.get_event_loop().run_in_executor(
+            None, self._timed, self.transcriber.transcribe_array, audio, language
+        )
+        self.single.add(1, len(audio) / SAMPLE_RATE, wall, cpu)
+        return result
+
+    @staticmethod
+    def _timed(func, *args):
+        """Call func and return (result, wall seconds, process CPU seconds)"""
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        result = func(*args)
+        return result, time.perf_counter() - wall_started, time.process_time() - cpu_started
+
+    @staticmethod
+    def _resolve(item: _BatchItem, result):
+        if item.future.done():
+            return
+        if isinstance(result, Exception):
+            item.future.set_exception(result)
+        else:
+            item.future.set_result(result)
+
+    def status(self) -> Dict:
+        """Batch sizes and throughput, batched vs one-at-a-time, for /health"""
+        return {
+            "max_batch": self.max_batch,
+            "window_ms": round(self.window_seconds * 1000),
+            "waiting": len(self._pending),
+            "failed_batches": self.failed_batches,
+            "batched": self.batched.stats(),
+            "single": self.single.stats()
+        }
+
+
+# Global instance (None while batching is disabled)
+_transcription_batcher: Optional[TranscriptionBatcher] = None
+
+
+def get_transcription_batcher(transcriber: RealtimeTranscriber) -> Optional[TranscriptionBatcher]:
+    """Get or create the shared batcher; None if TRANSCRIPTION_BATCH_SIZE is 1 (no batching)"""
+    global _transcription_batcher
+    max_batch = int(os.getenv("TRANSCRIPTION_BATCH_SIZE", "1"))
+    if _transcription_batcher is None and max_batch > 1:
+        _transcription_batcher = TranscriptionBatcher(
+            transcriber,
+            max_batch=max_batch,
+            window_seconds=float(os.getenv("TRANSCRIPTION_BATCH_WINDOW_MS", "250")) / 1000
+        )
+    return _transcription_batcher
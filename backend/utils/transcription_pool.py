@@ -0,0 +1,300 @@
+"""
+Process pool of transcription workers
+Each worker process loads its own Whisper model, so concurrent sessions run
+on separate cores instead of contending for one model and the GIL. Jobs wait
+in a bounded queue in the server process and are dispatched round-robin
+across sessions, so one busy session cannot starve the others
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+
+# A pool whose workers keep dying (e.g. the model cannot load) is not respawned more often than this
+RESTART_BACKOFF_SECONDS = 30.0
+
+
+class TranscriptionQueueFullError(Exception):
+    """Raised when the pool's job queue is at capacity"""
+    pass
+
+
+# ----- Worker process side -----
+
+_worker_transcriber = None
+
+
+def _init_worker(model_size: str, cpu_threads: int):
+    """Load and warm this worker's model once, before its first job"""
+    global _worker_transcriber
+    from utils.realtime_transcriber import RealtimeTranscriber
+
+    _worker_transcriber = RealtimeTranscriber(model_size=model_size, cpu_threads=cpu_threads)
+    _worker_transcriber.warm_up()
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _worker_transcribe_buffer(buffer_data: bytes, language: str) -> List[Dict]:
+    return _worker_transcriber.transcribe_buffer(buffer_data, language=language)
+
+
+def _worker_transcribe_array(audio: np.ndarray, language: str) -> List[Dict]:
+    return _worker_transcriber.transcribe_array(audio, language=language)
+
+
+def _worker_transcribe_words(audio: np.ndarray, language: str, initial_prompt: Optional[str]) -> List[Dict]:
+    return _worker_transcriber.transcribe_words(audio, language=language, initial_prompt=initial_prompt)
+
+
+# ----- Server process side -----
+
+def _percentiles_ms(samples) -> Dict[str, int]:
+    if not samples:
+        return {"p50_ms": 0, "p90_ms": 0}
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000),
+        "p90_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))] * 1000)
+    }
+
+
+class _Job:
+    """One queued transcription request"""
+
+    def __init__(self, func: Callable, args: tuple, future: asyncio.Future):
+        self.func = func
+        self.args = args
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class TranscriptionPool:
+    """Bounded, per-session fair job queue in front of a process pool (one event loop)"""
+
+    def __init__(self, workers: int, max_queue: int = 32, model_size: str = "base",
+                 cpu_threads: int = 0, latency_window: int = 200):
+        """
+        Initialize pool (worker processes start with start())
+
+        Args:
+            workers: Worker processes (each holds one model and runs one job at a time)
+            max_queue: Jobs allowed to wait; more raise TranscriptionQueueFullError
+            model_size: Whisper model size loaded by every worker
+            cpu_threads: CTranslate2 threads per worker (0 = cores split evenly across workers)
+            latency_window: Wait/run time samples kept for percentiles
+        """
+        self.workers = workers
+        self.max_queue = max_queue
+        self.model_size = model_size
+        self.cpu_threads = cpu_threads or max(1, (os.cpu_count() or 1) // workers)
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # session id → waiting jobs; iteration order is the round-robin order
+        self._queues: "OrderedDict[str, Deque[_Job]]" = OrderedDict()
+        self._queued = 0
+        self._running = 0
+
+        self.ready = False
+        self.error: Optional[str] = None
+        self._last_restart = 0.0
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "restarts": 0,
+            "max_queue_depth": 0
+        }
+        self._wait_times: Deque[float] = deque(maxlen=latency_window)
+        self._run_times: Deque[float] = deque(maxlen=latency_window)
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn, not fork: CTranslate2 / OpenMP state must not be inherited
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.model_size, self.cpu_threads)
+        )
+    
+    async def start(self):
+        """Spawn the workers and wait until every one has loaded and warmed its model"""
+        print(f"🏭 Starting {self.workers} transcription worker(s) "
+              f"(model '{self.model_size}', {self.cpu_threads} CPU threads each)...")
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)  # A failed earlier start
+        self._executor = self._create_executor()
+        await self._wait_for_workers()
+    
+    async def _wait_for_workers(self):
+        """Start every worker of the current executor and mark the pool ready"""
+        try:
+            # One concurrent job per worker makes the executor start all of them
+            pids = await asyncio.gather(*[
+                asyncio.wrap_future(self._executor.submit(_worker_ready)) for _ in range(self.workers)
+            ])
+        except Exception as e:
+            self.error = str(e)
+            print(f"❌ Transcription workers failed to start: {e}")
+            raise
+        self.ready = True
+        self.error = None
+        print(f"✅ Transcription workers ready (pids: {sorted(set(pids))})")
+
+    def shutdown(self):
+        """Stop the workers; queued jobs are cancelled"""
+        for queue in self._queues.values():
+            for job in queue:
+                job.future.cancel()
+        self._queues.clear()
+        self._queued = 0
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, session_id: str, func: Callable, *args) -> Any:
+        """
+        Queue a job for a session and wait for its result
+
+        Raises:
+            TranscriptionQueueFullError: max_queue jobs are already waiting
+        """
+        if self._queued >= self.max_queue:
+            self._counters["rejected"] += 1
+            raise TranscriptionQueueFullError(f"Transcription queue full ({self._queued} jobs waiting)")
+
+        job = _Job(func, args, asyncio.get_running_loop().create_future())
+        self._queues.setdefault(session_id, deque()).append(job)
+        self._queued += 1
+        self._counters["submitted"] += 1
+        self._counters["max_queue_depth"] = max(self._counters["max_queue_depth"], self._queued)
+        self._dispatch()
+        return await job.future
+
+    def _dispatch(self):
+        """Hand waiting jobs to free workers, taking sessions in turn"""
+        while self._running < self.workers and self._queues:
+            session_id, queue = self._queues.popitem(last=False)
+            job = queue.popleft()
+            self._queued -= 1
+            if queue:
+                self._queues[session_id] = queue  # back of the round-robin order
+            if job.future.done():
+                continue  # caller gave up (session ended, cycle cancelled)
+
+            self._wait_times.append(time.monotonic() - job.enqueued_at)
+            executor = self._executor
+            try:
+                result = asyncio.wrap_future(executor.submit(job.func, *job.args))
+            except Exception as e:
+                self._counters["failed"] += 1
+                job.future.set_exception(e)
+                if isinstance(e, BrokenProcessPool):
+                    self._restart(executor, e)
+                continue
+            self._running += 1
+            started = time.monotonic()
+            result.add_done_callback(
+                lambda done, job=job, started=started, executor=executor: self._finish(job, done, started, executor)
+            )
+
+    def _finish(self, job: _Job, done: asyncio.Future, started: float, executor: ProcessPoolExecutor):
+        self._running -= 1
+        self._run_times.append(time.monotonic() - started)
+        if done.cancelled():
+            job.future.cancel()
+        elif done.exception() is not None:
+            self._counters["failed"] += 1
+            if isinstance(done.exception(), BrokenProcessPool):
+                self._restart(executor, done.exception())
+            if not job.future.done():
+                job.future.set_exception(done.exception())
+        else:
+            self._counters["completed"] += 1
+            if not job.future.done():
+                job.future.set_result(done.result())
+        self._dispatch()
+
+    def _restart(self, broken: ProcessPoolExecutor, error: Exception):
+        """
+        Replace an executor whose worker died (OOM, crash in CTranslate2)
+        
+        Jobs already handed to the broken executor fail with BrokenProcessPool;
+        queued jobs go to the new workers once they have loaded their models.
+        """
+        if broken is not self._executor:
+            return  # Already replaced (every job of the broken executor reports it)
+        self.ready = False
+        self.error = f"Worker process died: {error}"
+        if time.monotonic() - self._last_restart < RESTART_BACKOFF_SECONDS:
+            return  # The next job after the backoff retries
+        self._last_restart = time.monotonic()
+        self._counters["restarts"] += 1
+        print(f"❌ Transcription worker died ({error}) - restarting the worker pool")
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._create_executor()
+        asyncio.get_event_loop().create_task(self._rewarm())
+
+    async def _rewarm(self):
+        try:
+            await self._wait_for_workers()
+        except Exception:
+            pass  # Logged; /health keeps reporting the error
+
+    async def transcribe_buffer(self, session_id: str, buffer_data: bytes, language: str) -> List[Dict]:
+        """RealtimeTranscriber.transcribe_buffer in a worker"""
+        return await self.run(session_id, _worker_transcribe_buffer, buffer_data, language)
+
+    async def transcribe_array(self, session_id: str, audio: np.ndarray, language: str) -> List[Dict]:
+        """RealtimeTranscriber.transcribe_array in a worker"""
+        return await self.run(session_id, _worker_transcribe_array, audio, language)
+
+    async def transcribe_words(self, session_id: str, audio: np.ndarray, language: str,
+                               initial_prompt: Optional[str] = None) -> List[Dict]:
+        """RealtimeTranscriber.transcribe_words in a worker"""
+        return await self.run(session_id, _worker_transcribe_words, audio, language, initial_prompt)
+
+    def status(self) -> Dict:
+        """Readiness, queue depth and wait/run time percentiles for /health"""
+        return {
+            "model_size": self.model_size,
+            "ready": self.ready,
+            "error": self.error,
+            "workers": self.workers,
+            "cpu_threads_per_worker": self.cpu_threads,
+            "busy_workers": self._running,
+            "queue_depth": self._queued,
+            "queue_capacity": self.max_queue,
+            "queued_by_session": {session_id: len(queue) for session_id, queue in self._queues.items()},
+            **self._counters,
+            "wait_time": _percentiles_ms(self._wait_times),
+            "run_time": _percentiles_ms(self._run_times)
+        }
+
+
+# Global instance (None while the pool is disabled)
+_transcription_pool: Optional[TranscriptionPool] = None
+
+
+def get_transcription_pool() -> Optional[TranscriptionPool]:
+    """Get or create the shared pool; None if TRANSCRIPTION_WORKERS is 0 (in-process transcription)"""
+    global _transcription_pool
+    workers = int(os.getenv("TRANSCRIPTION_WORKERS", "0"))
+    if _transcription_pool is None and workers > 0:
+        _transcription_pool = TranscriptionPool(
+            workers=workers,
+            max_queue=int(os.getenv("TRANSCRIPTION_MAX_QUEUE", "32")),
+            model_size=os.getenv("WHISPER_MODEL_SIZE", "base"),
+            cpu_threads=int(os.getenv("TRANSCRIPTION_CPU_THREADS", "0"))
+        )
+    return _transcription_pool
@@ -0,0 +1,198 @@
+"""
+Local voice-activity gate in front of Whisper
+Measures the share of speech-like frames in a decoded buffer with NumPy
+(frame energy over an adaptive noise floor, with most of that energy in
+the speech band) so silence and hold music never reach the model. Low-speech
+buffers are carried over and merged into the next window instead of being
+transcribed on their own
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+FRAME_SECONDS = 0.03
+# A frame is speech-like only above this level, whatever the noise floor
+ABSOLUTE_FLOOR_DB = -50.0
+# ... and this far above the buffer's noise floor (10th percentile frame energy)
+NOISE_MARGIN_DB = 10.0
+# ... with at least this share of its energy between 300 and 3400 Hz
+SPEECH_BAND_RATIO = 0.5
+SPEECH_BAND_HZ = (300.0, 3400.0)
+
+
+def speech_frames(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Classify fixed-length frames as speech-like or not
+
+    Args:
+        audio: float32 samples in [-1, 1], mono
+        sample_rate: Sample rate of `audio`
+
+    Returns:
+        Boolean array, one entry per full frame
+    """
+    frame_length = int(FRAME_SECONDS * sample_rate)
+    n_frames = len(audio) // frame_length
+    if n_frames == 0:
+        return np.zeros(0, dtype=bool)
+    frames = audio[:n_frames * frame_length].reshape(n_frames, frame_length).astype(np.float32, copy=False)
+
+    energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+    noise_floor_db = np.percentile(energy_db, 10)
+    loud = energy_db > max(ABSOLUTE_FLOOR_DB, noise_floor_db + NOISE_MARGIN_DB)
+
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(frame_length), axis=1)) ** 2
+    freqs = np.fft.rfftfreq(frame_length, 1.0 / sample_rate)
+    band = (freqs >= SPEECH_BAND_HZ[0]) & (freqs <= SPEECH_BAND_HZ[1])
+    band_ratio = spectrum[:, band].sum(axis=1) / (spectrum.sum(axis=1) + 1e-10)
+
+    return loud & (band_ratio >= SPEECH_BAND_RATIO)
+
+
+def speech_ratio(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> float:
+    """Share of frames in `audio` that look like speech (0.0 - 1.0)"""
+    frames = speech_frames(audio, sample_rate)
+    return float(frames.mean()) if len(frames) else 0.0
+
+
+def _empty_counters() -> Dict:
+    return {
+        "buffers_checked": 0,
+        "buffers_passed": 0,
+        "buffers_dropped": 0,   # silence / music: never transcribed
+        "buffers_carried": 0,   # little speech: merged into the next window
+        "whisper_calls": 0,
+        "whisper_calls_skipped": 0,
+        "audio_seconds_checked": 0.0,
+        "audio_seconds_dropped": 0.0,
+        "whisper_seconds": 0.0
+    }
+
+
+def _summarize(counters: Dict) -> Dict:
+    """Counters plus skipped ratio and the estimated Whisper compute saved"""
+    passed_seconds = counters["audio_seconds_checked"] - counters["audio_seconds_dropped"]
+    # Compute per audio second as measured on the buffers that were transcribed
+    seconds_per_audio_second = counters["whisper_seconds"] / passed_seconds if passed_seconds > 0 else 0.0
+    return {
+        **{k: round(v, 1) if isinstance(v, float) else v for k, v in counters.items()},
+        "skipped_ratio": round(counters["buffers_dropped"] / counters["buffers_checked"], 3)
+        if counters["buffers_checked"] else 0.0,
+        "estimated_whisper_seconds_saved": round(counters["audio_seconds_dropped"] * seconds_per_audio_second, 1)
+    }
+
+
+# Counters summed over all sessions since startup (for /health)
+_totals = _empty_counters()
+_totals_lock = threading.Lock()
+
+
+class VoiceActivityGate:
+    """Decides per buffer whether Whisper should run, with counters for one session"""
+
+    def __init__(self, threshold: float = 0.1, min_voiced_seconds: float = 0.3, max_carry_seconds: float = 20.0):
+        """
+        Initialize gate
+
+        Args:
+            threshold: Speech ratio at or above which a buffer is transcribed right away
+            min_voiced_seconds: Less speech than this and the buffer is dropped as silence
+            max_carry_seconds: Carried-over audio is transcribed once it grows this long
+        """
+        self.threshold = threshold
+        self.min_voiced_seconds = min_voiced_seconds
+        self.max_carry_seconds = max_carry_seconds
+
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._lock = threading.Lock()
+        self.counters = _empty_counters()
+    
+    def _count(self, key: str, amount=1):
+        """Add to this session's counter and the process-wide total (caller holds self._lock)"""
+        self.counters[key] += amount
+        with _totals_lock:
+            _totals[key] += amount
+
+    def check(self, audio: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Gate a decoded buffer
+
+        Args:
+            audio: float32 samples in [-1, 1], mono, 16kHz
+
+        Returns:
+            Audio to transcribe now (carried-over audio first), or None to skip Whisper
+        """
+        ratio = speech_ratio(audio)
+        voiced_seconds = ratio * len(audio) / SAMPLE_RATE
+
+        with self._lock:
+            self._count("buffers_checked")
+            self._count("audio_seconds_checked", len(audio) / SAMPLE_RATE)
+
+            if ratio >= self.threshold:
+                self._count("buffers_passed")
+                return self._take_carry(audio)
+
+            if voiced_seconds < self.min_voiced_seconds:
+                self._count("buffers_dropped")
+                self._count("audio_seconds_dropped", len(audio) / SAMPLE_RATE)
+                print(f"🔇 VAD gate: dropped {len(audio) / SAMPLE_RATE:.1f}s (speech ratio {ratio:.0%})")
+                if len(self._carry):
+                    # The short utterance carried from before ended - transcribe it alone
+                    return self._take_carry(None)
+                self._count("whisper_calls_skipped")
+                return None
+
+            self._count("buffers_carried")
+            self._carry = np.concatenate([self._carry, audio])
+            if len(self._carry) >= self.max_carry_seconds * SAMPLE_RATE:
+                return self._take_carry(None)
+            print(f"🔉 VAD gate: carrying {len(audio) / SAMPLE_RATE:.1f}s into the next window "
+                  f"(speech ratio {ratio:.0%})")
+            self._count("whisper_calls_skipped")
+            return None
+
+    def _take_carry(self, audio: Optional[np.ndarray]) -> np.ndarray:
+        """Carried-over audio followed by `audio`; clears the carry"""
+        merged = self._carry if audio is None else np.concatenate([self._carry, audio])
+        self._carry = np.zeros(0, dtype=np.float32)
+        return merged
+
+    def record_skip(self):
+        """Record a Whisper call skipped by the caller (e.g. a silent streaming window)"""
+        with self._lock:
+            self._count("whisper_calls_skipped")
+
+    def record_whisper(self, seconds: float):
+        """Record the compute time of a transcription the gate let through"""
+        with self._lock:
+            self._count("whisper_calls")
+            self._count("whisper_seconds", seconds)
+
+    def stats(self) -> Dict:
+        """This session's counters plus the estimated Whisper compute saved"""
+        with self._lock:
+            return {**_summarize(self.counters), "threshold": self.threshold}
+
+
+def create_voice_activity_gate() -> Optional[VoiceActivityGate]:
+    """New gate for one /ingest session; None if VAD_GATE_ENABLED is false"""
+    if os.getenv("VAD_GATE_ENABLED", "true").lower() != "true":
+        return None
+    return VoiceActivityGate(
+        threshold=float(os.getenv("VAD_SPEECH_RATIO_THRESHOLD", "0.1")),
+        min_voiced_seconds=float(os.getenv("VAD_MIN_VOICED_SECONDS", "0.3")),
+        max_carry_seconds=float(os.getenv("VAD_MAX_CARRY_SECONDS", "20"))
+    )
+
+
+def voice_activity_totals() -> Dict:
+    """Gate counters summed over all sessions since startup"""
+    with _totals_lock:
+        return _summarize(dict(_totals))
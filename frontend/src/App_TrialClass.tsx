@@ -52,6 +52,7 @@ interface CoachMessage {
   stages: Stage[]
   clientCard: Record<string, string>
   transcriptPreview?: string
+  llmUsage?: Record<string, any>
   debugLog?: DebugLogEntry[]
 }
 